@@ -0,0 +1 @@
+# Benchmarks for the API client and helpers (not collected by pytest).
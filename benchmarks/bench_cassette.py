@@ -0,0 +1,162 @@
+# benchmarks/bench_cassette.py
+"""
+Record/replay cost of src.cassette.
+
+Two measurements:
+
+  workflow   --workflows runs of the booking workflow (auth, create, get,
+             update, patch, delete) through BookingHelper: live against the
+             local server while recording, then replayed in strict mode
+             against a base URL nothing listens on
+  large      a cassette of --interactions synthetic GET /booking/{id}
+             recordings: time to record and index it, time to open it for
+             replay, the cost of a lookup in random order, and the Python
+             memory replay allocates (the records themselves stay on disk)
+
+Usage:
+    python -m benchmarks.bench_cassette
+    python -m benchmarks.bench_cassette --interactions 1000000
+"""
+
+import argparse
+import logging
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from datetime import timedelta
+
+import requests
+
+from src.api_client import APIClient
+from src.cassette import Cassette
+from src.helpers.booking import BookingHelper
+from src.local_server import LocalBookerServer
+
+SAMPLE_BOOKING = {
+    "firstname": "Sally",
+    "lastname": "Brown",
+    "totalprice": 111,
+    "depositpaid": True,
+    "bookingdates": {"checkin": "2025-06-01", "checkout": "2025-06-10"},
+    "additionalneeds": "Breakfast",
+}
+UNREACHABLE = "http://127.0.0.1:9"  # Discard port: replay must not connect
+
+
+def run_workflows(base_url, cassette, workflows):
+    with APIClient(base_url=base_url, cassette=cassette) as client:
+        helper = BookingHelper(client)
+        token = client.post(
+            "auth", json={"username": "admin", "password": "password123"}
+        ).json()["token"]
+        started = time.perf_counter()
+        for _ in range(workflows):
+            booking_id = helper.create_booking(SAMPLE_BOOKING).json()["bookingid"]
+            helper.get_booking(booking_id)
+            helper.update_booking(booking_id, SAMPLE_BOOKING, token)
+            helper.partial_update_booking(booking_id, {"totalprice": 200}, token)
+            helper.delete_booking(booking_id, token)
+        return time.perf_counter() - started
+
+
+def bench_workflow(directory, workflows):
+    path = os.path.join(directory, "workflow.cassette")
+    with LocalBookerServer() as server, Cassette(path, mode="record") as cassette:
+        live = run_workflows(server.base_url, cassette, workflows)
+    with Cassette(path, strict=True) as cassette:
+        replayed = run_workflows(UNREACHABLE, cassette, workflows)
+        stats = cassette.stats
+    requests_made = workflows * 5
+    print(f"workflow: {workflows} workflows, {requests_made} requests")
+    print(f"  live + recording {live * 1000:8.1f} ms")
+    print(
+        f"  strict replay    {replayed * 1000:8.1f} ms "
+        f"({replayed / requests_made * 1e6:.0f} us per request, "
+        f"{stats.played} played, {stats.missed} missed)"
+    )
+
+
+def synthetic_interactions(count):
+    """(PreparedRequest, Response) pairs for GET /booking/1..count."""
+    for booking_id in range(1, count + 1):
+        request = requests.Request(
+            "GET", f"http://127.0.0.1/booking/{booking_id}"
+        ).prepare()
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers["Content-Type"] = "application/json"
+        response._content = (
+            b'{"firstname":"Sally","lastname":"Brown","totalprice":%d,'
+            b'"depositpaid":true,"bookingdates":{"checkin":"2025-06-01",'
+            b'"checkout":"2025-06-10"}}' % booking_id
+        )
+        response.elapsed = timedelta(milliseconds=20)
+        yield request, response
+
+
+def bench_large(directory, count, lookups):
+    path = os.path.join(directory, "large.cassette")
+    recorded = 0.0  # Only the record() calls; building requests is not timed
+    with Cassette(path, mode="record") as cassette:
+        for request, response in synthetic_interactions(count):
+            started = time.perf_counter()
+            cassette.record(request, response)
+            recorded += time.perf_counter() - started
+        started = time.perf_counter()
+    recorded += time.perf_counter() - started  # close() writes the index
+    size = os.path.getsize(path) + os.path.getsize(path + ".idx")
+
+    prepared = [
+        requests.Request(
+            "GET", f"http://127.0.0.1/booking/{random.randint(1, count)}"
+        ).prepare()
+        for _ in range(lookups)
+    ]
+    started = time.perf_counter()
+    with Cassette(path) as cassette:
+        opened = time.perf_counter() - started
+        started = time.perf_counter()
+        for request in prepared:
+            cassette.play(request)
+        replayed = time.perf_counter() - started
+        assert cassette.stats.missed == 0
+
+    # Separate pass: tracemalloc slows every allocation down
+    tracemalloc.start()
+    with Cassette(path) as cassette:
+        for request in prepared[:1000]:
+            cassette.play(request)
+        _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"large: {count} interactions, {size / 1e6:.1f} MB on disk")
+    print(
+        f"  record + index   {recorded:8.2f} s "
+        f"({recorded / count * 1e6:.0f} us per interaction)"
+    )
+    print(f"  open for replay  {opened * 1000:8.2f} ms")
+    print(
+        f"  {lookups} lookups  {replayed * 1000:8.1f} ms "
+        f"({replayed / lookups * 1e6:.1f} us each)"
+    )
+    print(f"  peak Python memory while replaying: {peak / 1e6:.2f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workflows", type=int, default=100)
+    parser.add_argument("--interactions", type=int, default=200_000)
+    parser.add_argument("--lookups", type=int, default=50_000)
+    args = parser.parse_args()
+    logging.getLogger("src").setLevel(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as directory:
+        bench_workflow(directory, args.workflows)
+        bench_large(directory, args.interactions, args.lookups)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,471 @@
+# benchmarks/bench_client.py
+"""
+Client overhead suite: BookingHelper and authenticate against a stub, with
+stored baselines and regression gating.
+
+The client's session is mounted on an in-process stub adapter that routes
+on method and path and answers instantly with canned restful-booker
+bodies, so no socket, server or network noise is measured: what is left
+is APIClient.send_request, BookingHelper and authenticate themselves
+(the urllib3 transport below the adapter is excluded too). For every
+operation it records:
+
+  cpu_us           process CPU time per call, single-threaded
+  ops_per_s        calls per second, single-threaded
+  ops_per_s_mt     calls per second from --threads threads sharing a client
+  cpu_us_mt        process CPU time per call under that concurrency
+  alloc_kib        peak traced memory allocated during one call
+  py_calls         Python and C function calls made during one call
+
+Timing metrics are the best of --rounds rounds (the least disturbed one).
+alloc_kib and py_calls come from separate tracemalloc and profiler passes
+(tracing slows everything down) and are deterministic, so they are gated
+tightly (see THRESHOLDS). Timings swing by tens of percent on shared
+machines even for an unchanged tree, so by default they are only reported;
+--threshold FRACTION gates them too, for a quiet, dedicated machine.
+
+Results are compared with a JSON baseline kept in the repo, one per
+platform and Python version (benchmarks/baselines/client-<key>.json).
+Any gated metric worse than the baseline by more than its threshold fails
+the run (exit status 1), after the regressed operations have been
+re-measured --confirm times to rule out a noisy moment. --save writes the current
+results as the new baseline, bumping its version; commit it with the
+change that moved it.
+
+Usage:
+    python -m benchmarks.bench_client                        # Compare with the baseline
+    python -m benchmarks.bench_client --threshold 0.5        # Gate timings too
+    python -m benchmarks.bench_client --threshold py_calls=0
+    python -m benchmarks.bench_client --save                 # Record a new baseline
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from src import config
+from src.api_client import APIClient
+from src.helpers.auth import authenticate
+from src.helpers.booking import BookingHelper
+
+SCHEMA = "client-bench/1"
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+STUB_URL = "http://stub.local"
+# Fractional change tolerated before a metric fails. Timings are too noisy
+# to gate by default (None: reported, never failed)
+DEFAULT_THRESHOLD = None
+THRESHOLDS = {"alloc_kib": 0.05, "py_calls": 0.02}  # Deterministic metrics
+# Ungated changes beyond this are still listed in the comparison
+REPORT_CHANGE = 0.10
+# Metrics where bigger is better; every other one is a cost
+HIGHER_IS_BETTER = {"ops_per_s", "ops_per_s_mt"}
+
+PAYLOAD = {
+    "firstname": "Sally",
+    "lastname": "Brown",
+    "totalprice": 111,
+    "depositpaid": True,
+    "bookingdates": {"checkin": "2025-06-01", "checkout": "2025-06-10"},
+    "additionalneeds": "Breakfast",
+}
+_BOOKING = json.dumps(PAYLOAD).encode()
+# Canned answers per (method, first path segment, has an ID)
+_ROUTES = {
+    ("POST", "auth", False): (200, b'{"token":"abc123"}'),
+    ("GET", "booking", False): (
+        200,
+        json.dumps([{"bookingid": i} for i in range(1, 101)]).encode(),
+    ),
+    ("POST", "booking", False): (200, b'{"bookingid":1,"booking":%s}' % _BOOKING),
+    ("GET", "booking", True): (200, _BOOKING),
+    ("PUT", "booking", True): (200, _BOOKING),
+    ("PATCH", "booking", True): (200, _BOOKING),
+    ("DELETE", "booking", True): (201, b"Created"),
+}
+
+
+class _StubAdapter(BaseAdapter):
+    """Answers restful-booker routes from memory, without touching the network."""
+
+    def send(self, request, **kwargs):
+        path = request.path_url.split("?", 1)[0].strip("/").split("/")
+        status, body = _ROUTES.get(
+            (request.method, path[0], len(path) > 1), (404, b"Not Found")
+        )
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(
+            {
+                "Content-Type": "application/json; charset=utf-8"
+                if body[:1] in (b"{", b"[")
+                else "text/plain; charset=utf-8",
+                "Content-Length": str(len(body)),
+            }
+        )
+        response.encoding = "utf-8"
+        response._content = body
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def operations(client, helper, token):
+    """{name: zero-argument callable} for every measured operation."""
+    return {
+        "authenticate": lambda: authenticate(client),
+        "get_booking_ids": lambda: helper.get_booking_ids(),
+        "get_booking": lambda: helper.get_booking(1),
+        "get_booking_model": lambda: helper.get_booking(1, model=True),
+        "create_booking": lambda: helper.create_booking(PAYLOAD),
+        "update_booking": lambda: helper.update_booking(1, PAYLOAD, token),
+        "partial_update_booking": lambda: helper.partial_update_booking(
+            1, {"totalprice": 200}, token
+        ),
+        "delete_booking": lambda: helper.delete_booking(1, token),
+    }
+
+
+def _single(operation, calls):
+    started_cpu, started = time.process_time(), time.perf_counter()
+    for _ in range(calls):
+        operation()
+    return time.process_time() - started_cpu, time.perf_counter() - started
+
+
+def _concurrent(operation, calls, threads):
+    per_thread = calls // threads
+    barrier = threading.Barrier(threads + 1)
+
+    def work():
+        barrier.wait()
+        for _ in range(per_thread):
+            operation()
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        futures = [executor.submit(work) for _ in range(threads)]
+        started_cpu, started = time.process_time(), time.perf_counter()
+        barrier.wait()
+        for future in futures:
+            future.result()
+        elapsed = time.perf_counter() - started
+        cpu = time.process_time() - started_cpu
+    return cpu, elapsed, per_thread * threads
+
+
+def _allocations(operation, calls):
+    """Mean peak KiB traced during one call."""
+    operation()  # Lazily built state (codecs, caches) is not per-call cost
+    tracemalloc.start()
+    try:
+        total = 0
+        for _ in range(calls):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            operation()
+            _, peak = tracemalloc.get_traced_memory()
+            total += peak - before
+    finally:
+        tracemalloc.stop()
+    return total / calls / 1024
+
+
+def _function_calls(operation, calls):
+    """Mean function calls (Python and C) made during one call."""
+    operation()  # As above: first-use setup is not per-call cost
+    count = 0
+
+    def profile(frame, event, arg):
+        nonlocal count
+        if event == "call" or event == "c_call":
+            count += 1
+
+    sys.setprofile(profile)
+    try:
+        for _ in range(calls):
+            operation()
+    finally:
+        sys.setprofile(None)
+    return count / calls
+
+
+def run_suite(calls=2000, rounds=5, threads=8, only=None):
+    """
+    Measures every operation (or those named in `only`).
+
+    Returns:
+        dict: {operation: {metric: value}}.
+    """
+    previous = config.configure(base_url=STUB_URL)  # authenticate reads config
+    client = APIClient(
+        STUB_URL, default_headers=config.DEFAULT_HEADERS, pool_maxsize=threads
+    )
+    client.session.mount("http://", _StubAdapter())
+    try:
+        helper = BookingHelper(client)
+        ops = operations(client, helper, authenticate(client))
+        if only is not None:
+            ops = {name: ops[name] for name in ops if name in only}
+        results = {name: {} for name in ops}
+        for name, operation in ops.items():
+            _single(operation, calls // 10)  # Warm up
+        # Rounds interleave the operations so drift hits all of them alike
+        for _ in range(rounds):
+            for name, operation in ops.items():
+                cpu, elapsed = _single(operation, calls)
+                cpu_mt, elapsed_mt, done = _concurrent(operation, calls, threads)
+                metrics = {
+                    "cpu_us": cpu / calls * 1e6,
+                    "ops_per_s": calls / elapsed,
+                    "cpu_us_mt": cpu_mt / done * 1e6,
+                    "ops_per_s_mt": done / elapsed_mt,
+                }
+                best = results[name]
+                for metric, value in metrics.items():
+                    better = max if metric in HIGHER_IS_BETTER else min
+                    best[metric] = better(best.get(metric, value), value)
+        for name, operation in ops.items():
+            results[name]["alloc_kib"] = _allocations(operation, max(calls // 10, 1))
+            results[name]["py_calls"] = _function_calls(operation, 10)
+    finally:
+        client.close()
+        config.configure(previous)
+    return {
+        name: {metric: round(value, 3) for metric, value in sorted(metrics.items())}
+        for name, metrics in results.items()
+    }
+
+
+def merge_best(results, rerun):
+    """Keeps the better value of each metric measured twice."""
+    for operation, metrics in rerun.items():
+        for metric, value in metrics.items():
+            better = max if metric in HIGHER_IS_BETTER else min
+            old = results[operation].get(metric, value)
+            results[operation][metric] = better(old, value)
+    return results
+
+
+def environment():
+    """What a baseline is only comparable within."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def default_baseline_path():
+    env = environment()
+    key = f"{env['system']}-{env['machine']}-py{env['python'].rsplit('.', 1)[0]}"
+    return os.path.join(BASELINE_DIR, f"client-{key.lower()}.json")
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_baseline(path):
+    """The stored baseline, or None if there is none yet."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        return None
+    if baseline.get("schema") != SCHEMA:
+        raise ValueError(
+            f"{path}: expected schema {SCHEMA}, got {baseline.get('schema')}"
+        )
+    return baseline
+
+
+def save_baseline(path, results, settings, previous=None):
+    baseline = {
+        "schema": SCHEMA,
+        "version": (previous or {}).get("version", 0) + 1,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_revision": _git_revision(),
+        "environment": environment(),
+        "settings": settings,
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2)
+        f.write("\n")
+    return baseline
+
+
+def parse_thresholds(values):
+    """--threshold values ("0.1" or "metric=0.1") -> (default, {metric: t})."""
+    default, per_metric = DEFAULT_THRESHOLD, dict(THRESHOLDS)
+    for value in values:
+        metric, sep, number = value.rpartition("=")
+        if sep:
+            per_metric[metric] = float(number)
+        else:
+            default = float(number)
+    return default, per_metric
+
+
+def compare(baseline, results, default=DEFAULT_THRESHOLD, per_metric=THRESHOLDS):
+    """
+    Compares results with a baseline's.
+
+    Returns:
+        (rows, regressions): rows are (operation, metric, baseline value,
+        current value, change) for every metric in both, change
+        being the fractional regression (positive is worse), sorted worst
+        first; regressions is the set of indices of rows beyond their
+        threshold. Metrics whose threshold is None are never regressions.
+    """
+    rows, regressions = [], set()
+    for operation, metrics in results.items():
+        for metric, value in metrics.items():
+            old = baseline.get(operation, {}).get(metric)
+            if not old:
+                continue
+            change = (value - old) / old
+            if metric in HIGHER_IS_BETTER:
+                change = -change
+            rows.append((operation, metric, old, value, change))
+    rows.sort(key=lambda row: row[4], reverse=True)
+    for index, (_, metric, _, _, change) in enumerate(rows):
+        threshold = per_metric.get(metric, default)
+        if threshold is not None and change > threshold:
+            regressions.add(index)
+    return rows, regressions
+
+
+def print_results(results):
+    metrics = sorted({m for values in results.values() for m in values})
+    print(f"{'operation':<24}" + "".join(f"{m:>14}" for m in metrics))
+    for operation, values in results.items():
+        print(
+            f"{operation:<24}"
+            + "".join(f"{values.get(m, float('nan')):>14.2f}" for m in metrics)
+        )
+
+
+def _write_output(path, results):
+    if path:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"schema": SCHEMA, "results": results}, f, indent=2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=2000, help="Per round")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--baseline", default=default_baseline_path())
+    parser.add_argument(
+        "--threshold",
+        action="append",
+        default=[],
+        metavar="[METRIC=]FRACTION",
+        help=(
+            f"Tolerated regression: FRACTION gates the timings too (by default "
+            f"they are only reported), METRIC=FRACTION overrides {THRESHOLDS}; "
+            "repeatable"
+        ),
+    )
+    parser.add_argument(
+        "--confirm",
+        type=int,
+        default=2,
+        help="Re-measure regressed operations up to this many times before failing",
+    )
+    parser.add_argument("--save", action="store_true", help="Write a new baseline")
+    parser.add_argument("--output", help="Also write the results here as JSON")
+    args = parser.parse_args(argv)
+    logging.getLogger("src").setLevel(logging.WARNING)  # INFO off, as in production
+    default, per_metric = parse_thresholds(args.threshold)
+
+    settings = {"calls": args.calls, "rounds": args.rounds, "threads": args.threads}
+    results = run_suite(**settings)
+    baseline = load_baseline(args.baseline)
+
+    if args.save or baseline is None:
+        print_results(results)
+        _write_output(args.output, results)
+        if not args.save:
+            print(f"\nNo baseline at {args.baseline}; run with --save to record one")
+            return 0
+        saved = save_baseline(args.baseline, results, settings, baseline)
+        print(f"\nSaved baseline version {saved['version']} to {args.baseline}")
+        return 0
+
+    rows, regressions = compare(baseline["results"], results, default, per_metric)
+    for _ in range(args.confirm):
+        if not regressions:
+            break
+        # A noisy neighbour only ever makes a run look slower: re-measure the
+        # suspects and keep their best values, so only lasting regressions fail
+        suspects = {rows[index][0] for index in regressions}
+        print(f"Re-measuring {', '.join(sorted(suspects))}")
+        merge_best(results, run_suite(**settings, only=suspects))
+        rows, regressions = compare(baseline["results"], results, default, per_metric)
+    print_results(results)
+    _write_output(args.output, results)
+
+    if baseline["environment"] != environment():
+        print(
+            f"\nWarning: baseline was recorded on {baseline['environment']}, "
+            f"this is {environment()}; timings may not be comparable"
+        )
+    if baseline.get("settings") != settings:
+        print(
+            f"\nWarning: baseline used {baseline.get('settings')}, this run {settings}"
+        )
+    print(
+        f"\nAgainst baseline version {baseline['version']} "
+        f"({baseline.get('git_revision')}, {baseline['created']}):"
+    )
+    for index, (operation, metric, old, value, change) in enumerate(rows):
+        if index in regressions:
+            flag = "REGRESSED"
+        elif change > REPORT_CHANGE:
+            flag = "slower"  # Within its threshold, or not gated
+        elif -change > REPORT_CHANGE:
+            flag = "improved"
+        else:
+            continue
+        print(
+            f"  {flag:<9} {operation}.{metric}: {old:.2f} -> {value:.2f} "
+            f"({(value - old) / old:+.1%})"
+        )
+    if regressions:
+        print(f"{len(regressions)} metric(s) regressed beyond their threshold")
+        return 1
+    print(f"No regressions beyond the thresholds ({len(rows)} metrics compared)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+# benchmarks/bench_codec.py
+"""
+Compares JSON handling: requests' built-in json=/response.json() against
+APIClient's pluggable codecs and decode-once APIResponse.
+
+Three measurements, each for every codec installed here (stdlib always;
+orjson/msgspec when installed):
+
+  listing decode   a get_booking_ids response of --bookings ids, fetched
+                   once from the local server, decoded via response.json()
+                   --reads times per response (tests read it more than once)
+  payload encode   --payloads booking bodies encoded as requests' json= does
+                   vs codec.encode()
+  end to end       get_booking_ids + .json() and a create_bookings batch
+                   through APIClient against the local server
+
+Usage:
+    python -m benchmarks.bench_codec
+    python -m benchmarks.bench_codec --bookings 200000 --reads 3
+"""
+
+import argparse
+import logging
+import time
+
+import requests
+
+from src.api_client import APIClient
+from src.codec import APIResponse, available_codecs, get_codec
+from src.helpers.booking import BookingHelper
+from src.local_server import LocalBookerServer
+
+SAMPLE_BOOKING = {
+    "firstname": "Sally",
+    "lastname": "Brown",
+    "totalprice": 111,
+    "depositpaid": True,
+    "bookingdates": {"checkin": "2025-06-01", "checkout": "2025-06-10"},
+    "additionalneeds": "Breakfast",
+}
+
+
+def best_of(rounds, func):
+    """Fastest of `rounds` runs of func(), in seconds."""
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def bench_listing_decode(raw, reads, rounds):
+    def with_requests():
+        for _ in range(reads):
+            raw.json()  # Decodes body -> str -> objects on every call
+
+    results = {"requests .json()": best_of(rounds, with_requests)}
+    for name in available_codecs():
+        codec = get_codec(name)
+
+        def with_codec():
+            response = APIResponse(raw, codec)
+            for _ in range(reads):
+                response.json()
+
+        results[f"{name} APIResponse"] = best_of(rounds, with_codec)
+    return results
+
+
+def bench_payload_encode(payloads, rounds):
+    def with_requests():
+        for payload in payloads:
+            prepared = requests.models.PreparedRequest()
+            prepared.prepare_headers(None)
+            prepared.prepare_body(None, None, json=payload)
+
+    results = {"requests json=": best_of(rounds, with_requests)}
+    for name in available_codecs():
+        encode = get_codec(name).encode
+        results[f"{name} encode"] = best_of(
+            rounds, lambda: [encode(payload) for payload in payloads]
+        )
+    return results
+
+
+def bench_end_to_end(server, creates, rounds):
+    results = {}
+    for name in available_codecs():
+        with APIClient(server.base_url, pool_maxsize=8, codec=name) as client:
+            helper = BookingHelper(client, max_workers=8)
+            results[f"{name} get_booking_ids"] = best_of(
+                rounds, lambda: helper.get_booking_ids().json()
+            )
+            results[f"{name} create_bookings"] = best_of(
+                1, lambda: helper.create_bookings([SAMPLE_BOOKING] * creates)
+            )
+    return results
+
+
+def report(title, results, unit_count=None, unit=None):
+    """Prints timings; with unit_count, also per-unit cost and speedup vs the first."""
+    print(title)
+    baseline = next(iter(results.values()))
+    for name, seconds in results.items():
+        if unit_count is None:
+            print(f"  {name:>28}: {seconds * 1000:9.2f} ms")
+            continue
+        print(
+            f"  {name:>28}: {seconds * 1000:9.2f} ms "
+            f"({seconds / unit_count * 1e6:8.3f} us/{unit}, "
+            f"{baseline / seconds:5.2f}x)"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bookings", type=int, default=100_000)
+    parser.add_argument("--reads", type=int, default=2, help="json() per response")
+    parser.add_argument("--payloads", type=int, default=20_000)
+    parser.add_argument("--creates", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    logging.getLogger("src").setLevel(logging.WARNING)
+    print(f"Codecs available: {', '.join(available_codecs())}")
+
+    with LocalBookerServer() as server:
+        for _ in range(args.bookings):
+            server.store.create(dict(SAMPLE_BOOKING))
+        raw = requests.get(f"{server.base_url}/booking")
+        raw.content  # Read the body once, outside the timings
+        report(
+            f"Listing decode: {args.bookings} ids, {len(raw.content) / 1e6:.1f} MB, "
+            f"{args.reads} json() calls per response (best of {args.rounds})",
+            bench_listing_decode(raw, args.reads, args.rounds),
+            args.bookings,
+            "id",
+        )
+        report(
+            f"Payload encode: {args.payloads} booking bodies (best of {args.rounds})",
+            bench_payload_encode([SAMPLE_BOOKING] * args.payloads, args.rounds),
+            args.payloads,
+            "body",
+        )
+        report(
+            f"End to end: listing of {args.bookings} and {args.creates} creates",
+            bench_end_to_end(server, args.creates, args.rounds),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# benchmarks/bench_connection_pool.py
+"""
+Compares per-call connections against APIClient's pooled keep-alive session.
+
+Runs N back-to-back BookingHelper.get_booking calls twice: once with a
+"per-call" session that mimics the old module-level requests.request usage,
+and once with the pooled session APIClient now owns. Reports how many new
+connections (TCP, plus TLS for https) each mode opened and the latency
+distribution.
+
+Usage:
+    python -m benchmarks.bench_connection_pool
+    python -m benchmarks.bench_connection_pool --calls 1000 --base-url https://restful-booker.herokuapp.com --booking-id 1
+"""
+
+import argparse
+import logging
+import statistics
+import threading
+import time
+
+import requests
+import urllib3.connection
+
+from src.api_client import APIClient
+from src.helpers.booking import BookingHelper
+from src.local_server import LocalBookerServer
+
+SAMPLE_BOOKING = {
+    "firstname": "Sally",
+    "lastname": "Brown",
+    "totalprice": 111,
+    "depositpaid": True,
+    "bookingdates": {"checkin": "2025-06-01", "checkout": "2025-06-10"},
+    "additionalneeds": "Breakfast",
+}
+
+
+class _PerCallSession:
+    """Mimics the pre-pool client: every request opens a fresh connection."""
+
+    def request(self, **kwargs):
+        return requests.request(**kwargs)
+
+    def close(self):
+        pass
+
+
+class _ConnectionCounter:
+    """Counts new connections opened by urllib3 (each one is a TCP/TLS handshake)."""
+
+    def __init__(self):
+        self.count = 0
+        self._lock = threading.Lock()
+        self._original = urllib3.connection.HTTPConnection._new_conn
+
+    def __enter__(self):
+        counter = self
+
+        def counting_new_conn(conn_self):
+            with counter._lock:
+                counter.count += 1
+            return counter._original(conn_self)
+
+        urllib3.connection.HTTPConnection._new_conn = counting_new_conn
+        return self
+
+    def __exit__(self, *exc):
+        urllib3.connection.HTTPConnection._new_conn = self._original
+
+
+def run_mode(name, client, booking_id, calls):
+    """Runs `calls` sequential get_booking calls and returns a result dict."""
+    helper = BookingHelper(client)
+    latencies = []
+    with _ConnectionCounter() as counter:
+        started = time.perf_counter()
+        for _ in range(calls):
+            t0 = time.perf_counter()
+            helper.get_booking(booking_id)
+            latencies.append((time.perf_counter() - t0) * 1000)
+        wall = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "mode": name,
+        "calls": calls,
+        "connections_opened": counter.count,
+        "wall_s": round(wall, 3),
+        "mean_ms": round(statistics.fmean(latencies), 3),
+        "p50_ms": round(latencies[len(latencies) // 2], 3),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1], 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument(
+        "--base-url", help="Target API (defaults to the in-process local server)"
+    )
+    parser.add_argument(
+        "--booking-id", type=int, help="Booking to fetch (local server: seeded)"
+    )
+    args = parser.parse_args()
+    # Per-call INFO logs from the helpers would skew the timings
+    logging.getLogger("src").setLevel(logging.WARNING)
+
+    server = None
+    base_url = args.base_url
+    booking_id = args.booking_id or 1
+    if base_url is None:
+        server = LocalBookerServer().start()
+        base_url = server.base_url
+        booking_id = server.store.create(SAMPLE_BOOKING)
+
+    headers = {"Accept": "application/json"}
+    per_call = APIClient(base_url=base_url, default_headers=headers)
+    per_call.session = _PerCallSession()
+    with APIClient(base_url=base_url, default_headers=headers) as pooled:
+        results = [
+            run_mode("per-call", per_call, booking_id, args.calls),
+            run_mode("pooled", pooled, booking_id, args.calls),
+        ]
+
+    if server is not None:
+        server.stop()
+
+    print(f"{args.calls} x BookingHelper.get_booking against {base_url}")
+    for result in results:
+        print(
+            f"  {result['mode']:>8}: {result['connections_opened']:>5} connections, "
+            f"wall {result['wall_s']:.3f}s, mean {result['mean_ms']:.3f}ms, "
+            f"p50 {result['p50_ms']:.3f}ms, p99 {result['p99_ms']:.3f}ms"
+        )
+    speedup = results[0]["wall_s"] / results[1]["wall_s"]
+    print(f"  pooled session is {speedup:.1f}x faster end to end")
+
+
+if __name__ == "__main__":
+    main()
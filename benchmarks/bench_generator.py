@@ -0,0 +1,79 @@
+# benchmarks/bench_generator.py
+"""
+Throughput and memory of src.helpers.booking_generator.
+
+Streams --count payloads from tests/data/booking_data.json (nothing is
+kept), then streams a smaller run under tracemalloc to show that peak
+memory is one block of payloads, not the whole run, and finally times
+random access with payload(i), as pytest cases use it.
+
+Usage:
+    python -m benchmarks.bench_generator
+    python -m benchmarks.bench_generator --count 5000000 --block-size 8192
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+import tracemalloc
+
+from src.helpers.booking_generator import DEFAULT_BLOCK_SIZE, BookingGenerator
+
+TEMPLATE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "tests",
+    "data",
+    "booking_data.json",
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--block-size", type=int, default=DEFAULT_BLOCK_SIZE)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    with open(TEMPLATE, encoding="utf-8") as f:
+        template = json.load(f)
+    generator = BookingGenerator(template, seed=args.seed, block_size=args.block_size)
+
+    started = time.perf_counter()
+    for _ in generator.generate(args.count):
+        pass
+    elapsed = time.perf_counter() - started
+    print(
+        f"{args.count} payloads in {elapsed:.2f} s "
+        f"({args.count / elapsed:,.0f}/s, {elapsed / args.count * 1e6:.2f} us each)"
+    )
+
+    # Separate pass: tracemalloc slows every allocation down
+    traced = min(args.count, 200_000)
+    tracemalloc.start()
+    for _ in generator.generate(traced):
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"peak memory streaming {traced} payloads: {peak / 1e6:.2f} MB "
+        f"(block of {args.block_size})"
+    )
+
+    indices = [random.randrange(args.count) for _ in range(1000)]
+    started = time.perf_counter()
+    for index in indices:
+        generator.payload(index)
+    random_access = (time.perf_counter() - started) / len(indices)
+    started = time.perf_counter()
+    for index in range(1000):
+        generator.payload(index)
+    sequential = (time.perf_counter() - started) / 1000
+    print(
+        f"payload(i): {sequential * 1e6:.1f} us sequential, "
+        f"{random_access * 1000:.2f} ms random (rebuilds the block)"
+    )
+
+
+if __name__ == "__main__":
+    main()
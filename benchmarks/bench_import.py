@@ -0,0 +1,89 @@
+# benchmarks/bench_import.py
+"""
+Import cost of src.helpers.booking, in fresh interpreters.
+
+Every sample starts a new Python process and times only the import
+statement, so module caches never carry over. Three variants:
+
+  lazy       import src.helpers.booking (settings unresolved, no asyncio)
+  resolved   the same, then the first config.BASE_URL access (loads .env)
+  eager      the same, plus what importing used to pull in up front
+             (python-dotenv, load_dotenv() and asyncio)
+
+With --rev, the import is also timed in that git revision of the tree
+(extracted with `git archive`), e.g. the commit before lazy settings.
+
+Usage:
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --samples 40 --rev HEAD~1
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+
+VARIANTS = {
+    "lazy": "",
+    "resolved": "from src import config; config.BASE_URL",
+    "eager": (
+        "import asyncio, dotenv; dotenv.load_dotenv(); "
+        "from src import config; config.BASE_URL"
+    ),
+}
+# Time the import (and the extra work) only, not interpreter start-up
+_SCRIPT = (
+    "import time; started = time.perf_counter(); "
+    "import src.helpers.booking; {extra}; "
+    "print(time.perf_counter() - started)"
+)
+
+
+def sample(cwd, extra, samples):
+    """Median and p90 seconds over `samples` fresh interpreters."""
+    env = dict(os.environ, API_BASE_URL=os.getenv("API_BASE_URL", "http://x"))
+    timings = []
+    for _ in range(samples):
+        out = subprocess.run(
+            [sys.executable, "-c", _SCRIPT.format(extra=extra or "pass")],
+            cwd=cwd,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        timings.append(float(out))
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.9) - 1]
+
+
+def extract(rev, directory):
+    """Writes the tree of git revision `rev` into `directory`."""
+    archive = os.path.join(directory, "tree.tar")
+    subprocess.run(["git", "archive", "-o", archive, rev], check=True)
+    with tarfile.open(archive) as tar:
+        tar.extractall(directory, filter="data")
+    return directory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--samples", type=int, default=20)
+    parser.add_argument("--rev", help="Also time this git revision's tree")
+    args = parser.parse_args()
+
+    print(f"import src.helpers.booking, median / p90 of {args.samples} processes")
+    for name, extra in VARIANTS.items():
+        median, p90 = sample(os.getcwd(), extra, args.samples)
+        print(f"  {name:<10} {median * 1000:7.1f} ms  {p90 * 1000:7.1f} ms")
+    if args.rev:
+        with tempfile.TemporaryDirectory() as directory:
+            median, p90 = sample(extract(args.rev, directory), "", args.samples)
+        print(f"  {args.rev:<10} {median * 1000:7.1f} ms  {p90 * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
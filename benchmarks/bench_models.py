@@ -0,0 +1,114 @@
+# benchmarks/bench_models.py
+"""
+Memory footprint and parse/serialize cost of src.models.Booking vs dicts.
+
+Builds --count booking payloads as JSON bytes (what get_booking returns),
+then holds all of them in memory twice: as decoded dicts (response.json())
+and as Booking objects (Booking.from_json). Memory is measured with
+tracemalloc, so it counts exactly what each representation keeps alive.
+Names, needs and dates are drawn from small pools, like restful-booker's
+own data, which is where interning and shared dates pay off.
+
+Usage:
+    python -m benchmarks.bench_models
+    python -m benchmarks.bench_models --count 1000000
+"""
+
+import argparse
+import gc
+import json
+import random
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from src.codec import get_codec
+from src.models import Booking
+
+FIRST_NAMES = ["Sally", "Jim", "Mark", "Mary", "Susan", "Eric", "John", "Jane"]
+LAST_NAMES = ["Brown", "Smith", "Jones", "Wilson", "Ericsson", "Jackson"]
+NEEDS = ["Breakfast", "Lunch", "Dinner", "Late checkout", None]
+
+
+def make_payloads(count, seed=0):
+    rng = random.Random(seed)
+    start = date(2025, 1, 1)
+    payloads = []
+    for _ in range(count):
+        checkin = start + timedelta(days=rng.randrange(365))
+        booking = {
+            "firstname": rng.choice(FIRST_NAMES),
+            "lastname": rng.choice(LAST_NAMES),
+            "totalprice": rng.randrange(50, 2000),
+            "depositpaid": rng.random() < 0.5,
+            "bookingdates": {
+                "checkin": checkin.isoformat(),
+                "checkout": (
+                    checkin + timedelta(days=rng.randrange(1, 15))
+                ).isoformat(),
+            },
+        }
+        needs = rng.choice(NEEDS)
+        if needs is not None:
+            booking["additionalneeds"] = needs
+        payloads.append(json.dumps(booking).encode())
+    return payloads
+
+
+def measure(build):
+    """(result, bytes still allocated by it, seconds to build it)."""
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - started
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=200_000)
+    args = parser.parse_args()
+    codec = get_codec("stdlib")
+
+    payloads = make_payloads(args.count)
+    print(f"{args.count} bookings, {sum(map(len, payloads)) / 1e6:.1f} MB of JSON")
+
+    dicts, dict_bytes, dict_parse = measure(
+        lambda: [codec.decode(payload) for payload in payloads]
+    )
+    del dicts
+    models, model_bytes, model_parse = measure(
+        lambda: [Booking.from_json(payload, codec) for payload in payloads]
+    )
+
+    started = time.perf_counter()
+    for booking in models:
+        booking.to_json()
+    model_serialize = time.perf_counter() - started
+    as_dicts = [booking.to_dict() for booking in models]
+    started = time.perf_counter()
+    for booking in as_dicts:
+        codec.encode(booking)
+    dict_serialize = time.perf_counter() - started
+
+    per = 1e6 / args.count
+    print(f"  {'':>8} {'held in memory':>20} {'parse':>12} {'serialize':>12}")
+    print(
+        f"  {'dicts':>8} {dict_bytes / 1e6:9.1f} MB ({dict_bytes / args.count:5.0f} B)"
+        f" {dict_parse * per:9.2f} us {dict_serialize * per:9.2f} us"
+    )
+    print(
+        f"  {'Booking':>8} {model_bytes / 1e6:9.1f} MB ({model_bytes / args.count:5.0f} B)"
+        f" {model_parse * per:9.2f} us {model_serialize * per:9.2f} us"
+    )
+    print(
+        f"  Booking objects hold {model_bytes / dict_bytes:.0%} of the dict footprint "
+        f"(parse includes validation)"
+    )
+
+
+if __name__ == "__main__":
+    main()
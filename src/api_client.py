@@ -1,17 +1,138 @@
 # src/api_client.py
+import http.cookiejar
+import time
 import requests
 import logging  # Use logging instead of print for better control
 
-logging.basicConfig(level=logging.INFO)
+from src.cassette import CassetteAdapter
+from src.codec import APIResponse, get_codec
+from src.deadline import (
+    DEFAULT_TIMEOUT,
+    DeadlineExceeded,
+    current_deadline,
+    effective_timeout,
+)
+from src.instrumentation import (
+    RequestTiming,
+    TimingHTTPAdapter,
+    endpoint_template,
+    set_current_timing,
+)
+
+# No logging.basicConfig here: configuring handlers is the application's job
 logger = logging.getLogger(__name__)
 
+# Connection pool defaults. requests' own default is 10/10, which is enough for
+# sequential tests; raise pool_maxsize when sharing one client across threads.
+DEFAULT_POOL_CONNECTIONS = 10  # Number of per-host pools to cache
+DEFAULT_POOL_MAXSIZE = 10  # Max connections kept alive per host
+# Safe to send twice, so the only methods that may be hedged
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+
 
 class APIClient:
-    def __init__(self, base_url=None, default_headers=None):
+    def __init__(
+        self,
+        base_url=None,
+        default_headers=None,
+        pool_connections=DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        pool_block=False,
+        hooks=None,
+        cache=None,
+        timeout=DEFAULT_TIMEOUT,
+        hedging=None,
+        flow_control=None,
+        codec="auto",
+        cassette=None,
+    ):
+        """
+        Initializes the client and its pooled, keep-alive HTTP session.
+
+        Args:
+            base_url: Base URL of the API (e.g. https://restful-booker.herokuapp.com).
+            default_headers: Headers sent with every request.
+            pool_connections: Number of per-host connection pools to keep.
+            pool_maxsize: Max connections kept alive per host. Set this to at
+                least the number of threads sharing the client.
+            pool_block: If True, threads wait for a free connection when the
+                pool is exhausted instead of opening a throwaway one.
+            hooks: Instrumentation hooks (see src.instrumentation.RequestHook)
+                called before and after every request.
+            cache: Optional src.response_cache.ResponseCache for GET responses.
+                Non-GET requests invalidate their URL in it.
+            timeout: Default seconds, or (connect, read) pair, per request.
+            hedging: Optional src.hedging.HedgePolicy; slow GETs are then
+                duplicated and the first answer wins.
+            flow_control: Optional src.flow_control.FlowControl; every attempt
+                then goes through its rate limit and adaptive concurrency
+                limit, and 429/503 responses are retried (Retry-After honoured).
+            codec: JSON codec for request bodies and responses: "auto" (the
+                fastest installed), "stdlib", "orjson", "msgspec", or a codec
+                object (see src.codec).
+            cassette: Optional src.cassette.Cassette; requests are then
+                recorded to it, or replayed from it without the network,
+                depending on its mode.
+        """
         if base_url is None:
             raise ValueError("base_url must be provided")
         self.base_url = base_url
         self.default_headers = default_headers if default_headers is not None else {}
+        self.pool_maxsize = pool_maxsize
+        self.cassette = cassette
+        self.session = self._create_session(
+            pool_connections, pool_maxsize, pool_block, cassette
+        )
+        self.hooks = list(hooks) if hooks else []
+        self.cache = cache
+        self.timeout = timeout
+        self.hedging = hedging
+        self.flow_control = flow_control
+        self.codec = get_codec(codec)
+
+    @staticmethod
+    def _create_session(pool_connections, pool_maxsize, pool_block, cassette=None):
+        """Creates a requests.Session backed by a sized urllib3 connection pool."""
+        session = requests.Session()
+        # urllib3's pool is thread-safe, so one adapter can be shared by all threads
+        # The timing adapter also reports DNS/connect/TLS phases to hooks
+        adapter = TimingHTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        if cassette is not None:
+            # Records what goes over the wire, or answers in its place
+            adapter = CassetteAdapter(cassette, adapter)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        # Keep-alive is requests' default, but be explicit about it
+        session.headers["Connection"] = "keep-alive"
+        # Don't let server cookies leak between calls (auth is sent per request)
+        session.cookies.set_policy(
+            http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+        )
+        return session
+
+    def add_hook(self, hook):
+        """Registers an instrumentation hook for all subsequent requests."""
+        self.hooks.append(hook)
+
+    def invalidate_cache(self, *endpoints):
+        """Drops cached GET responses for `endpoints` (no-op without a cache)."""
+        if self.cache is not None:
+            for endpoint in endpoints:
+                self.cache.invalidate(self._make_url(endpoint))
+
+    def close(self):
+        """Closes the session and every pooled connection."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _make_url(self, endpoint):
         # Ensure no double slashes if endpoint starts with /
@@ -19,57 +140,277 @@ class APIClient:
         return f"{self.base_url}/{endpoint}"
 
     def send_request(
-        self, method, endpoint, headers=None, json=None, params=None, data=None
+        self,
+        method,
+        endpoint,
+        headers=None,
+        json=None,
+        params=None,
+        data=None,
+        stream=False,
+        timeout=None,
+        hedge=True,
     ):
-        """Sends an HTTP request."""
+        """
+        Sends an HTTP request over the client's pooled session.
+
+        Returns an src.codec.APIResponse: a requests.Response whose json()
+        is decoded with the client's codec, once.
+
+        Args:
+            method: HTTP method.
+            endpoint: Path relative to base_url.
+            headers: Extra headers, merged over the client's defaults.
+            json: JSON body.
+            params: Query parameters.
+            data: Raw or form body.
+            stream: Leave the body unread (and uncached): iterate it with
+                response.iter_content() and close the response when done so
+                its connection goes back to the pool.
+            timeout: Seconds or (connect, read) for this call instead of the
+                client's timeout; clamped to any active deadline.
+            hedge: Allow hedging when the client has a HedgePolicy (only
+                GET/HEAD are ever hedged).
+
+        Raises:
+            requests.exceptions.RequestException: On transport errors and 4xx/5xx
+                responses (src.deadline.DeadlineExceeded when out of budget).
+        """
         full_url = self._make_url(endpoint)
         request_headers = self.default_headers.copy()
         if headers:
             request_headers.update(headers)
+        if json is not None and data is None:
+            # Encoded once here (not per retry or hedge) with the client's codec
+            data = self.codec.encode(json)
+            json = None
+            if not any(name.lower() == "content-type" for name in request_headers):
+                request_headers["Content-Type"] = "application/json"
+        options = {
+            "json": json,
+            "params": params,
+            "data": data,  # Keep data for cases where raw body is needed
+            "stream": stream,
+            "timeout": self.timeout if timeout is None else timeout,
+        }
+
+        if stream:
+            return self._dispatch(method, endpoint, full_url, request_headers, options)
+        if self.cache is not None:
+            if method == "GET":
+                return self._send_cached(
+                    endpoint, full_url, request_headers, options, hedge
+                )
+            try:
+                return self._dispatch(
+                    method, endpoint, full_url, request_headers, options
+                )
+            finally:
+                # Like an HTTP cache: a write to a URL makes what was read there stale
+                self.cache.invalidate(full_url)
+        return self._dispatch(
+            method, endpoint, full_url, request_headers, options, hedge
+        )
+
+    def _dispatch(
+        self, method, endpoint, full_url, request_headers, options, hedge=False
+    ):
+        if hedge and self.hedging is not None and method in _IDEMPOTENT_METHODS:
+            return self.hedging.send(
+                f"{method} {endpoint_template(endpoint)}",
+                lambda: self._attempt(
+                    method, endpoint, full_url, request_headers, options
+                ),
+            )
+        return self._attempt(method, endpoint, full_url, request_headers, options)
 
+    def _attempt(self, method, endpoint, full_url, request_headers, options):
+        """One request on the wire, under flow control when configured."""
+        if self.flow_control is not None:
+            return self.flow_control.send(
+                lambda: self._attempt_once(
+                    method, endpoint, full_url, request_headers, options
+                )
+            )
+        return self._attempt_once(method, endpoint, full_url, request_headers, options)
+
+    def _attempt_once(self, method, endpoint, full_url, request_headers, options):
+        """Sends once, instrumented when hooks are registered."""
+        if self.hooks:
+            return self._send_instrumented(
+                method, endpoint, full_url, request_headers, options
+            )
+        return self._send(method, full_url, request_headers, options)
+
+    def _send_cached(self, endpoint, full_url, request_headers, options, hedge):
+        """GET through the response cache, revalidating stale entries."""
+        key = self.cache.make_key(full_url, options["params"])
+        entry, fresh = self.cache.lookup(key)
+        if fresh:
+            return entry.response
+        if entry is not None:
+            # Stale, but the server can confirm it is unchanged with a 304
+            request_headers = {**request_headers, **entry.validators()}
         try:
-            logger.debug(
-                f"Sending {method} request to {full_url} with params={params}, json={json}, data={data}, headers={request_headers}"
+            response = self._dispatch(
+                "GET", endpoint, full_url, request_headers, options, hedge
             )
-            response = requests.request(
+        except requests.exceptions.RequestException:
+            if entry is not None:
+                self.cache.invalidate(full_url)  # Can no longer vouch for it
+            raise
+        if response.status_code == 304 and entry is not None:
+            return self.cache.revalidated(key, entry)
+        self.cache.store(key, response)
+        return response
+
+    def _send(self, method, full_url, request_headers, options):
+        try:
+            # Guarded so payloads and headers are only formatted when DEBUG is on
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Sending %s request to %s with params=%s, json=%s, data=%s, "
+                    "headers=%s",
+                    method,
+                    full_url,
+                    options["params"],
+                    options["json"],
+                    options["data"],
+                    request_headers,
+                )
+            response = self.session.request(
                 method=method,
                 url=full_url,
                 headers=request_headers,
-                json=json,
-                params=params,
-                data=data,  # Keep data for cases where raw body is needed
+                json=options["json"],
+                params=options["params"],
+                data=options["data"],
+                stream=options["stream"],
+                # Per attempt, so retries and hedges share one deadline
+                timeout=effective_timeout(options["timeout"]),
             )
             # Raise an exception for bad status codes (4xx or 5xx)
             response.raise_for_status()
-            logger.debug(
-                f"Response Status: {response.status_code}, Body: {response.text[:100]}..."
-            )  # Log snippet
+            response = APIResponse(response, self.codec)
+            if not options["stream"] and logger.isEnabledFor(logging.DEBUG):
+                # response.text decodes the whole body, so only touch it here
+                logger.debug(
+                    "Response Status: %s, Body: %.100s...",
+                    response.status_code,
+                    response.text,
+                )  # Log snippet
             return response
         except requests.exceptions.RequestException as e:
-            logger.error(f"{method} Request to {full_url} failed: {e}", exc_info=True)
+            logger.error(
+                "%s Request to %s failed: %s", method, full_url, e, exc_info=True
+            )
+            budget = current_deadline()
+            if (
+                isinstance(e, requests.exceptions.Timeout)
+                and not isinstance(e, DeadlineExceeded)
+                and budget is not None
+                and budget.expired
+            ):
+                raise DeadlineExceeded(f"Deadline exceeded: {e}") from e
             # Re-raise the exception so callers know the request failed
             raise
 
-    def get(self, endpoint, params=None, headers=None):
-        return self.send_request("GET", endpoint, params=params, headers=headers)
+    def _send_instrumented(self, method, endpoint, full_url, request_headers, options):
+        """_send wrapped in RequestTiming collection and hook callbacks."""
+        timing = RequestTiming(method, endpoint_template(endpoint), full_url)
+        for hook in self.hooks:
+            hook.pre_request(timing)
+        # Connection classes add DNS/connect/TLS phases to the current timing
+        set_current_timing(timing)
+        timing.started = time.perf_counter()
+        response = None
+        try:
+            response = self._send(method, full_url, request_headers, options)
+            return response
+        except requests.exceptions.RequestException as e:
+            timing.error = e
+            response = e.response
+            raise
+        finally:
+            timing.total = time.perf_counter() - timing.started
+            set_current_timing(None)
+            if response is not None:
+                timing.status_code = response.status_code
+                # requests' elapsed stops when the headers have been parsed
+                timing.ttfb = response.elapsed.total_seconds()
+                if options["stream"]:  # Body not read yet; report the announced size
+                    timing.response_bytes = int(
+                        response.headers.get("Content-Length", 0)
+                    )
+                else:
+                    timing.response_bytes = len(response.content)
+                body = response.request.body
+                timing.request_bytes = len(body) if body else 0
+            for hook in self.hooks:
+                hook.post_request(timing)
+
+    def get(
+        self,
+        endpoint,
+        params=None,
+        headers=None,
+        stream=False,
+        timeout=None,
+        hedge=True,
+    ):
+        return self.send_request(
+            "GET",
+            endpoint,
+            params=params,
+            headers=headers,
+            stream=stream,
+            timeout=timeout,
+            hedge=hedge,
+        )
 
-    def post(self, endpoint, json=None, data=None, params=None, headers=None):
+    def post(
+        self, endpoint, json=None, data=None, params=None, headers=None, timeout=None
+    ):
         return self.send_request(
-            "POST", endpoint, json=json, data=data, params=params, headers=headers
+            "POST",
+            endpoint,
+            json=json,
+            data=data,
+            params=params,
+            headers=headers,
+            timeout=timeout,
         )
 
-    def put(self, endpoint, json=None, data=None, params=None, headers=None):
+    def put(
+        self, endpoint, json=None, data=None, params=None, headers=None, timeout=None
+    ):
         # Corrected method name
         return self.send_request(
-            "PUT", endpoint, json=json, data=data, params=params, headers=headers
+            "PUT",
+            endpoint,
+            json=json,
+            data=data,
+            params=params,
+            headers=headers,
+            timeout=timeout,
         )
 
-    def patch(self, endpoint, json=None, data=None, params=None, headers=None):
+    def patch(
+        self, endpoint, json=None, data=None, params=None, headers=None, timeout=None
+    ):
         # Corrected method name
         return self.send_request(
-            "PATCH", endpoint, json=json, data=data, params=params, headers=headers
+            "PATCH",
+            endpoint,
+            json=json,
+            data=data,
+            params=params,
+            headers=headers,
+            timeout=timeout,
         )
 
-    def delete(self, endpoint, params=None, headers=None):
+    def delete(self, endpoint, params=None, headers=None, timeout=None):
         # Corrected method name
-        return self.send_request("DELETE", endpoint, params=params, headers=headers)
+        return self.send_request(
+            "DELETE", endpoint, params=params, headers=headers, timeout=timeout
+        )
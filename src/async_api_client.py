@@ -0,0 +1,144 @@
+# src/async_api_client.py
+import asyncio
+import contextlib
+import logging
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on in-flight requests per client. restful-booker is a shared
+# instance, so keep this modest unless you are targeting your own deployment.
+DEFAULT_MAX_CONCURRENCY = 100
+
+
+class AsyncAPIClient:
+    """
+    asyncio counterpart of APIClient.
+
+    Same surface (send_request/get/post/put/patch/delete, default headers,
+    raise on 4xx/5xx) but every call is a coroutine, so a single event loop can
+    keep many requests in flight. A semaphore caps concurrency at
+    `max_concurrency`, and the connection pool is sized to match.
+    """
+
+    def __init__(
+        self,
+        base_url=None,
+        default_headers=None,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+        timeout=30.0,
+    ):
+        """
+        Initializes the client and its pooled httpx.AsyncClient.
+
+        Args:
+            base_url: Base URL of the API (e.g. https://restful-booker.herokuapp.com).
+            default_headers: Headers sent with every request.
+            max_concurrency: Max number of requests in flight at once.
+            timeout: Default request timeout in seconds.
+        """
+        if base_url is None:
+            raise ValueError("base_url must be provided")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.base_url = base_url
+        self.default_headers = default_headers if default_headers is not None else {}
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+            timeout=timeout,
+        )
+
+    async def aclose(self):
+        """Closes the underlying httpx client and its pooled connections."""
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    def _make_url(self, endpoint):
+        # Ensure no double slashes if endpoint starts with /
+        endpoint = endpoint.lstrip("/")
+        return f"{self.base_url}/{endpoint}"
+
+    async def send_request(
+        self, method, endpoint, headers=None, json=None, params=None, data=None
+    ):
+        """Sends an HTTP request, waiting for a free concurrency slot first."""
+        full_url = self._make_url(endpoint)
+        request_headers = self.default_headers.copy()
+        if headers:
+            request_headers.update(headers)
+
+        # httpx splits requests' `data` into `content` (raw body) and `data` (form)
+        body = {"content": data} if isinstance(data, (str, bytes)) else {"data": data}
+        try:
+            async with self._semaphore:
+                response = await self.client.request(
+                    method,
+                    full_url,
+                    headers=request_headers,
+                    json=json,
+                    params=params,
+                    **body,
+                )
+            # Raise an exception for bad status codes (4xx or 5xx)
+            response.raise_for_status()
+            return response
+        except httpx.HTTPError as e:
+            logger.error("%s Request to %s failed: %s", method, full_url, e)
+            # Re-raise the exception so callers know the request failed
+            raise
+
+    @contextlib.asynccontextmanager
+    async def stream(self, method, endpoint, headers=None, params=None):
+        """
+        Async context manager for a response whose body is read lazily
+        (response.aiter_bytes()). The request holds a concurrency slot and a
+        connection until the block exits.
+        """
+        full_url = self._make_url(endpoint)
+        request_headers = self.default_headers.copy()
+        if headers:
+            request_headers.update(headers)
+        async with self._semaphore:
+            async with self.client.stream(
+                method, full_url, headers=request_headers, params=params
+            ) as response:
+                try:
+                    response.raise_for_status()
+                except httpx.HTTPStatusError as e:
+                    logger.error("%s Request to %s failed: %s", method, full_url, e)
+                    raise
+                yield response
+
+    async def get(self, endpoint, params=None, headers=None):
+        return await self.send_request("GET", endpoint, params=params, headers=headers)
+
+    async def post(self, endpoint, json=None, data=None, params=None, headers=None):
+        return await self.send_request(
+            "POST", endpoint, json=json, data=data, params=params, headers=headers
+        )
+
+    async def put(self, endpoint, json=None, data=None, params=None, headers=None):
+        return await self.send_request(
+            "PUT", endpoint, json=json, data=data, params=params, headers=headers
+        )
+
+    async def patch(self, endpoint, json=None, data=None, params=None, headers=None):
+        return await self.send_request(
+            "PATCH", endpoint, json=json, data=data, params=params, headers=headers
+        )
+
+    async def delete(self, endpoint, params=None, headers=None):
+        return await self.send_request(
+            "DELETE", endpoint, params=params, headers=headers
+        )
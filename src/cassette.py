@@ -0,0 +1,397 @@
+# src/cassette.py
+"""
+Record/replay cassettes for APIClient: run the tests without the network.
+
+In record mode every request that goes over the wire is appended, with its
+response, to a cassette file. In replay mode the responses are served from
+that file instead, through a memory-mapped hash index, so a lookup costs the
+same for 100 or 1,000,000 recorded interactions and only the bodies that are
+actually replayed are ever read.
+
+    cassette = Cassette("tests/cassettes/suite.cassette", mode="record")
+    client = APIClient(base_url, cassette=cassette)
+    ...
+    cassette.close()  # Writes the index
+
+A request is identified by its method, its URL without scheme and host (so a
+recording against the local server replays against any base URL), with the
+query parameters sorted, and a hash of its body (JSON bodies are compared
+with their keys sorted). Headers are not part of the key. A request that is
+made several times (GET the same booking before and after an update) gets
+the recorded responses in recording order; once those run out, replay keeps
+serving the last one, or fails in strict mode.
+
+Files: PATH holds the records, appended one after another; PATH.idx holds
+an open-addressing hash table of (key digest, record offset) slots. The
+index is rewritten on close(); if it is missing or does not match the
+records (a recording that was never closed), it is rebuilt by scanning the
+record headers.
+
+Replay is not transport-faithful: responses carry the recorded status,
+headers and body, but no connection or timing phases.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+from urllib.parse import parse_qsl, urlencode
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+MODES = ("record", "replay")
+
+_DATA_MAGIC = b"RBCAS1\n\0"
+_INDEX_MAGIC = b"RBCIDX1\0"
+# Record header: request key, status code, meta (JSON) length, body length
+_RECORD = struct.Struct("<16sHII")
+# Index header: data file size it was built for, slot count, entry count
+_INDEX_HEADER = struct.Struct("<8sQQQ")
+# Slot: key digest (of request key and occurrence), record offset (0 = empty)
+_SLOT = struct.Struct("<16sQ")
+
+
+class UnrecordedRequest(requests.exceptions.RequestException):
+    """Strict replay met a request (or a repeat of one) that was not recorded."""
+
+
+@dataclass
+class CassetteStats:
+    recorded: int = 0
+    played: int = 0  # Served from the cassette
+    repeated: int = 0  # Of those, replays of an exhausted request's last response
+    missed: int = 0  # Not in the cassette (sent over the network unless strict)
+
+    def as_dict(self):
+        return asdict(self)
+
+
+def _canonical_body(body):
+    if not body:
+        return b""
+    if isinstance(body, str):
+        body = body.encode()
+    if body[:1] in (b"{", b"["):
+        try:
+            value = json.loads(body)
+        except ValueError:
+            return body
+        return json.dumps(value, sort_keys=True, separators=(",", ":")).encode()
+    return body
+
+
+def request_key(method, url, body=None):
+    """
+    The 16-byte digest a request is recorded under (see the module docstring).
+
+    Args:
+        method: HTTP method.
+        url: Full URL, including any query string.
+        body: Request body (bytes, str or None).
+    """
+    # Cheaper than urlsplit, which dominated the cost of a replayed request
+    scheme_end = url.find("://")
+    path_start = url.find("/", scheme_end + 3) if scheme_end >= 0 else 0
+    path, _, query = (url[path_start:] if path_start >= 0 else "/").partition("?")
+    if query:
+        query = urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+    target = f"{method.upper()} {path}?{query}".encode()
+    body_hash = hashlib.blake2b(_canonical_body(body), digest_size=16).digest()
+    return hashlib.blake2b(target + b"\0" + body_hash, digest_size=16).digest()
+
+
+def _slot_digest(key, occurrence):
+    return hashlib.blake2b(
+        key + occurrence.to_bytes(4, "little"), digest_size=16
+    ).digest()
+
+
+def _build_index(entries, data_size):
+    """Index file contents for (slot digest, offset) entries; load factor <= 1/2."""
+    slots = 8
+    while slots < 2 * len(entries):
+        slots *= 2
+    mask = slots - 1
+    table = bytearray(_INDEX_HEADER.size + slots * _SLOT.size)
+    _INDEX_HEADER.pack_into(table, 0, _INDEX_MAGIC, data_size, slots, len(entries))
+    for digest, offset in entries:
+        slot = int.from_bytes(digest[:8], "little") & mask
+        while True:
+            position = _INDEX_HEADER.size + slot * _SLOT.size
+            if not _SLOT.unpack_from(table, position)[1]:
+                _SLOT.pack_into(table, position, digest, offset)
+                break
+            slot = (slot + 1) & mask
+    return table
+
+
+class Cassette:
+    """
+    One cassette file, opened for recording or for replay.
+
+    Thread-safe: one cassette can back a client shared by worker threads.
+    With concurrent repeats of the same request, which recorded response
+    each thread gets follows the order the requests reach the cassette.
+    """
+
+    def __init__(self, path, mode="replay", strict=False):
+        """
+        Args:
+            path: Cassette file; the index is kept next to it as PATH.idx.
+            mode: "record" appends the interactions sent through it (creating
+                the file if needed); "replay" serves recorded responses.
+            strict: In replay mode, raise UnrecordedRequest for requests that
+                were not recorded instead of sending them over the network.
+
+        Raises:
+            ValueError: Unknown mode, or PATH is not a cassette.
+            FileNotFoundError: Replaying a cassette that does not exist.
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode {mode!r}; expected {MODES}")
+        self.path = os.fspath(path)
+        self.index_path = self.path + ".idx"
+        self.mode = mode
+        self.strict = strict
+        self.stats = CassetteStats()
+        self._lock = threading.Lock()
+        self._occurrences = {}  # Request key -> times seen in this session
+        self._closed = False
+        if mode == "record":
+            self._open_for_recording()
+        else:
+            self._open_for_replay()
+
+    # --- Opening ---
+
+    def _scan(self, f, size):
+        """(slot digest, offset) of every record, from the record headers."""
+        entries, occurrences = [], {}
+        offset = len(_DATA_MAGIC)
+        while offset + _RECORD.size <= size:
+            f.seek(offset)
+            key, _, meta_length, body_length = _RECORD.unpack(f.read(_RECORD.size))
+            end = offset + _RECORD.size + meta_length + body_length
+            if end > size:
+                break  # A record cut short by an interrupted recording
+            occurrence = occurrences.get(key, 0)
+            occurrences[key] = occurrence + 1
+            entries.append((_slot_digest(key, occurrence), offset))
+            offset = end
+        return entries, occurrences, offset
+
+    def _check_magic(self, f):
+        f.seek(0)
+        if f.read(len(_DATA_MAGIC)) != _DATA_MAGIC:
+            raise ValueError(f"{self.path} is not a cassette file")
+
+    def _open_for_recording(self):
+        self._entries = []
+        if os.path.exists(self.path) and os.path.getsize(self.path):
+            with open(self.path, "r+b") as f:
+                self._check_magic(f)
+                size = os.fstat(f.fileno()).st_size
+                self._entries, self._occurrences, end = self._scan(f, size)
+                f.truncate(end)  # Drop a partial record at the tail
+        else:
+            with open(self.path, "wb") as f:
+                f.write(_DATA_MAGIC)
+        self._file = open(self.path, "ab")
+
+    def _open_for_replay(self):
+        with open(self.path, "rb") as f:
+            self._check_magic(f)
+            size = os.fstat(f.fileno()).st_size
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._index = self._map_index(size)
+            if self._index is None:
+                entries, _, _ = self._scan(f, size)
+                self._index = _build_index(entries, size)
+                self._write_index(self._index)
+        _, _, slots, self._count = _INDEX_HEADER.unpack_from(self._index, 0)
+        self._mask = slots - 1
+        self._last = {}  # Request key -> offset of the last response served
+
+    def _map_index(self, data_size):
+        """The mapped index, or None when it is missing or out of date."""
+        try:
+            with open(self.index_path, "rb") as f:
+                index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):  # ValueError: empty file
+            return None
+        if len(index) < _INDEX_HEADER.size or _INDEX_HEADER.unpack_from(index, 0)[
+            :2
+        ] != (_INDEX_MAGIC, data_size):
+            index.close()
+            return None
+        return index
+
+    def _write_index(self, contents):
+        temporary = f"{self.index_path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary, "wb") as f:
+                f.write(contents)
+            os.replace(temporary, self.index_path)
+        except OSError:
+            pass  # Read-only checkout: the in-memory index still works
+
+    # --- Recording ---
+
+    def record(self, request, response):
+        """Appends an interaction: a PreparedRequest and its (read) Response."""
+        key = request_key(request.method, request.url, request.body)
+        meta = json.dumps(
+            {
+                "method": request.method,
+                "url": request.url,
+                "reason": response.reason,
+                "headers": list(response.headers.items()),
+                "elapsed": response.elapsed.total_seconds(),
+            },
+            separators=(",", ":"),
+        ).encode()
+        body = response.content or b""
+        header = _RECORD.pack(key, response.status_code, len(meta), len(body))
+        with self._lock:
+            offset = self._file.tell()
+            self._file.write(header + meta + body)
+            occurrence = self._occurrences.get(key, 0)
+            self._occurrences[key] = occurrence + 1
+            self._entries.append((_slot_digest(key, occurrence), offset))
+            self.stats.recorded += 1
+
+    # --- Replay ---
+
+    def _find(self, digest):
+        slot = int.from_bytes(digest[:8], "little") & self._mask
+        while True:
+            found, offset = _SLOT.unpack_from(
+                self._index, _INDEX_HEADER.size + slot * _SLOT.size
+            )
+            if not offset:
+                return None
+            if found == digest:
+                return offset
+            slot = (slot + 1) & self._mask
+
+    def play(self, request):
+        """
+        The recorded Response for a PreparedRequest, or None when it was not
+        recorded (strict mode raises instead).
+
+        Raises:
+            UnrecordedRequest: In strict mode, for an unrecorded request or
+                one repeated more often than it was recorded.
+        """
+        key = request_key(request.method, request.url, request.body)
+        with self._lock:
+            occurrence = self._occurrences.get(key, 0)
+            self._occurrences[key] = occurrence + 1
+            offset = self._find(_slot_digest(key, occurrence))
+            if offset is not None:
+                self._last[key] = offset
+                self.stats.played += 1
+            elif key in self._last and not self.strict:
+                offset = self._last[key]
+                self.stats.played += 1
+                self.stats.repeated += 1
+            else:
+                self.stats.missed += 1
+        if offset is None:
+            if self.strict:
+                raise UnrecordedRequest(
+                    f"{request.method} {request.url} (occurrence {occurrence + 1}) "
+                    f"is not in cassette {self.path}",
+                    request=request,
+                )
+            return None
+        return self._response(request, offset)
+
+    def _response(self, request, offset):
+        _, status, meta_length, body_length = _RECORD.unpack_from(self._data, offset)
+        start = offset + _RECORD.size
+        meta = json.loads(self._data[start : start + meta_length])
+        response = requests.Response()
+        response.status_code = status
+        response.reason = meta["reason"]
+        response.headers = CaseInsensitiveDict(meta["headers"])
+        response._content = self._data[
+            start + meta_length : start + meta_length + body_length
+        ]
+        response._content_consumed = True
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url  # The replaying base URL, not the recorded one
+        response.request = request
+        response.elapsed = timedelta(0)
+        return response
+
+    # --- Lifecycle ---
+
+    def __len__(self):
+        """Number of recorded interactions."""
+        if self.mode == "record":
+            return len(self._entries)
+        return self._count
+
+    def close(self):
+        """Finishes a recording (writes the index) or releases the mapping."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self.mode == "record":
+                self._file.close()
+                size = os.path.getsize(self.path)
+                self._write_index(_build_index(self._entries, size))
+            else:
+                if isinstance(self._index, mmap.mmap):
+                    self._index.close()
+                self._data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class CassetteAdapter(BaseAdapter):
+    """
+    Transport adapter that records what `adapter` sends, or replays it.
+
+    Mounted in place of the client's HTTP adapter, so retries, hedging,
+    caching and instrumentation hooks all work unchanged on top of it.
+    """
+
+    def __init__(self, cassette, adapter):
+        super().__init__()
+        self.cassette = cassette
+        self.adapter = adapter
+
+    def send(self, request, **kwargs):
+        if self.cassette.mode == "replay":
+            started = time.perf_counter()
+            response = self.cassette.play(request)
+            if response is not None:
+                response.connection = self
+                response.elapsed = timedelta(seconds=time.perf_counter() - started)
+                return response
+            return self.adapter.send(request, **kwargs)
+        response = self.adapter.send(request, **kwargs)
+        self.cassette.record(request, response)
+        return response
+
+    def __getattr__(self, name):
+        # Pool settings and the pool manager are the wrapped adapter's
+        return getattr(self.adapter, name)
+
+    def close(self):
+        self.adapter.close()
@@ -0,0 +1,178 @@
+# src/codec.py
+"""
+Pluggable JSON codecs and the lazily decoded response APIClient returns.
+
+APIClient encodes `json=` bodies and decodes responses with one codec:
+
+- "stdlib": the json module (always available).
+- "orjson" / "msgspec": much faster C/Rust codecs, used when installed
+  (pip install orjson or msgspec).
+
+get_codec("auto") picks the fastest one installed. Every codec works on
+bytes directly, so neither side goes through an intermediate str.
+
+APIResponse wraps a requests.Response. json() decodes the body bytes on
+first use and returns the same object afterwards; treat it as read-only
+(copy before mutating), since a cached response shares it between callers.
+Everything else (status_code, headers, raise_for_status(), ...) is the
+underlying response's.
+"""
+
+import json
+
+import requests
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # Optional speed-up
+    msgspec = None
+
+
+class StdlibCodec:
+    """The json module; compact output, rejects NaN like requests does."""
+
+    name = "stdlib"
+
+    def __init__(self):
+        self._encoder = json.JSONEncoder(
+            separators=(",", ":"), ensure_ascii=False, allow_nan=False
+        )
+
+    def encode(self, obj):
+        return self._encoder.encode(obj).encode()
+
+    def decode(self, data):
+        return json.loads(data)  # Detects UTF-8/16/32 from the bytes
+
+
+class OrjsonCodec:
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+
+    def encode(self, obj):
+        return orjson.dumps(obj)
+
+    def decode(self, data):
+        return orjson.loads(data)
+
+
+class MsgspecCodec:
+    name = "msgspec"
+
+    def __init__(self):
+        if msgspec is None:
+            raise ImportError("msgspec is not installed")
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def encode(self, obj):
+        return self._encoder.encode(obj)
+
+    def decode(self, data):
+        return self._decoder.decode(data)
+
+
+CODECS = {"stdlib": StdlibCodec, "orjson": OrjsonCodec, "msgspec": MsgspecCodec}
+
+
+def available_codecs():
+    """Names of the codecs that can be used here, fastest first."""
+    names = []
+    if orjson is not None:
+        names.append("orjson")
+    if msgspec is not None:
+        names.append("msgspec")
+    names.append("stdlib")
+    return names
+
+
+def get_codec(codec="auto"):
+    """
+    Returns a codec instance.
+
+    Args:
+        codec: A codec name, "auto" (fastest installed), or an object with
+            encode(obj) -> bytes and decode(bytes) -> obj, returned as is.
+
+    Raises:
+        ValueError: Unknown codec name.
+        ImportError: The named codec's package is not installed.
+    """
+    if not isinstance(codec, str):
+        return codec
+    if codec == "auto":
+        codec = available_codecs()[0]
+    try:
+        return CODECS[codec]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown codec {codec!r}; expected one of {sorted(CODECS)} or 'auto'"
+        ) from None
+
+
+class APIResponse:
+    """A requests.Response whose JSON body is decoded once, on first use."""
+
+    __slots__ = ("raw", "codec", "_json", "_text")
+
+    _UNSET = object()
+
+    def __init__(self, raw, codec):
+        self.raw = raw
+        self.codec = codec
+        self._json = self._UNSET
+        self._text = None
+
+    def json(self):
+        """
+        The decoded body (the same object on every call).
+
+        Raises:
+            requests.exceptions.JSONDecodeError: The body is not valid JSON.
+        """
+        if self._json is self._UNSET:
+            content = self.raw.content
+            try:
+                self._json = self.codec.decode(content)
+            except ValueError as e:  # Every codec's decode error is a ValueError
+                raise requests.exceptions.JSONDecodeError(
+                    str(e), content.decode("utf-8", "replace"), 0
+                ) from e
+        return self._json
+
+    @property
+    def text(self):
+        """The body as str, decoded once (UTF-8 unless the server says otherwise)."""
+        if self._text is None:
+            # requests would guess a missing charset by scanning the whole body
+            self._text = self.raw.content.decode(
+                self.raw.encoding or "utf-8", "replace"
+            )
+        return self._text
+
+    def __getattr__(self, name):
+        return getattr(self.raw, name)
+
+    def __bool__(self):
+        return bool(self.raw)  # requests: True unless 4xx/5xx
+
+    def __iter__(self):
+        return iter(self.raw)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.raw.close()
+
+    def __repr__(self):
+        codec = getattr(self.codec, "name", type(self.codec).__name__)
+        return f"<APIResponse [{self.raw.status_code}] via {codec}>"
@@ -1,36 +1,226 @@
 # src/config.py
-import os
-from dotenv import load_dotenv
+"""
+Settings for the API under test, resolved lazily.
+
+Nothing is read at import time: the first access to a setting loads the
+active profile (API_PROFILE, default "env") and caches it, so importing
+any module of `src` costs nothing here and never fails for lack of
+API_BASE_URL. Only code that actually needs the target raises.
+
+Profiles:
+    env       .env file and environment variables (API_BASE_URL,
+              API_USERNAME, API_PASSWORD), as before
+    postman   Postman/environment/restful-booking.postman_environment.json
+              ({{url}} is the base URL)
+    local     A standalone local server on port 3001
+              (python -m src.local_server --port 3001)
+    PATH      Any other *.postman_environment.json export
 
-# Load variables from .env file into environment variables
-load_dotenv()
+The module-level names (BASE_URL, AUTH_URL, ...) still work and always
+reflect the active settings:
 
-# It's better to raise an error if critical config is missing
-BASE_URL = os.getenv("API_BASE_URL")
-if not BASE_URL:
-    raise ValueError("API_BASE_URL environment variable not set.")
+    from src import config
+    config.BASE_URL                                   # Active profile
+    config.load_settings("postman").booking_url       # Another profile
+    config.load_settings(base_url="http://x:3001")    # Per-instance override
+    previous = config.configure(profile="local")      # Switch this process
+"""
 
-# Construct endpoints from base URL
-AUTH_URL = f"{BASE_URL}/auth"
-HEALTHCHECK_URL = f"{BASE_URL}/ping"
-BOOKING_URL = f"{BASE_URL}/booking"
+import dataclasses
+import functools
+import json
+import os
 
-# Get credentials from environment variables
-AUTH_USERNAME = os.getenv(
-    "API_USERNAME", "admin"
-)  # Provide default or raise error if needed
-AUTH_PASSWORD = os.getenv(
-    "API_PASSWORD", "password123"
-)  # Provide default or raise error if needed
+# Environment variable naming the default profile
+PROFILE_VARIABLE = "API_PROFILE"
+DEFAULT_PROFILE = "env"
 
+POSTMAN_ENVIRONMENT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "Postman",
+    "environment",
+    "restful-booking.postman_environment.json",
+)
+LOCAL_BASE_URL = "http://127.0.0.1:3001"
 
 DEFAULT_HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
 
-# Example of how you might load default test data (optional)
-# import json
-# DEFAULT_BOOKING_DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'tests', 'data', 'booking_data.json')
-# try:
-#     with open(DEFAULT_BOOKING_DATA_PATH, 'r') as f:
-#         DEFAULT_BOOKING_DATA = json.load(f)
-# except FileNotFoundError:
-#     DEFAULT_BOOKING_DATA = {} # Or handle error
+
+class ConfigurationError(ValueError):
+    """A setting is missing, or a profile cannot be loaded."""
+
+
+@dataclasses.dataclass(frozen=True)
+class Settings:
+    """One target: its base URL and credentials. Endpoint URLs derive from it."""
+
+    base_url: str
+    username: str = "admin"
+    password: str = "password123"
+    profile: str = DEFAULT_PROFILE  # Where these settings came from
+
+    def __post_init__(self):
+        if not self.base_url:
+            raise ConfigurationError(
+                f"No base URL in the {self.profile!r} profile "
+                "(set the API_BASE_URL environment variable)."
+            )
+        # Endpoints are built as f"{base_url}/path"
+        object.__setattr__(self, "base_url", self.base_url.rstrip("/"))
+
+    @property
+    def auth_url(self):
+        return f"{self.base_url}/auth"
+
+    @property
+    def healthcheck_url(self):
+        return f"{self.base_url}/ping"
+
+    @property
+    def booking_url(self):
+        return f"{self.base_url}/booking"
+
+    def replace(self, **overrides):
+        """A copy with some fields changed (e.g. base_url for one worker)."""
+        return dataclasses.replace(self, **overrides)
+
+
+def _credentials():
+    return {
+        "username": os.getenv("API_USERNAME", "admin"),
+        "password": os.getenv("API_PASSWORD", "password123"),
+    }
+
+
+def _env_profile():
+    # Imported here: python-dotenv is only needed once something asks
+    from dotenv import load_dotenv
+
+    # Load variables from .env file into environment variables
+    load_dotenv()
+    return Settings(base_url=os.getenv("API_BASE_URL"), profile="env", **_credentials())
+
+
+def _postman_profile(path=POSTMAN_ENVIRONMENT, profile="postman"):
+    try:
+        with open(path, encoding="utf-8") as f:
+            values = json.load(f).get("values") or []
+    except (OSError, ValueError) as e:
+        raise ConfigurationError(f"Cannot load Postman environment {path}: {e}") from e
+    variables = {v["key"]: v.get("value", "") for v in values if v.get("enabled", True)}
+    credentials = _credentials()  # Exports carry no credentials; env may
+    for field in credentials:
+        credentials[field] = variables.get(field) or credentials[field]
+    return Settings(base_url=variables.get("url"), profile=profile, **credentials)
+
+
+def _local_profile():
+    return Settings(base_url=LOCAL_BASE_URL, profile="local", **_credentials())
+
+
+PROFILES = {
+    "env": _env_profile,
+    "postman": _postman_profile,
+    "local": _local_profile,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _load_profile(profile):
+    loader = PROFILES.get(profile)
+    if loader is not None:
+        return loader()
+    if profile.endswith(".json"):
+        return _postman_profile(profile, profile=profile)
+    raise ConfigurationError(
+        f"Unknown profile {profile!r}: use one of {', '.join(PROFILES)} "
+        "or a path to a Postman environment export"
+    )
+
+
+def load_settings(profile=None, **overrides):
+    """
+    Settings of a profile, with optional per-instance overrides.
+
+    Args:
+        profile: Profile name or Postman environment path (default: the
+            API_PROFILE environment variable, else "env").
+        **overrides: Settings fields to replace (base_url, username, password).
+
+    Returns:
+        Settings: Profiles are loaded once and cached; overrides return a copy.
+
+    Raises:
+        ConfigurationError: The profile is unknown or has no base URL.
+    """
+    profile = profile or os.getenv(PROFILE_VARIABLE) or DEFAULT_PROFILE
+    if overrides.get("base_url"):
+        # A complete target needs nothing from the profile but credentials
+        try:
+            settings = _load_profile(profile)
+        except ConfigurationError:
+            settings = Settings(
+                overrides["base_url"], profile=profile, **_credentials()
+            )
+        return settings.replace(**overrides)
+    settings = _load_profile(profile)
+    return settings.replace(**overrides) if overrides else settings
+
+
+_active = None  # Set by configure(); None follows API_PROFILE
+
+
+def get_settings():
+    """The settings the module-level names (config.BASE_URL, ...) resolve to."""
+    return _active if _active is not None else load_settings()
+
+
+def configure(settings=None, *, profile=None, **overrides):
+    """
+    Switches the active settings for this process (e.g. one pytest worker).
+
+    Args:
+        settings: A Settings instance to activate, or None to load `profile`
+            with `overrides` (with neither, go back to following API_PROFILE).
+        profile: Profile name or Postman environment path.
+        **overrides: Settings fields to replace.
+
+    Returns:
+        The previously active Settings (or None), to restore later.
+    """
+    global _active
+    previous = _active
+    if settings is None and (profile or overrides):
+        settings = load_settings(profile, **overrides)
+    _active = settings
+    return previous
+
+
+def reset():
+    """Forgets the active settings and every cached profile (re-reads env)."""
+    global _active
+    _active = None
+    _load_profile.cache_clear()
+
+
+# Module-level names kept for existing callers, resolved on every access
+_SETTING_NAMES = {
+    "BASE_URL": "base_url",
+    "AUTH_URL": "auth_url",
+    "HEALTHCHECK_URL": "healthcheck_url",
+    "BOOKING_URL": "booking_url",
+    "AUTH_USERNAME": "username",
+    "AUTH_PASSWORD": "password",
+}
+
+
+def __getattr__(name):
+    try:
+        attribute = _SETTING_NAMES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return getattr(get_settings(), attribute)
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_SETTING_NAMES))
@@ -0,0 +1,287 @@
+# src/contracts.py
+"""
+Response contracts for /auth, /ping and /booking, compiled to fast validators.
+
+Each contract is a small JSON-Schema-like description of a response body.
+The first time a contract is used, it is compiled to the source of one
+specialized Python function. That function does straight-line type checks
+with no schema walking at run time, and it is cached. So validating a
+booking costs a few microseconds, cheap enough for every response of a
+soak run. The first failure raises ContractViolation with the path of the
+offending value, e.g. "$.booking.bookingdates.checkout".
+
+Supported schema keywords: type (object, array, string, integer, number,
+boolean), required, properties, additionalProperties (False only), items,
+const, minLength, format ("date": an ISO date) and ordered (object fields
+that must not decrease, e.g. checkin <= checkout).
+
+Usage:
+    validate_response("booking", response)          # Raises ContractViolation
+    assert_contract(response, "booking_created")    # In tests: AssertionError
+    BookingHelper(client, validate=True)            # Validates every response
+"""
+
+import functools
+import re
+from datetime import date
+
+# --- Contracts ---
+
+_DATE = {"type": "string", "format": "date"}
+
+BOOKING_SCHEMA = {
+    "type": "object",
+    "required": ["firstname", "lastname", "totalprice", "depositpaid", "bookingdates"],
+    "properties": {
+        "firstname": {"type": "string"},
+        "lastname": {"type": "string"},
+        "totalprice": {"type": "number"},
+        "depositpaid": {"type": "boolean"},
+        "bookingdates": {
+            "type": "object",
+            "required": ["checkin", "checkout"],
+            "properties": {"checkin": _DATE, "checkout": _DATE},
+            "ordered": ["checkin", "checkout"],
+        },
+        "additionalneeds": {"type": "string"},
+    },
+}
+
+CONTRACTS = {
+    # POST /auth with valid credentials
+    "auth": {
+        "type": "object",
+        "required": ["token"],
+        "properties": {"token": {"type": "string", "minLength": 1}},
+    },
+    # GET /ping (a text body)
+    "ping": {"type": "string", "const": "Created"},
+    # GET /booking
+    "booking_ids": {
+        "type": "array",
+        "items": {
+            "type": "object",
+            "required": ["bookingid"],
+            "properties": {"bookingid": {"type": "integer"}},
+        },
+    },
+    # POST /booking
+    "booking_created": {
+        "type": "object",
+        "required": ["bookingid", "booking"],
+        "properties": {"bookingid": {"type": "integer"}, "booking": BOOKING_SCHEMA},
+    },
+    # GET/PUT/PATCH /booking/{id}
+    "booking": BOOKING_SCHEMA,
+}
+# Contracts whose body is text rather than JSON
+_TEXT_CONTRACTS = frozenset({"ping"})
+
+
+class ContractViolation(ValueError):
+    """A response body does not match its contract."""
+
+    def __init__(self, contract, path, message):
+        super().__init__(f"{contract}: {path}: {message}")
+        self.contract = contract
+        self.path = path
+        self.message = message
+
+
+# --- Compiler ---
+
+_TYPE_CHECKS = {
+    # type() identity is faster than isinstance and keeps bool out of integer
+    "object": "type({v}) is not dict",
+    "array": "type({v}) is not list",
+    "string": "type({v}) is not str",
+    "integer": "type({v}) is not int",
+    "number": "type({v}) is not int and type({v}) is not float",
+    "boolean": "type({v}) is not bool",
+}
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _is_date(value):
+    if not _ISO_DATE.fullmatch(value):
+        return False
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _path_expr(path):
+    """
+    Source for a path given as parts: strings are fixed, 1-tuples hold an
+    expression (an array index). Adjacent fixed parts are joined at compile
+    time; the expression only runs once validation has failed.
+    """
+    pieces, text = [], ""
+    for part in path:
+        if isinstance(part, str):
+            text += part
+            continue
+        if text:
+            pieces.append(repr(text))
+            text = ""
+        pieces.append(f"str({part[0]})")
+    if text or not pieces:
+        pieces.append(repr(text))
+    return " + ".join(pieces)
+
+
+class _Compiler:
+    """Turns one schema into the source of a validate(data) function."""
+
+    def __init__(self, name):
+        self.name = name
+        self.lines = ["def validate(data):"]
+        self.constants = {}
+        self._names = 0
+
+    def _var(self, prefix):
+        self._names += 1
+        return f"{prefix}{self._names}"
+
+    def _const(self, value):
+        name = self._var("_c")
+        self.constants[name] = value
+        return name
+
+    def _emit(self, indent, line):
+        self.lines.append("    " * indent + line)
+
+    def _fail(self, indent, path, message):
+        self._emit(indent, f"_fail({_path_expr(path)}, {message!r})")
+
+    def compile(self, schema, var, path, indent):
+        kind = schema.get("type")
+        if kind not in _TYPE_CHECKS:
+            raise ValueError(
+                f"{self.name}: unsupported type {kind!r} at {_path_expr(path)}"
+            )
+        self._emit(indent, f"if {_TYPE_CHECKS[kind].format(v=var)}:")
+        self._fail(indent + 1, path, f"expected {kind}")
+        if "const" in schema:
+            self._emit(indent, f"if {var} != {self._const(schema['const'])}:")
+            self._fail(indent + 1, path, f"expected {schema['const']!r}")
+        if kind == "string":
+            if "minLength" in schema:
+                self._emit(indent, f"if len({var}) < {int(schema['minLength'])}:")
+                self._fail(indent + 1, path, f"shorter than {schema['minLength']}")
+            if schema.get("format") == "date":
+                self._emit(indent, f"if not _is_date({var}):")
+                self._fail(indent + 1, path, "not an ISO date (YYYY-MM-DD)")
+        elif kind == "object":
+            self._compile_object(schema, var, path, indent)
+        elif kind == "array" and "items" in schema:
+            index, item = self._var("i"), self._var("v")
+            self._emit(indent, f"for {index}, {item} in enumerate({var}):")
+            # An index is only known at run time, so it stays a variable
+            item_path = (*path, "[", (index,), "]")
+            self.compile(schema["items"], item, item_path, indent + 1)
+
+    def _compile_object(self, schema, var, path, indent):
+        required = schema.get("required", ())
+        properties = schema.get("properties", {})
+        for field in required:
+            self._emit(indent, f"if {field!r} not in {var}:")
+            self._fail(indent + 1, (*path, f".{field}"), "missing")
+        for field, subschema in properties.items():
+            child = self._var("v")
+            child_path = (*path, f".{field}")
+            if field in required:
+                self._emit(indent, f"{child} = {var}[{field!r}]")
+                self.compile(subschema, child, child_path, indent)
+            else:
+                self._emit(indent, f"{child} = {var}.get({field!r})")
+                self._emit(indent, f"if {child} is not None:")
+                self.compile(subschema, child, child_path, indent + 1)
+        if schema.get("additionalProperties") is False:
+            extra = self._var("x")
+            allowed = self._const(frozenset(properties))
+            self._emit(indent, f"{extra} = {var}.keys() - {allowed}")
+            self._emit(indent, f"if {extra}:")
+            self._fail(indent + 1, (*path, ".", (f"min({extra})",)), "not allowed")
+        ordered = schema.get("ordered")
+        if ordered:
+            # ISO dates (and numbers) compare correctly as they are
+            for before, after in zip(ordered, ordered[1:]):
+                self._emit(indent, f"if {var}[{after!r}] < {var}[{before!r}]:")
+                self._fail(indent + 1, (*path, f".{after}"), f"is before {before}")
+
+    def build(self, schema):
+        self.compile(schema, "data", ("$",), 1)
+        source = "\n".join(self.lines)
+        name = self.name
+
+        def _fail(path, message):
+            raise ContractViolation(name, path, message)
+
+        namespace = {"_fail": _fail, "_is_date": _is_date, **self.constants}
+        exec(compile(source, f"<contract {name}>", "exec"), namespace)
+        validate = namespace["validate"]
+        validate.__doc__ = f"Validates a body against the {name!r} contract."
+        validate.source = source  # For debugging a contract
+        return validate
+
+
+def compile_schema(schema, name="schema"):
+    """Compiles `schema` to a validate(data) function (not cached)."""
+    return _Compiler(name).build(schema)
+
+
+@functools.cache
+def get_validator(contract):
+    """The compiled validator for a named contract, compiled on first use."""
+    try:
+        schema = CONTRACTS[contract]
+    except KeyError:
+        raise ValueError(
+            f"Unknown contract {contract!r}; expected one of {sorted(CONTRACTS)}"
+        ) from None
+    return compile_schema(schema, contract)
+
+
+# --- Entry points ---
+
+
+def validate_response(contract, response):
+    """
+    Validates a response body against a named contract; returns the response.
+
+    Raises:
+        ContractViolation: The body does not match (also when it is not JSON).
+    """
+    validate = get_validator(contract)
+    if contract in _TEXT_CONTRACTS:
+        validate(response.text)
+        return response
+    try:
+        body = response.json()
+    except ValueError as e:
+        raise ContractViolation(contract, "$", f"not JSON: {e}") from None
+    validate(body)
+    return response
+
+
+def assert_contract(response, contract, status=None):
+    """
+    pytest assertion helper: fails with the violation's path and message.
+
+    Args:
+        response: Response to check.
+        contract: Contract name (see CONTRACTS).
+        status: Expected status code, checked first when given.
+    """
+    __tracebackhide__ = True  # Report the failure at the caller's line
+    if status is not None and response.status_code != status:
+        raise AssertionError(
+            f"Expected {status}, got {response.status_code}. Body: {response.text}"
+        )
+    try:
+        validate_response(contract, response)
+    except ContractViolation as e:
+        raise AssertionError(f"Contract violation: {e}") from None
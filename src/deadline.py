@@ -0,0 +1,94 @@
+# src/deadline.py
+"""
+Request timeouts and deadline budgets.
+
+Every APIClient request has a (connect, read) timeout: the client default,
+or the per-call override. A deadline is an overall budget for a block of
+work (including re-authentication retries and hedged duplicates): inside
+
+    with deadline(2.0):
+        helper.update_booking(booking_id, data)
+
+each request's timeouts are clamped to the time left, and a request that
+would start after the budget is spent raises DeadlineExceeded instead.
+
+Deadlines live in a ContextVar, so they follow the code that set them
+(including asyncio tasks) but not plain worker threads; nested deadlines
+keep the earliest expiry.
+"""
+
+import contextlib
+import time
+from contextvars import ContextVar
+
+import requests
+
+# (connect, read) seconds. Read is per socket read, not the whole response.
+DEFAULT_TIMEOUT = (10.0, 30.0)
+
+_current = ContextVar("api_deadline", default=None)
+
+
+class DeadlineExceeded(requests.exceptions.Timeout):
+    """The deadline budget ran out before (or while) a request was made."""
+
+
+class Deadline:
+    """A point in (monotonic) time by which work must be finished."""
+
+    __slots__ = ("expires_at",)
+
+    def __init__(self, seconds):
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self):
+        return self.expires_at - time.monotonic()
+
+    @property
+    def expired(self):
+        return self.remaining() <= 0
+
+
+@contextlib.contextmanager
+def deadline(seconds):
+    """Runs the block under a deadline of `seconds` (nested: earliest wins)."""
+    new = Deadline(seconds)
+    outer = _current.get()
+    if outer is not None and outer.expires_at < new.expires_at:
+        new = outer
+    token = _current.set(new)
+    try:
+        yield new
+    finally:
+        _current.reset(token)
+
+
+def current_deadline():
+    """The Deadline governing the current context, or None."""
+    return _current.get()
+
+
+def normalize_timeout(timeout):
+    """Accepts seconds or a (connect, read) pair; returns the pair."""
+    if isinstance(timeout, (tuple, list)):
+        connect, read = timeout
+        return connect, read
+    return timeout, timeout
+
+
+def effective_timeout(timeout):
+    """
+    (connect, read) for the next request: `timeout` clamped to the current
+    deadline. Raises DeadlineExceeded when no budget is left.
+    """
+    connect, read = normalize_timeout(timeout)
+    budget = _current.get()
+    if budget is None:
+        return connect, read
+    remaining = budget.remaining()
+    if remaining <= 0:
+        raise DeadlineExceeded("Deadline exceeded before sending the request")
+    return (
+        remaining if connect is None else min(connect, remaining),
+        remaining if read is None else min(read, remaining),
+    )
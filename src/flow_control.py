@@ -0,0 +1,301 @@
+# src/flow_control.py
+"""
+Client-side flow control for bulk traffic: rate limiting, adaptive
+concurrency and throttle handling.
+
+FlowControl sits in front of every request an APIClient puts on the wire:
+
+- TokenBucket caps the request rate (optional).
+- AIMDLimiter caps requests in flight. The cap grows by one per window of
+  healthy responses (additive increase) and halves on throttling, server
+  errors or a latency spike over the observed baseline (multiplicative
+  decrease), the same way TCP finds a link's capacity.
+- 429/503 responses are retried up to max_retries times. A Retry-After
+  header pauses all of the client's traffic for that long; without one,
+  the retry backs off exponentially with jitter.
+
+Every wait respects the active src.deadline budget.
+
+Usage:
+    client = APIClient(base_url, pool_maxsize=32, flow_control=FlowControl(max_concurrency=32))
+    helper.create_bookings(payloads)  # Runs at what the server sustains
+"""
+
+import email.utils
+import random
+import threading
+import time
+from dataclasses import asdict, dataclass
+
+import requests
+
+from src.deadline import DeadlineExceeded, current_deadline
+
+THROTTLE_STATUSES = frozenset({429, 503})
+# Outcomes reported to the limiter
+OK, THROTTLED, FAILED = "ok", "throttled", "failed"
+
+
+def parse_retry_after(value, now=None):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    now = time.time() if now is None else now
+    return max(when.timestamp() - now, 0.0)
+
+
+def sleep_within_deadline(seconds):
+    """Sleeps, or raises DeadlineExceeded if the budget would run out first."""
+    budget = current_deadline()
+    if budget is not None and budget.remaining() < seconds:
+        raise DeadlineExceeded(f"Deadline exceeded while waiting {seconds:.3f}s")
+    if seconds > 0:
+        time.sleep(seconds)
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` requests per second, `burst` at once."""
+
+    def __init__(self, rate, burst=None, clock=time.monotonic):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._clock = clock
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Takes a token and returns how long the caller must wait to use it."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            # Going negative queues callers fairly: each waits for its own token
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self):
+        sleep_within_deadline(self.reserve())
+
+
+class AIMDLimiter:
+    """
+    Adaptive cap on requests in flight (additive increase, multiplicative
+    decrease).
+
+    The latency baseline is the lowest recent latency; it drifts up slowly
+    so a server that is simply slower (not overloaded) is not punished.
+    """
+
+    def __init__(
+        self,
+        initial=4,
+        min_limit=1,
+        max_limit=64,
+        backoff=0.5,
+        latency_tolerance=2.0,
+        baseline_drift=0.01,
+    ):
+        """
+        Args:
+            initial: Starting limit.
+            min_limit: Floor the limit never drops below.
+            max_limit: Ceiling the limit never grows beyond.
+            backoff: Factor applied to the limit on a decrease.
+            latency_tolerance: A response slower than this multiple of the
+                baseline latency counts as congestion.
+            baseline_drift: Fraction the baseline may rise per response.
+        """
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("Expected 1 <= min_limit <= initial <= max_limit")
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.baseline_drift = baseline_drift
+        self.in_flight = 0
+        self.peak_limit = self.limit
+        self.decreases = 0
+        self._baseline = None
+        self._last_decrease = float("-inf")
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        """Waits (within any deadline) until a request may be sent."""
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                budget = current_deadline()
+                timeout = None if budget is None else budget.remaining()
+                if timeout is not None and timeout <= 0:
+                    raise DeadlineExceeded("Deadline exceeded waiting for a slot")
+                self._cond.wait(timeout)
+            self.in_flight += 1
+
+    def release(self, latency, outcome):
+        """Returns a slot and adapts the limit to how the request went."""
+        with self._cond:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if outcome == OK:
+                if self._baseline is None:
+                    self._baseline = latency
+                else:
+                    self._baseline = min(
+                        latency, self._baseline * (1 + self.baseline_drift)
+                    )
+                if latency > self.latency_tolerance * self._baseline:
+                    self._decrease(now, latency)
+                else:
+                    # +1 per `limit` healthy responses, i.e. per round trip
+                    self.limit = min(self.limit + 1 / self.limit, self.max_limit)
+                    self.peak_limit = max(self.peak_limit, self.limit)
+            else:
+                self._decrease(now, latency)
+            self._cond.notify_all()
+
+    def _decrease(self, now, latency):
+        # A burst of bad responses reflects one overload event, so cut at
+        # most once per round trip
+        if now - self._last_decrease < max(latency, self._baseline or 0.0):
+            return
+        self._last_decrease = now
+        self.limit = max(self.limit * self.backoff, self.min_limit)
+        self.decreases += 1
+
+
+@dataclass
+class FlowStats:
+    """Counters for a FlowControl."""
+
+    requests: int = 0  # Attempts sent, retries included
+    throttled: int = 0  # 429/503 responses
+    retries: int = 0
+    failed: int = 0  # Server errors and transport failures
+    waited: float = 0.0  # Seconds spent sleeping on Retry-After/backoff
+
+    def as_dict(self):
+        return asdict(self)
+
+
+class FlowControl:
+    """Rate limit + adaptive concurrency + throttle retries for one APIClient."""
+
+    def __init__(
+        self,
+        rate=None,
+        burst=None,
+        max_concurrency=64,
+        initial_concurrency=4,
+        min_concurrency=1,
+        latency_tolerance=2.0,
+        max_retries=3,
+        backoff=0.1,
+        max_backoff=30.0,
+    ):
+        """
+        Args:
+            rate: Max requests per second (None: unlimited).
+            burst: Requests allowed back to back before `rate` applies.
+            max_concurrency: Upper bound for the adaptive in-flight limit.
+                Keep the client's pool_maxsize (and batch workers) at least
+                this large.
+            initial_concurrency: Limit to start probing from.
+            min_concurrency: Floor for the limit.
+            latency_tolerance: Latency multiple over baseline that counts
+                as congestion.
+            max_retries: Retries of a throttled (429/503) request.
+            backoff: First retry delay when there is no Retry-After.
+            max_backoff: Cap on any single wait, Retry-After included.
+        """
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.limiter = AIMDLimiter(
+            initial=initial_concurrency,
+            min_limit=min_concurrency,
+            max_limit=max_concurrency,
+            latency_tolerance=latency_tolerance,
+        )
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.stats = FlowStats()
+        self._hold_until = 0.0  # Monotonic time before which nothing is sent
+        self._lock = threading.Lock()
+
+    @property
+    def max_concurrency(self):
+        return self.limiter.max_limit
+
+    def hold(self, seconds):
+        """Pauses all new requests for `seconds` (server asked us to back off)."""
+        with self._lock:
+            self._hold_until = max(self._hold_until, time.monotonic() + seconds)
+
+    def send(self, attempt):
+        """Runs attempt() under flow control, retrying throttled responses."""
+        for retry in range(self.max_retries + 1):
+            sleep_within_deadline(self._hold_until - time.monotonic())
+            if self.bucket is not None:
+                self.bucket.acquire()
+            self.limiter.acquire()
+            outcome = FAILED
+            started = time.perf_counter()
+            try:
+                response = attempt()
+                outcome = OK
+                return response
+            except requests.exceptions.HTTPError as e:
+                status = e.response.status_code if e.response is not None else None
+                if status in THROTTLE_STATUSES:
+                    outcome = THROTTLED
+                    if retry == self.max_retries:
+                        raise
+                    wait = self._retry_wait(e.response, retry)
+                elif status is not None and status < 500:
+                    outcome = OK  # The server is healthy; the request was not
+                    raise
+                else:
+                    raise
+            finally:
+                self.limiter.release(time.perf_counter() - started, outcome)
+                with self._lock:
+                    self.stats.requests += 1
+                    if outcome == THROTTLED:
+                        self.stats.throttled += 1
+                    elif outcome == FAILED:
+                        self.stats.failed += 1
+            with self._lock:
+                self.stats.retries += 1
+                self.stats.waited += wait
+            sleep_within_deadline(wait)
+
+    def _retry_wait(self, response, retry):
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            wait = min(retry_after, self.max_backoff)
+            self.hold(wait)  # Server-wide: everyone on this client waits
+            return wait
+        # Exponential backoff with full jitter
+        return random.uniform(0, min(self.backoff * 2**retry, self.max_backoff))
+
+    def summary(self):
+        stats = self.stats
+        return (
+            f"{stats.requests} requests, {stats.throttled} throttled, "
+            f"{stats.retries} retries ({stats.waited:.2f}s waiting), "
+            f"{stats.failed} failed; concurrency limit {self.limiter.limit:.1f} "
+            f"(peak {self.limiter.peak_limit:.1f}, {self.limiter.decreases} cuts)"
+        )
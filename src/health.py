@@ -1,5 +1,49 @@
-import config as cfg  # Imports configuration like the health check URL
+# src/health.py
+"""
+Health checks for restful-booker deployments.
+
+check_api_health(api_client) is a single blocking /ping. HealthMonitor is
+the long-running mode: it probes /ping on many base URLs concurrently, at a
+fixed interval, from one asyncio loop, with one keep-alive connection per
+target. Each target keeps a rolling window of latency histograms and
+success counts, so memory stays bounded however long it runs. Latency and
+availability are checked against an SLO after every round; breaches are
+logged when they start and clear, and the whole state is available as JSON.
+
+Usage:
+    python -m src.health                                  # One check of API_BASE_URL
+    python -m src.health --monitor \\
+        --target prod=https://restful-booker.herokuapp.com \\
+        --target staging=http://localhost:3001 \\
+        --interval 5 --slo-latency-ms 300 --serve 127.0.0.1:8090
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+
+import httpx
+
+from src import config as cfg  # Imports configuration like the health check URL
 from src.api_client import APIClient  # Imports the client used to make API requests
+from src.async_api_client import AsyncAPIClient
+from src.histogram import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+# restful-booker's /ping answers 201 Created
+_HEALTHY_STATUSES = frozenset({200, 201})
+
+
+def _health_endpoint():
+    # Relative to BASE_URL, like the other helpers' endpoints
+    return cfg.HEALTHCHECK_URL.replace(cfg.BASE_URL, "")
 
 
 def check_api_health(api_client):
@@ -14,10 +58,10 @@ def check_api_health(api_client):
     """
     try:
         # Use the provided API client to make a GET request to the health check URL
-        response = api_client.get(cfg.healthcheck_url)  #
+        response = api_client.get(_health_endpoint())
 
         # Check if we got a response and the status code is 200 (OK) or 201 (Created)
-        if response and response.status_code in [200, 201]:
+        if response and response.status_code in _HEALTHY_STATUSES:
             print(f"Health check successful (Status: {response.status_code}).")
             return True
         else:
@@ -33,10 +77,403 @@ def check_api_health(api_client):
         return False
 
 
-# This part only runs when you execute this script directly
-if __name__ == "__main__":
+# --- Monitoring ---
+
+
+@dataclass(frozen=True)
+class SLO:
+    """Latency and availability objectives, evaluated over the rolling window."""
+
+    latency_percentile: float = 99.0
+    latency_threshold: float = 0.5  # Seconds
+    availability: float = 0.999  # Fraction of successful probes
+    min_probes: int = 5  # Too few probes in the window to judge below this
+
+
+class RollingWindow:
+    """
+    Probe results for the last `window` seconds, in `buckets` time slices.
+
+    Each slice holds a LatencyHistogram and success/failure counts. Old
+    slices are reused in place, so memory is fixed by the bucket count and
+    histogram precision, not by the number of probes.
+    """
+
+    def __init__(self, window=300.0, buckets=30, clock=time.monotonic):
+        if window <= 0 or buckets < 1:
+            raise ValueError("window and buckets must be positive")
+        self.window = window
+        self.bucket_width = window / buckets
+        self.clock = clock
+        # Per slice: [slice number, histogram, ok count, failed count]
+        self._slices = [[None, LatencyHistogram(), 0, 0] for _ in range(buckets)]
+
+    def _slice(self, now):
+        number = math.floor(now / self.bucket_width)
+        entry = self._slices[number % len(self._slices)]
+        if entry[0] != number:  # Stale slice from an earlier lap: recycle it
+            entry[:] = [number, LatencyHistogram(), 0, 0]
+        return entry
+
+    def record(self, latency, ok):
+        """Records one probe; failed probes only count against availability."""
+        entry = self._slice(self.clock())
+        if ok:
+            entry[1].record(latency)
+            entry[2] += 1
+        else:
+            entry[3] += 1
+
+    def snapshot(self):
+        """(merged latency histogram, ok count, failed count) for the window."""
+        oldest = math.floor(self.clock() / self.bucket_width) - len(self._slices) + 1
+        merged, ok, failed = LatencyHistogram(), 0, 0
+        for number, histogram, slice_ok, slice_failed in self._slices:
+            if number is not None and number >= oldest:
+                merged.merge(histogram)
+                ok += slice_ok
+                failed += slice_failed
+        return merged, ok, failed
+
+
+class TargetHealth:
+    """Rolling state of one monitored deployment."""
+
+    def __init__(self, name, base_url, window, buckets, clock):
+        self.name = name
+        self.base_url = base_url.rstrip("/")
+        self.window = RollingWindow(window, buckets, clock)
+        self.last_status = None
+        self.last_error = None
+        self.last_latency = None
+        self.last_probe_at = None  # Wall-clock ISO timestamp
+        self.consecutive_failures = 0
+        self.breaches = []  # Names of the SLO objectives currently missed
+
+    def record(self, latency, status, error):
+        ok = error is None and status in _HEALTHY_STATUSES
+        self.window.record(latency, ok)
+        self.last_status = status
+        self.last_error = error
+        self.last_latency = latency
+        self.last_probe_at = datetime.now(timezone.utc).isoformat()
+        self.consecutive_failures = 0 if ok else self.consecutive_failures + 1
+
+    def evaluate(self, slo):
+        """Updates `breaches`; returns (started, cleared) breach names."""
+        histogram, ok, failed = self.window.snapshot()
+        breaches = []
+        if ok + failed >= slo.min_probes:
+            if ok / (ok + failed) < slo.availability:
+                breaches.append("availability")
+            if histogram.percentile(slo.latency_percentile) > slo.latency_threshold:
+                breaches.append("latency")
+        started = [b for b in breaches if b not in self.breaches]
+        cleared = [b for b in self.breaches if b not in breaches]
+        self.breaches = breaches
+        return started, cleared
+
+    def as_dict(self, slo):
+        histogram, ok, failed = self.window.snapshot()
+        probes = ok + failed
+        return {
+            "base_url": self.base_url,
+            "healthy": self.consecutive_failures == 0 and self.last_status is not None,
+            "slo_breaches": list(self.breaches),
+            "probes": probes,
+            "availability": round(ok / probes, 6) if probes else None,
+            "latency_ms": {
+                "p50": round(histogram.percentile(50) * 1000, 3),
+                "p90": round(histogram.percentile(90) * 1000, 3),
+                "p99": round(histogram.percentile(99) * 1000, 3),
+                f"p{slo.latency_percentile:g}": round(
+                    histogram.percentile(slo.latency_percentile) * 1000, 3
+                ),
+                "max": round(histogram.max_value() * 1000, 3),
+            },
+            "last": {
+                "status": self.last_status,
+                "error": self.last_error,
+                "latency_ms": (
+                    round(self.last_latency * 1000, 3)
+                    if self.last_latency is not None
+                    else None
+                ),
+                "at": self.last_probe_at,
+            },
+            "consecutive_failures": self.consecutive_failures,
+        }
+
+
+class HealthMonitor:
+    """
+    Probes /ping on every target once per `interval`, concurrently.
+
+    Rounds start on a fixed schedule (a slow round delays the next one
+    rather than shifting every later one), and each probe is bounded by
+    `timeout`, so one hung deployment cannot stall the others.
+    """
+
+    def __init__(
+        self,
+        targets,
+        interval=10.0,
+        timeout=None,
+        window=300.0,
+        buckets=30,
+        slo=None,
+        endpoint="ping",
+        clock=time.monotonic,
+    ):
+        """
+        Args:
+            targets: {name: base URL}.
+            interval: Seconds between the starts of two probe rounds.
+            timeout: Seconds per probe (default: the interval, at most 10).
+            window: Seconds of history the percentiles and availability cover.
+            buckets: Time slices the window is kept in (its resolution).
+            slo: SLO to check after every round (default SLO()).
+            endpoint: Health endpoint, relative to each base URL.
+            clock: Monotonic clock (tests pass a fake one).
+        """
+        if not targets:
+            raise ValueError("HealthMonitor needs at least one target")
+        self.interval = interval
+        self.timeout = timeout if timeout is not None else min(interval, 10.0)
+        self.slo = slo or SLO()
+        self.endpoint = endpoint
+        self.targets = {
+            name: TargetHealth(name, url, window, buckets, clock)
+            for name, url in targets.items()
+        }
+        self.rounds = 0
+        self._stopping = None
+
+    async def _probe(self, client, target):
+        started = time.perf_counter()
+        status, error = None, None
+        try:
+            response = await asyncio.wait_for(
+                client.get(self.endpoint), timeout=self.timeout
+            )
+            status = response.status_code
+        except httpx.HTTPStatusError as e:
+            status = e.response.status_code
+            error = f"HTTP {status}"
+        except (httpx.HTTPError, asyncio.TimeoutError, OSError) as e:
+            error = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+        target.record(time.perf_counter() - started, status, error)
+
+    def _evaluate(self):
+        for target in self.targets.values():
+            started, cleared = target.evaluate(self.slo)
+            for breach in started:
+                logger.warning(
+                    "SLO breach on %s (%s): %s", target.name, target.base_url, breach
+                )
+            for breach in cleared:
+                logger.info("SLO %s recovered on %s", breach, target.name)
+
+    async def run(self, duration=None, on_round=None):
+        """
+        Probes until stop() is called or `duration` seconds have passed.
+
+        Args:
+            duration: Seconds to run for (None: until stopped).
+            on_round: Called with state() after every round.
+        """
+        self._stopping = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        clients = {
+            name: AsyncAPIClient(
+                base_url=target.base_url,
+                max_concurrency=1,  # One kept-alive connection per target
+                timeout=self.timeout,
+            )
+            for name, target in self.targets.items()
+        }
+        try:
+            while not self._stopping.is_set():
+                round_started = loop.time()
+                await asyncio.gather(
+                    *(
+                        self._probe(clients[name], target)
+                        for name, target in self.targets.items()
+                    )
+                )
+                self.rounds += 1
+                self._evaluate()
+                if on_round is not None:
+                    on_round(self.state())
+                # Next tick on the fixed schedule, skipping any that were missed
+                now = loop.time()
+                ticks = math.floor((now - started) / self.interval) + 1
+                next_round = max(started + ticks * self.interval, round_started)
+                if duration is not None and next_round - started >= duration:
+                    break
+                try:
+                    await asyncio.wait_for(
+                        self._stopping.wait(), timeout=max(next_round - now, 0)
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            await asyncio.gather(*(client.aclose() for client in clients.values()))
+
+    def stop(self):
+        """Ends run() after the current round (call from the monitor's loop)."""
+        if self._stopping is not None:
+            self._stopping.set()
+
+    def state(self):
+        """The monitor's current state as a JSON-serializable dict."""
+        return {
+            "schema": "health-monitor/1",
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "interval_s": self.interval,
+            "window_s": next(iter(self.targets.values())).window.window,
+            "rounds": self.rounds,
+            "slo": asdict(self.slo),
+            "targets": {
+                name: target.as_dict(self.slo) for name, target in self.targets.items()
+            },
+        }
+
+
+async def serve_state(monitor, host, port):
+    """
+    Serves monitor.state() as JSON to any HTTP GET on host:port. Returns
+    the asyncio server (close it when the monitor stops).
+    """
+
+    async def handle(reader, writer):
+        try:
+            await reader.readuntil(b"\r\n\r\n")  # Request line and headers
+            body = json.dumps(monitor.state(), indent=2).encode()
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                b"Content-Length: %d\r\nConnection: close\r\n\r\n%s" % (len(body), body)
+            )
+            await writer.drain()
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, OSError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
+
+
+def _write_state(path, state):
+    # Atomic, so readers never see a half-written file
+    temporary = f"{path}.tmp"
+    with open(temporary, "w") as f:
+        json.dump(state, f, indent=2)
+    os.replace(temporary, path)
+
+
+def _parse_targets(values):
+    targets = {}
+    for value in values:
+        name, sep, url = value.partition("=")
+        if not sep:  # A bare URL names itself
+            name, url = value, value
+        targets[name] = url
+    return targets
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m src.health",
+        description="Check, or continuously monitor, restful-booker /ping.",
+    )
+    parser.add_argument(
+        "--monitor", action="store_true", help="Keep probing at a fixed interval"
+    )
+    parser.add_argument(
+        "--target",
+        action="append",
+        default=[],
+        metavar="NAME=URL",
+        help="Base URL to monitor (repeatable; default API_BASE_URL)",
+    )
+    parser.add_argument("--interval", type=float, default=10.0)
+    parser.add_argument("--timeout", type=float, help="Seconds per probe")
+    parser.add_argument(
+        "--window", type=float, default=300.0, help="Rolling window in seconds"
+    )
+    parser.add_argument("--slo-percentile", type=float, default=99.0)
+    parser.add_argument("--slo-latency-ms", type=float, default=500.0)
+    parser.add_argument(
+        "--slo-availability", type=float, default=99.9, help="Percent of probes"
+    )
+    parser.add_argument("--duration", type=float, help="Stop after this many seconds")
+    parser.add_argument("--state-file", help="Rewrite the JSON state here each round")
+    parser.add_argument(
+        "--serve", metavar="HOST:PORT", help="Serve the JSON state over HTTP"
+    )
+    return parser
+
+
+async def _monitor(args):
+    targets = _parse_targets(args.target) or {"default": cfg.BASE_URL}
+    monitor = HealthMonitor(
+        targets,
+        interval=args.interval,
+        timeout=args.timeout,
+        window=args.window,
+        slo=SLO(
+            latency_percentile=args.slo_percentile,
+            latency_threshold=args.slo_latency_ms / 1000,
+            availability=args.slo_availability / 100,
+        ),
+    )
+
+    def on_round(state):
+        if args.state_file:
+            _write_state(args.state_file, state)
+        line = ", ".join(
+            f"{name}: {'up' if t['healthy'] else 'DOWN'} "
+            f"p{args.slo_percentile:g}={t['latency_ms'][f'p{args.slo_percentile:g}']}ms"
+            + (f" BREACH({'+'.join(t['slo_breaches'])})" if t["slo_breaches"] else "")
+            for name, t in state["targets"].items()
+        )
+        print(f"[round {state['rounds']}] {line}", flush=True)
+
+    server = None
+    if args.serve:
+        host, _, port = args.serve.rpartition(":")
+        server = await serve_state(monitor, host or "127.0.0.1", int(port))
+    try:
+        await monitor.run(duration=args.duration, on_round=on_round)
+    finally:
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+    return monitor
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.monitor:
+        logging.basicConfig(
+            level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s"
+        )
+        # Failed probes are part of the state; don't log each one as an error
+        logging.getLogger("src.async_api_client").setLevel(logging.CRITICAL)
+        logging.getLogger("httpx").setLevel(logging.WARNING)  # One line per probe
+        try:
+            monitor = asyncio.run(_monitor(args))
+        except KeyboardInterrupt:
+            return 0
+        # Non-zero when a target ended the run down or breaching its SLO
+        failing = any(
+            t.breaches or t.consecutive_failures for t in monitor.targets.values()
+        )
+        return 1 if failing else 0
+
     # Create an instance of the APIClient, using the base URL from config
-    client = APIClient(base_url=cfg.base_url)  #
+    client = APIClient(base_url=cfg.BASE_URL)
 
     # Call the function to perform the health check
     is_healthy = check_api_health(client)
@@ -46,3 +483,9 @@ if __name__ == "__main__":
         print("API status: Healthy")
     else:
         print("API status: Unhealthy")
+    return 0 if is_healthy else 1
+
+
+# This part only runs when you execute this script directly
+if __name__ == "__main__":
+    raise SystemExit(main())
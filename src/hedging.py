@@ -0,0 +1,205 @@
+# src/hedging.py
+"""
+Hedged requests for idempotent calls.
+
+A HedgePolicy tracks the recent latency of each endpoint. When a request has
+been outstanding longer than the configured percentile of that history, a
+duplicate is sent and whichever answers first is returned; the other is
+discarded when it completes. Only a bounded fraction of requests may be
+hedged, so a slow server sees at most (1 + max_hedge_ratio) times the load.
+
+APIClient only hedges GET/HEAD requests (get_booking, get_booking_ids,
+/ping, ...), since sending them twice is harmless.
+"""
+
+import contextvars
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
+
+import requests
+
+DEFAULT_HEDGE_PERCENTILE = 95.0
+
+
+@dataclass
+class HedgeStats:
+    """How often hedges were sent and how often they beat the original."""
+
+    requests: int = 0  # Requests that went through the policy
+    fired: int = 0  # Duplicates sent
+    won: int = 0  # Duplicates whose response was returned
+    suppressed: int = 0  # Would have hedged, but the hedge budget was spent
+
+    @property
+    def fire_rate(self):
+        return self.fired / self.requests if self.requests else 0.0
+
+    @property
+    def win_rate(self):
+        return self.won / self.fired if self.fired else 0.0
+
+    def as_dict(self):
+        return {
+            **asdict(self),
+            "fire_rate": round(self.fire_rate, 4),
+            "win_rate": round(self.win_rate, 4),
+        }
+
+    def summary(self):
+        return (
+            f"{self.requests} requests: {self.fired} hedged ({self.fire_rate:.1%}), "
+            f"{self.won} hedges won ({self.win_rate:.1%}), "
+            f"{self.suppressed} suppressed by the hedge budget"
+        )
+
+
+class _LatencyWindow:
+    """Most recent latencies of one endpoint and their cached percentile."""
+
+    __slots__ = ("samples", "observed", "threshold")
+
+    def __init__(self, size):
+        self.samples = deque(maxlen=size)
+        self.observed = 0
+        self.threshold = None
+
+
+class HedgePolicy:
+    """Decides when to hedge and runs the attempts; shareable between clients."""
+
+    def __init__(
+        self,
+        percentile=DEFAULT_HEDGE_PERCENTILE,
+        min_delay=0.005,
+        min_samples=20,
+        window=1000,
+        max_hedge_ratio=0.1,
+        max_workers=32,
+    ):
+        """
+        Args:
+            percentile: Hedge once a request is slower than this percentile
+                of its endpoint's recent latencies.
+            min_delay: Never hedge sooner than this many seconds.
+            min_samples: Latencies needed per endpoint before hedging starts.
+            window: Recent latencies kept per endpoint.
+            max_hedge_ratio: Max fraction of requests that may be hedged.
+            max_workers: Threads running attempts; at least twice the number
+                of threads sending hedged requests at once.
+        """
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.window = window
+        self.max_hedge_ratio = max_hedge_ratio
+        self.stats = HedgeStats()
+        self._recompute_every = max(window // 20, 1)
+        self._windows = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="hedge"
+        )
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+    # --- Latency tracking ---
+
+    def observe(self, key, seconds):
+        """Records one unhedged attempt's latency for endpoint `key`."""
+        with self._lock:
+            latencies = self._windows.get(key)
+            if latencies is None:
+                latencies = self._windows[key] = _LatencyWindow(self.window)
+            latencies.samples.append(seconds)
+            latencies.observed += 1
+            # Re-sorting on every sample would cost more than the request
+            if latencies.observed >= self.min_samples and (
+                latencies.threshold is None
+                or latencies.observed % self._recompute_every == 0
+            ):
+                ordered = sorted(latencies.samples)
+                rank = math.ceil(len(ordered) * self.percentile / 100)  # Nearest rank
+                latencies.threshold = max(ordered[rank - 1], self.min_delay)
+
+    def threshold(self, key):
+        """Seconds after which `key` requests are hedged (None: not yet)."""
+        latencies = self._windows.get(key)
+        return latencies.threshold if latencies is not None else None
+
+    # --- Sending ---
+
+    def send(self, key, attempt):
+        """
+        Runs attempt() (one complete request), hedging it if it is slow.
+
+        Returns the first response. A transport error (no response) from one
+        attempt waits for the other; an HTTP error response counts as an
+        answer and is raised as usual.
+        """
+        with self._lock:
+            self.stats.requests += 1
+        delay = self.threshold(key)
+        started = time.perf_counter()
+        if delay is None:  # Still learning this endpoint's latency
+            try:
+                return attempt()
+            finally:
+                self.observe(key, time.perf_counter() - started)
+
+        # Each attempt runs in a copy of the caller's context (deadlines)
+        primary = self._executor.submit(contextvars.copy_context().run, attempt)
+        primary.add_done_callback(
+            lambda _: self.observe(key, time.perf_counter() - started)
+        )
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+        with self._lock:
+            allowed = self.stats.fired < self.max_hedge_ratio * self.stats.requests
+            if allowed:
+                self.stats.fired += 1
+            else:
+                self.stats.suppressed += 1
+        if not allowed:
+            return primary.result()
+
+        hedge = self._executor.submit(contextvars.copy_context().run, attempt)
+        winner = _first_answer(primary, hedge)
+        loser = hedge if winner is primary else primary
+        loser.add_done_callback(_discard)
+        if winner is hedge:
+            with self._lock:
+                self.stats.won += 1
+        return winner.result()
+
+
+def _answered(future):
+    """True if the attempt produced a response (possibly an HTTP error)."""
+    error = future.exception()
+    return error is None or (
+        isinstance(error, requests.exceptions.RequestException)
+        and error.response is not None
+    )
+
+
+def _first_answer(primary, hedge):
+    pending = {primary, hedge}
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in (primary, hedge):  # Primary first on a tie
+            if future in done and _answered(future):
+                return future
+    return primary  # Both failed without a response; raise the original error
+
+
+def _discard(future):
+    """Releases the losing attempt's connection once it completes."""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
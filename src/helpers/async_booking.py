@@ -0,0 +1,172 @@
+# src/helpers/async_booking.py
+import asyncio
+import logging
+
+import httpx
+
+from src import config
+from src.async_api_client import AsyncAPIClient
+from src.helpers.auth import TokenManager, is_auth_failure
+from src.helpers.json_stream import aiter_json_array
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBookingHelper:
+    """
+    asyncio counterpart of BookingHelper for the booking endpoints.
+
+    Every method is a coroutine, so callers can fan out with asyncio.gather;
+    the AsyncAPIClient's semaphore bounds how many requests are in flight.
+    """
+
+    def __init__(self, api_client: AsyncAPIClient, token_manager: TokenManager = None):
+        """
+        Initializes the helper with an AsyncAPIClient instance.
+
+        Args:
+            api_client (AsyncAPIClient): The async API client to use for requests.
+            token_manager (TokenManager): Optional shared token source; see
+                BookingHelper for the refresh-and-retry-once behaviour.
+        """
+        if not isinstance(api_client, AsyncAPIClient):
+            raise TypeError("api_client must be an instance of AsyncAPIClient")
+        self.api_client = api_client
+        self.token_manager = token_manager
+        # Use relative path from config
+        self.booking_endpoint = config.BOOKING_URL.replace(config.BASE_URL, "").lstrip(
+            "/"
+        )
+
+    async def get_booking_ids(self, params=None):
+        """Gets booking IDs, optionally filtered by params."""
+        logger.info("Getting booking IDs with params: %s", params)
+        return await self.api_client.get(self.booking_endpoint, params=params)
+
+    async def get_booking(self, booking_id):
+        """Gets details for a specific booking ID."""
+        logger.info("Getting booking details for ID: %s", booking_id)
+        endpoint = f"{self.booking_endpoint}/{booking_id}"
+        return await self.api_client.get(endpoint)
+
+    async def create_booking(self, booking_data):
+        """Creates a new booking."""
+        logger.info("Creating booking with data: %s", booking_data)
+        return await self.api_client.post(self.booking_endpoint, json=booking_data)
+
+    def _get_auth_headers(self, token: str) -> dict:
+        """Helper to create authentication headers."""
+        if not token:
+            raise ValueError("Authentication token required for this operation.")
+        headers = self.api_client.default_headers.copy()
+        headers["Cookie"] = f"token={token}"
+        return headers
+
+    async def _send_authenticated(self, send, token: str = None):
+        """Awaits send(headers) with auth; refreshes and retries once on 401/403."""
+        if token is None and self.token_manager is not None:
+            token = await self.token_manager.aget_token()
+        try:
+            return await send(self._get_auth_headers(token))
+        except httpx.HTTPStatusError as e:
+            status_code = e.response.status_code
+            if self.token_manager is None or not is_auth_failure(status_code):
+                raise
+            logger.info("Token rejected (%s); re-authenticating once", status_code)
+            self.token_manager.invalidate(token)
+            fresh_token = await self.token_manager.aget_token()
+            return await send(self._get_auth_headers(fresh_token))
+
+    async def update_booking(self, booking_id, booking_data, token: str = None):
+        """Updates an existing booking (full update). Requires auth token."""
+        logger.info("Updating booking ID %s with data: %s", booking_id, booking_data)
+        endpoint = f"{self.booking_endpoint}/{booking_id}"
+        return await self._send_authenticated(
+            lambda headers: self.api_client.put(
+                endpoint, json=booking_data, headers=headers
+            ),
+            token,
+        )
+
+    async def partial_update_booking(self, booking_id, partial_data, token: str = None):
+        """Partially updates an existing booking. Requires auth token."""
+        logger.info(
+            "Partially updating booking ID %s with data: %s", booking_id, partial_data
+        )
+        endpoint = f"{self.booking_endpoint}/{booking_id}"
+        return await self._send_authenticated(
+            lambda headers: self.api_client.patch(
+                endpoint, json=partial_data, headers=headers
+            ),
+            token,
+        )
+
+    async def delete_booking(self, booking_id, token: str = None):
+        """Deletes an existing booking. Requires auth token."""
+        logger.info("Deleting booking ID: %s", booking_id)
+        endpoint = f"{self.booking_endpoint}/{booking_id}"
+        return await self._send_authenticated(
+            lambda headers: self.api_client.delete(endpoint, headers=headers), token
+        )
+
+    # --- Streaming ---
+
+    async def _get_booking_or_none(self, booking_id):
+        try:
+            return booking_id, (await self.get_booking(booking_id)).json()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return booking_id, None  # Deleted since it was listed
+            raise
+
+    async def iter_bookings(self, params=None, window: int = None):
+        """
+        Async generator of (booking_id, booking) for every booking listed.
+
+        Same contract as BookingHelper.iter_bookings: the listing is parsed
+        as it streams in, at most `window` detail fetches run at once and
+        results come in completion order. Leaving early (break, aclose())
+        cancels the outstanding fetches and closes the listing stream.
+
+        Args:
+            params: Optional listing filters.
+            window: Detail fetches in flight. Defaults to the client's
+                max_concurrency minus the slot the listing stream holds.
+        """
+        if self.api_client.max_concurrency < 2:
+            raise ValueError("iter_bookings needs a client with max_concurrency >= 2")
+        window = window or self.api_client.max_concurrency - 1
+        logger.info("Streaming bookings with params: %s", params)
+        async with self.api_client.stream(
+            "GET", self.booking_endpoint, params=params
+        ) as response:
+            entries = aiter_json_array(response.aiter_bytes())
+            pending = set()
+            try:
+                exhausted = False
+                while True:
+                    while not exhausted and len(pending) < window:
+                        try:
+                            entry = await anext(entries)
+                        except StopAsyncIteration:
+                            exhausted = True
+                            break
+                        pending.add(
+                            asyncio.create_task(
+                                self._get_booking_or_none(entry["bookingid"])
+                            )
+                        )
+                    if not pending:
+                        return
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        booking_id, booking = task.result()
+                        if booking is not None:
+                            yield booking_id, booking
+            finally:
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                await entries.aclose()
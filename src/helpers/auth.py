@@ -4,6 +4,8 @@
 from src.api_client import APIClient
 from src import config  # Import config module
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -46,8 +48,115 @@ def authenticate(
         logger.info("Authentication successful.")
         return token
     except Exception as e:  # Catch exceptions raised by send_request or .json()
-        logger.error(f"Authentication failed: {e}")
+        logger.error("Authentication failed: %s", e)
         # Option 1: Return None (as before)
         # return None
         # Option 2: Re-raise the exception for testability
         raise
+
+
+# restful-booker doesn't document token expiry; re-issue periodically anyway so
+# long-running tools never hold a token the server has forgotten.
+DEFAULT_TOKEN_TTL = 600.0  # Seconds
+
+
+class TokenManager:
+    """
+    Issues one auth token and shares it across threads and coroutines.
+
+    The token is cached for `ttl` seconds. Concurrent callers that find the
+    cache empty or expired wait on a single refresh (single-flight) instead of
+    each POSTing to /auth. Call `invalidate(token)` when the server rejects a
+    token; BookingHelper does this automatically and retries once.
+
+    Usage (outside pytest):
+        manager = TokenManager(api_client)
+        token = manager.get_token()          # threads
+        token = await manager.aget_token()   # asyncio
+    """
+
+    def __init__(
+        self,
+        api_client: APIClient,
+        username: str = None,
+        password: str = None,
+        ttl: float = DEFAULT_TOKEN_TTL,
+        clock=time.monotonic,
+    ):
+        """
+        Args:
+            api_client: The APIClient used to call /auth.
+            username: API username (defaults to config).
+            password: API password (defaults to config).
+            ttl: Seconds a token is reused before a fresh one is requested.
+            clock: Monotonic time source (overridable for tests).
+        """
+        self.api_client = api_client
+        self.username = username
+        self.password = password
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._token = None
+        self._expires_at = 0.0
+        self.refresh_count = 0  # Number of /auth round trips made
+
+    def _cached_token(self) -> str | None:
+        if self._token is not None and self._clock() < self._expires_at:
+            return self._token
+        return None
+
+    def get_token(self) -> str:
+        """Returns the cached token, authenticating first if needed."""
+        token = self._cached_token()
+        if token is not None:
+            return token
+        with self._lock:
+            # Another thread may have refreshed while we waited for the lock
+            token = self._cached_token()
+            if token is not None:
+                return token
+            return self._refresh_locked()
+
+    async def aget_token(self) -> str:
+        """asyncio variant of get_token; never blocks the event loop."""
+        token = self._cached_token()
+        if token is not None:
+            return token
+        import asyncio  # Here, not at the top: sync callers never load asyncio
+
+        # The refresh runs in a worker thread; the lock keeps it single-flight
+        # across coroutines, threads and event loops alike.
+        return await asyncio.to_thread(self.get_token)
+
+    def refresh(self) -> str:
+        """Forces a new token to be issued."""
+        with self._lock:
+            return self._refresh_locked()
+
+    def invalidate(self, token: str = None):
+        """
+        Drops the cached token.
+
+        Args:
+            token: The token the server rejected. If another caller has already
+                replaced it with a newer token, the newer one is kept.
+        """
+        with self._lock:
+            if token is None or token == self._token:
+                self._token = None
+                self._expires_at = 0.0
+
+    def _refresh_locked(self) -> str:
+        token = authenticate(self.api_client, self.username, self.password)
+        if not token:
+            raise RuntimeError("Authentication failed - could not retrieve token.")
+        self.refresh_count += 1
+        self._token = token
+        self._expires_at = self._clock() + self.ttl
+        return token
+
+
+def is_auth_failure(status_code: int | None) -> bool:
+    """restful-booker answers a missing or stale token with 403 (401 elsewhere)."""
+    return status_code in (401, 403)
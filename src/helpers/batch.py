@@ -0,0 +1,173 @@
+# src/helpers/batch.py
+import logging
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 10  # Matches APIClient's default pool_maxsize
+_END = object()  # Exhausted-iterator sentinel
+
+
+@dataclass
+class BatchItemResult:
+    """Outcome of a single item in a batch: either a response or an error."""
+
+    index: int
+    item: Any
+    response: Any = None
+    error: BaseException | None = None
+    elapsed: float = 0.0  # Seconds spent on this item's request
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchResult:
+    """Per-item results of a batch (in input order) plus aggregate timing."""
+
+    results: list[BatchItemResult] = field(default_factory=list)
+    elapsed: float = 0.0  # Wall-clock seconds for the whole batch
+    max_workers: int = DEFAULT_MAX_WORKERS
+
+    def __len__(self):
+        return len(self.results)
+
+    def __iter__(self):
+        return iter(self.results)
+
+    @property
+    def succeeded(self) -> list[BatchItemResult]:
+        return [r for r in self.results if r.ok]
+
+    @property
+    def failed(self) -> list[BatchItemResult]:
+        return [r for r in self.results if not r.ok]
+
+    @property
+    def responses(self) -> list:
+        """Responses in input order (None where the item failed)."""
+        return [r.response for r in self.results]
+
+    @property
+    def throughput(self) -> float:
+        """Completed items per second of wall-clock time."""
+        return len(self.results) / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        """Mean per-item request time in seconds."""
+        if not self.results:
+            return 0.0
+        return sum(r.elapsed for r in self.results) / len(self.results)
+
+    def raise_for_failures(self):
+        """Raises the first per-item error, if any item failed."""
+        for result in self.results:
+            if not result.ok:
+                raise result.error
+
+    def summary(self) -> str:
+        return (
+            f"{len(self.results)} items ({len(self.failed)} failed) in "
+            f"{self.elapsed:.2f}s with {self.max_workers} workers "
+            f"({self.throughput:.1f} items/s, mean {self.mean_latency * 1000:.1f}ms)"
+        )
+
+
+def _timed_call(func: Callable, index: int, item: Any) -> BatchItemResult:
+    """Runs func(item), capturing the response or the exception it raised."""
+    started = time.perf_counter()
+    try:
+        response = func(item)
+        return BatchItemResult(index, item, response=response, elapsed=_since(started))
+    except Exception as e:  # Collect per-item failures instead of aborting
+        return BatchItemResult(index, item, error=e, elapsed=_since(started))
+
+
+def _since(started: float) -> float:
+    return time.perf_counter() - started
+
+
+def run_batch(
+    func: Callable, items: Iterable, max_workers: int = DEFAULT_MAX_WORKERS
+) -> BatchResult:
+    """
+    Applies `func` to every item across a thread pool.
+
+    Items are pulled from `items` lazily and at most 2 * max_workers are
+    outstanding at any time, so generators of any length can be fed in without
+    being materialized up front.
+
+    Args:
+        func: Callable taking one item (usually a BookingHelper method).
+        items: Iterable of items to process.
+        max_workers: Number of worker threads (parallel requests).
+
+    Returns:
+        BatchResult with one BatchItemResult per item, in input order.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    batch = BatchResult(max_workers=max_workers)
+    window = 2 * max_workers
+    pending = deque()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for index, item in enumerate(items):
+            pending.append(executor.submit(_timed_call, func, index, item))
+            if len(pending) >= window:
+                # Results are collected head-first, which keeps input order
+                batch.results.append(pending.popleft().result())
+        while pending:
+            batch.results.append(pending.popleft().result())
+    batch.elapsed = _since(started)
+    if logger.isEnabledFor(logging.INFO):  # summary() walks every result
+        logger.info("Batch finished: %s", batch.summary())
+    return batch
+
+
+def iter_unordered(
+    func: Callable, items: Iterable, max_workers: int = DEFAULT_MAX_WORKERS
+):
+    """
+    Lazily yields (item, func(item)) in completion order.
+
+    At most `max_workers` calls are in flight, and the next item is only
+    pulled from `items` when a call finishes, so a slow consumer holds back
+    the producer instead of buffering results. An exception from `func` is
+    raised to the consumer. Closing the generator early (break, close(), or
+    an exception) cancels calls that have not started and waits for the
+    running ones, so no request outlives the iteration.
+
+    Args:
+        func: Callable taking one item.
+        items: Iterable of items to process.
+        max_workers: Number of worker threads (parallel requests).
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    items = iter(items)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending = {}  # future -> item
+    try:
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < max_workers:
+                item = next(items, _END)
+                if item is _END:
+                    exhausted = True
+                else:
+                    pending[executor.submit(func, item)] = item
+            if not pending:
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -1,28 +1,59 @@
 # src/helpers/booking.py
 from src.api_client import APIClient
 from src import config
+from src.contracts import validate_response
+from src.helpers.auth import TokenManager, is_auth_failure
+from src.helpers.batch import (
+    DEFAULT_MAX_WORKERS,
+    BatchResult,
+    iter_unordered,
+    run_batch,
+)
+from src.helpers.json_stream import iter_json_array
+from src.models import Booking
+import contextlib
+import functools
 import logging
+import requests
 # Removed json import as APIClient handles it
 # Removed module-level auth import/token generation
 
 logger = logging.getLogger(__name__)
 
+STREAM_CHUNK_SIZE = 64 * 1024  # Bytes read from the listing per parse step
+_JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
 
 class BookingHelper:
     """
     Provides methods for interacting with the booking endpoints.
     """
 
-    def __init__(self, api_client: APIClient):
+    def __init__(
+        self,
+        api_client: APIClient,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        token_manager: TokenManager = None,
+        validate: bool = False,
+    ):
         """
         Initializes the BookingHelper with an APIClient instance.
 
         Args:
             api_client (APIClient): The API client to use for requests.
+            max_workers (int): Default parallelism for the batch methods.
+            token_manager (TokenManager): Optional shared token source. When set,
+                the token argument of authenticated methods becomes optional and
+                a rejected token is refreshed and the call retried once.
+            validate (bool): Check every booking response against its contract
+                (src.contracts) and raise ContractViolation on a mismatch.
         """
         if not isinstance(api_client, APIClient):
             raise TypeError("api_client must be an instance of APIClient")
         self.api_client = api_client
+        self.max_workers = max_workers
+        self.token_manager = token_manager
+        self.validate = validate
         # Use relative path from config
         self.booking_endpoint = config.BOOKING_URL.replace(config.BASE_URL, "").lstrip(
             "/"
@@ -30,28 +61,74 @@ class BookingHelper:
 
     def get_booking_ids(self, params=None):
         """Gets booking IDs, optionally filtered by params."""
-        logger.info(f"Getting booking IDs with params: {params}")
+        logger.info("Getting booking IDs with params: %s", params)
         # APIClient's send_request will raise exceptions on failure
         response = self.api_client.get(self.booking_endpoint, params=params)
+        if self.validate:
+            validate_response("booking_ids", response)
         # Assuming success returns 200 and JSON list
         return response  # Let the caller handle .json() and specific status checks
 
-    def get_booking(self, booking_id):
-        """Gets details for a specific booking ID."""
-        logger.info(f"Getting booking details for ID: {booking_id}")
+    def get_booking(self, booking_id, model: bool = False):
+        """
+        Gets details for a specific booking ID.
+
+        With model=True, returns a validated src.models.Booking (booking_id
+        set) instead of the response.
+        """
+        logger.info("Getting booking details for ID: %s", booking_id)
         endpoint = f"{self.booking_endpoint}/{booking_id}"
         response = self.api_client.get(endpoint)
+        if self.validate:
+            validate_response("booking", response)
+        if model:
+            return Booking.from_response(response, booking_id)
         # Caller can check response.status_code (e.g., 404 for not found)
         return response
 
-    def create_booking(self, booking_data):
-        """Creates a new booking."""
-        logger.info(f"Creating booking with data: {booking_data}")
-        # Use json parameter instead of data=json.dumps
-        response = self.api_client.post(self.booking_endpoint, json=booking_data)
+    def create_booking(self, booking_data, model: bool = False):
+        """
+        Creates a new booking from a dict or src.models.Booking.
+
+        With model=True, returns the created Booking (booking_id set) instead
+        of the response.
+        """
+        logger.info("Creating booking with data: %s", booking_data)
+        try:
+            response = self.api_client.post(
+                self.booking_endpoint, **self._body(booking_data)
+            )
+        finally:
+            self._invalidate_cached()
+        if self.validate:
+            validate_response("booking_created", response)
+        if model:
+            return Booking.from_response(response)
         # Assuming success returns 200 and booking details + bookingid
         return response
 
+    @staticmethod
+    def _body(booking_data, headers=None):
+        """Request kwargs for a dict payload (json=) or a Booking (its JSON bytes)."""
+        if isinstance(booking_data, Booking):
+            # Serialized straight to bytes, without an intermediate dict
+            return {
+                "data": booking_data.to_json(),
+                "headers": {**(headers or {}), **_JSON_CONTENT_TYPE},
+            }
+        return {"json": booking_data, "headers": headers}
+
+    def _invalidate_cached(self, booking_id=None):
+        """
+        Drops cached GETs a write has made stale: the ID listing (under any
+        filter params) and, for item writes, the booking itself. Called even
+        when the write fails, since it may still have reached the server.
+        """
+        endpoints = [self.booking_endpoint]
+        if booking_id is not None:
+            endpoints.append(f"{self.booking_endpoint}/{booking_id}")
+        self.api_client.invalidate_cache(*endpoints)
+
     def _get_auth_headers(self, token: str) -> dict:
         """Helper to create authentication headers."""
         if not token:
@@ -62,32 +139,209 @@ class BookingHelper:
         # Note: Some APIs might expect 'Authorization: Bearer <token>' instead
         return headers
 
-    def update_booking(self, booking_id, booking_data, token: str):
-        """Updates an existing booking (full update). Requires auth token."""
-        logger.info(f"Updating booking ID {booking_id} with data: {booking_data}")
+    def _send_authenticated(self, send, token: str = None):
+        """
+        Calls send(headers) with auth headers for `token`.
+
+        With a token manager, a missing token is taken from the manager, and an
+        auth failure (401/403) invalidates the token, re-authenticates and
+        retries exactly once.
+        """
+        if token is None and self.token_manager is not None:
+            token = self.token_manager.get_token()
+        try:
+            return send(self._get_auth_headers(token))
+        except requests.exceptions.HTTPError as e:
+            status_code = e.response.status_code if e.response is not None else None
+            if self.token_manager is None or not is_auth_failure(status_code):
+                raise
+            logger.info("Token rejected (%s); re-authenticating once", status_code)
+            self.token_manager.invalidate(token)
+            return send(self._get_auth_headers(self.token_manager.get_token()))
+
+    def update_booking(
+        self, booking_id, booking_data, token: str = None, model: bool = False
+    ):
+        """
+        Updates an existing booking (full update) from a dict or
+        src.models.Booking. Requires auth token. With model=True, returns the
+        updated Booking instead of the response.
+        """
+        logger.info("Updating booking ID %s with data: %s", booking_id, booking_data)
         endpoint = f"{self.booking_endpoint}/{booking_id}"
-        headers = self._get_auth_headers(token)
-        response = self.api_client.put(endpoint, json=booking_data, headers=headers)
+        try:
+            response = self._send_authenticated(
+                lambda headers: self.api_client.put(
+                    endpoint, **self._body(booking_data, headers)
+                ),
+                token,
+            )
+        finally:
+            self._invalidate_cached(booking_id)
+        if self.validate:
+            validate_response("booking", response)
+        if model:
+            return Booking.from_response(response, booking_id)
         # Assuming success returns 200 and updated booking details
         return response
 
-    def partial_update_booking(self, booking_id, partial_data, token: str):
-        """Partially updates an existing booking. Requires auth token."""
+    def partial_update_booking(
+        self, booking_id, partial_data, token: str = None, model: bool = False
+    ):
+        """
+        Partially updates an existing booking. Requires auth token. With
+        model=True, returns the resulting Booking instead of the response.
+        """
         logger.info(
-            f"Partially updating booking ID {booking_id} with data: {partial_data}"
+            "Partially updating booking ID %s with data: %s", booking_id, partial_data
         )
         endpoint = f"{self.booking_endpoint}/{booking_id}"
-        headers = self._get_auth_headers(token)
         # Ensure Accept header is set if API requires it, client defaults should handle this
-        response = self.api_client.patch(endpoint, json=partial_data, headers=headers)
+        try:
+            response = self._send_authenticated(
+                lambda headers: self.api_client.patch(
+                    endpoint, json=partial_data, headers=headers
+                ),
+                token,
+            )
+        finally:
+            self._invalidate_cached(booking_id)
+        if self.validate:
+            validate_response("booking", response)
+        if model:
+            return Booking.from_response(response, booking_id)
         # Assuming success returns 200 and updated booking details
         return response
 
-    def delete_booking(self, booking_id, token: str):
+    def delete_booking(self, booking_id, token: str = None):
         """Deletes an existing booking. Requires auth token."""
-        logger.info(f"Deleting booking ID: {booking_id}")
+        logger.info("Deleting booking ID: %s", booking_id)
         endpoint = f"{self.booking_endpoint}/{booking_id}"
-        headers = self._get_auth_headers(token)
-        response = self.api_client.delete(endpoint, headers=headers)
+        try:
+            response = self._send_authenticated(
+                lambda headers: self.api_client.delete(endpoint, headers=headers),
+                token,
+            )
+        finally:
+            self._invalidate_cached(booking_id)
         # Assuming success returns 201 (Created) status code upon deletion
         return response
+
+    # --- Batch operations ---
+    # Each batch method fans out across a thread pool sharing the client's
+    # connection pool, returns a BatchResult in input order and records
+    # per-item failures instead of aborting the batch.
+
+    def _run_batch(self, func, items, max_workers) -> BatchResult:
+        flow_control = self.api_client.flow_control
+        if max_workers is None and flow_control is not None:
+            # Enough workers for the adaptive limit to grow into; it decides
+            # how many of them actually have a request in flight
+            max_workers = flow_control.max_concurrency
+        workers = max_workers or self.max_workers
+        if workers > self.api_client.pool_maxsize:
+            logger.warning(
+                "Batch uses %s workers but the client pool holds %s connections; "
+                "raise pool_maxsize to keep every worker on a reused connection.",
+                workers,
+                self.api_client.pool_maxsize,
+            )
+        return run_batch(func, items, max_workers=workers)
+
+    def create_bookings(self, bookings, max_workers: int = None) -> BatchResult:
+        """Creates many bookings from an iterable of booking payloads."""
+        return self._run_batch(self.create_booking, bookings, max_workers)
+
+    def get_bookings(self, booking_ids, max_workers: int = None) -> BatchResult:
+        """Gets details for many booking IDs."""
+        return self._run_batch(self.get_booking, booking_ids, max_workers)
+
+    def update_bookings(
+        self, updates, token: str = None, partial: bool = False, max_workers: int = None
+    ) -> BatchResult:
+        """
+        Updates many bookings. Requires auth token.
+
+        Args:
+            updates: Iterable of (booking_id, booking_data) pairs.
+            token: Authentication token.
+            partial: Use PATCH (partial_update_booking) instead of PUT.
+            max_workers: Parallelism (defaults to the helper's max_workers).
+        """
+        update = self.partial_update_booking if partial else self.update_booking
+        return self._run_batch(
+            lambda pair: update(pair[0], pair[1], token), updates, max_workers
+        )
+
+    def delete_bookings(
+        self, booking_ids, token: str = None, max_workers: int = None
+    ) -> BatchResult:
+        """Deletes many bookings. Requires auth token."""
+        return self._run_batch(
+            lambda booking_id: self.delete_booking(booking_id, token),
+            booking_ids,
+            max_workers,
+        )
+
+    # --- Streaming ---
+
+    def _get_booking_or_none(self, booking_id, model=False):
+        """Booking details (dict or Booking), or None if it was deleted meanwhile."""
+        try:
+            if model:
+                return self.get_booking(booking_id, model=True)
+            return self.get_booking(booking_id).json()
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return None
+            raise
+
+    def iter_bookings(self, params=None, max_workers: int = None, model: bool = False):
+        """
+        Yields (booking_id, booking) for every booking in the listing.
+
+        The /booking listing is streamed and parsed incrementally, and details
+        are fetched with at most `max_workers` requests in flight and yielded
+        in completion order, so memory stays flat however many bookings
+        exist. Bookings deleted between listing and fetch are skipped.
+        Stopping early (break) cancels queued fetches, waits for running
+        ones and closes the listing stream.
+
+        The listing holds one pooled connection for the whole iteration, so
+        the client's pool_maxsize should be at least max_workers + 1.
+
+        Args:
+            params: Optional listing filters (firstname, lastname, checkin...).
+            max_workers: Detail fetches in flight (defaults to max_workers).
+            model: Yield src.models.Booking objects instead of dicts (a
+                fraction of the memory when the caller keeps them).
+        """
+        workers = max_workers or self.max_workers
+        if workers + 1 > self.api_client.pool_maxsize:
+            logger.warning(
+                "iter_bookings uses %s workers plus the listing stream but the "
+                "client pool holds %s connections; raise pool_maxsize.",
+                workers,
+                self.api_client.pool_maxsize,
+            )
+        logger.info("Streaming bookings with params: %s", params)
+        response = self.api_client.get(
+            self.booking_endpoint, params=params, stream=True
+        )
+        try:
+            ids = (
+                entry["bookingid"]
+                for entry in iter_json_array(response.iter_content(STREAM_CHUNK_SIZE))
+            )
+            with contextlib.closing(
+                iter_unordered(
+                    functools.partial(self._get_booking_or_none, model=model),
+                    ids,
+                    workers,
+                )
+            ) as results:
+                for booking_id, booking in results:
+                    if booking is not None:
+                        yield booking_id, booking
+        finally:
+            response.close()
@@ -0,0 +1,206 @@
+# src/helpers/booking_generator.py
+"""
+Seeded, streaming generator of varied booking payloads.
+
+Payloads are derived from a template (usually tests/data/booking_data.json)
+by field-level rules: names from pools with accents, apostrophes, hyphens
+and non-Latin scripts, prices with edge values, stays of varying length
+across two years, and a spread of `additionalneeds`. Fields without a rule
+keep the template's value.
+
+Payloads are built in blocks of `block_size`, one column per field, each
+block from its own RNG seeded by (seed, block number). So the stream is
+reproducible, payload(i) can be rebuilt on its own (pytest cases hold only
+an index), and memory stays at one block however many are generated: a
+million payloads take a couple of seconds.
+
+Usage:
+    generator = BookingGenerator(template, seed=42)
+    for payload in generator.generate(1_000_000):   # Lazily, one block at a time
+        ...
+    generator.payload(12345)                        # Same dict as the 12346th above
+    helper.create_bookings(generator.generate(500)) # Straight into the bulk path
+"""
+
+import copy
+import datetime
+import random
+from itertools import count as _count
+from itertools import islice, repeat
+
+DEFAULT_BLOCK_SIZE = 4096
+
+FIRST_NAMES = (
+    "Sally", "Jim", "Mark", "Mary", "Eric", "Susan", "John", "Josh", "Jane",
+    "Ana", "José", "Zoë", "Renée", "Björn", "Łukasz", "Siobhán", "Nuño",
+    "Mary-Jane", "Jean-Luc", "D'Andre", "Ngozi", "Oluwaseun", "Priya",
+    "Aarav", "Mei", "Hiroshi", "Seo-yeon", "Алексей", "Σοφία", "محمد",
+    "李", "さくら", "A", "Maximiliano-Alejandro",
+)  # fmt: skip
+LAST_NAMES = (
+    "Brown", "Smith", "Jones", "Wilson", "Jackson", "Ericsson", "Taylor",
+    "O'Brien", "O'Neil", "McDonald", "van der Berg", "de la Cruz",
+    "Smith-Jones", "Nguyễn", "Müller", "García", "Øvergaard", "Kowalczyk",
+    "Okafor", "Adeyemi", "Patel", "Wang", "Kim", "Tanaka", "Иванов",
+    "Παπαδόπουλος", "الحسن", "X", "Wolfeschlegelsteinhausenbergerdorff",
+)  # fmt: skip
+ADDITIONAL_NEEDS = (
+    "Breakfast", "Lunch", "Dinner", "Breakfast, Dinner", "Late checkout",
+    "Early check-in", "Airport transfer", "Extra pillows", "Cot for a toddler",
+    "Vegetarian meals", "Végétarien, sans gluten", "Wheelchair access",
+    "Quiet room away from the lift, please — arriving after midnight",
+    "",
+)  # fmt: skip
+
+
+class Choice:
+    """Picks from `values`, uniformly or by `weights`."""
+
+    def __init__(self, values, weights=None):
+        if not values:
+            raise ValueError("Choice needs at least one value")
+        self.values = tuple(values)
+        self.weights = weights
+
+    def sample(self, rng, k):
+        return rng.choices(self.values, self.weights, k=k)
+
+
+class IntRange:
+    """Integers in [low, high], with `edges` mixed in at `edge_rate`."""
+
+    def __init__(self, low, high, edges=(), edge_rate=0.02):
+        if high < low:
+            raise ValueError("IntRange needs low <= high")
+        self.low = low
+        self.span = high - low + 1
+        self.edges = tuple(edges)
+        self.edge_rate = edge_rate
+
+    def sample(self, rng, k):
+        low, span, random_ = self.low, self.span, rng.random
+        values = [low + int(random_() * span) for _ in repeat(None, k)]
+        if self.edges:
+            for index in rng.sample(range(k), int(k * self.edge_rate)):
+                values[index] = rng.choice(self.edges)
+        return values
+
+
+class StayDates:
+    """
+    {"checkin", "checkout"} ISO dates: a check-in within `days` of `start`,
+    staying 0 to `max_stay` nights (checkout is never before checkin).
+    """
+
+    def __init__(self, start=datetime.date(2025, 1, 1), days=730, max_stay=30):
+        if days < 1 or max_stay < 0:
+            raise ValueError("StayDates needs days >= 1 and max_stay >= 0")
+        self.days = days
+        self.max_stay = max_stay
+        # Every date a stay can touch, formatted once
+        self._dates = [
+            (start + datetime.timedelta(offset)).isoformat()
+            for offset in range(days + max_stay)
+        ]
+
+    def sample(self, rng, k):
+        dates, days, nights, random_ = (
+            self._dates,
+            self.days,
+            self.max_stay + 1,
+            rng.random,
+        )
+        stays = []
+        for _ in repeat(None, k):
+            checkin = int(random_() * days)
+            stays.append(
+                {
+                    "checkin": dates[checkin],
+                    "checkout": dates[checkin + int(random_() * nights)],
+                }
+            )
+        return stays
+
+
+class Constant:
+    """The same value in every payload (deep-copied when it is mutable)."""
+
+    def __init__(self, value):
+        self.value = value
+        self._mutable = isinstance(value, (dict, list, set))
+
+    def sample(self, rng, k):
+        if self._mutable:
+            return [copy.deepcopy(self.value) for _ in repeat(None, k)]
+        return repeat(self.value, k)
+
+
+DEFAULT_RULES = {
+    "firstname": Choice(FIRST_NAMES),
+    "lastname": Choice(LAST_NAMES),
+    "totalprice": IntRange(1, 5000, edges=(0, 1, 99_999)),
+    "depositpaid": Choice((True, False)),
+    "bookingdates": StayDates(),
+    "additionalneeds": Choice(ADDITIONAL_NEEDS),
+}
+
+
+class BookingGenerator:
+    """Reproducible stream of booking payloads derived from a template."""
+
+    def __init__(
+        self, template, rules=None, seed=0, block_size: int = DEFAULT_BLOCK_SIZE
+    ):
+        """
+        Args:
+            template: A booking payload. Its fields (and their order) are
+                those of every generated payload.
+            rules: {field: rule} merged over DEFAULT_RULES; a rule is any
+                object with sample(rng, k) returning k values. Map a field
+                to None to keep the template's value. Fields the template
+                lacks are ignored.
+            seed: Same seed, template and rules, same payloads.
+            block_size: Payloads built (and held) at a time.
+        """
+        if block_size < 1:
+            raise ValueError("block_size must be at least 1")
+        merged = {**DEFAULT_RULES, **(rules or {})}
+        self.template = copy.deepcopy(template)
+        self.seed = seed
+        self.block_size = block_size
+        self.fields = tuple(self.template)
+        self.rules = tuple(
+            merged.get(field) or Constant(self.template[field]) for field in self.fields
+        )
+        self._cached_block = (None, None)  # (block number, payloads)
+
+    def _block(self, number):
+        """Payloads block_size * number onwards, as a list."""
+        rng = random.Random(f"{self.seed}:{number}")
+        k = self.block_size
+        columns = [rule.sample(rng, k) for rule in self.rules]
+        # dict(zip(fields, row)) for every row, looped in C
+        return list(map(dict, map(zip, repeat(self.fields), zip(*columns))))
+
+    def generate(self, count=None, start=0):
+        """
+        Yields `count` payloads (endlessly if None), from index `start`.
+        Each payload is a fresh dict the caller may mutate.
+        """
+        first_block, offset = divmod(start, self.block_size)
+        stream = (
+            payload for number in _count(first_block) for payload in self._block(number)
+        )
+        return islice(stream, offset, None if count is None else offset + count)
+
+    def __iter__(self):
+        return self.generate()
+
+    def payload(self, index):
+        """Payload number `index` of the stream (a copy; free to mutate)."""
+        number, offset = divmod(index, self.block_size)
+        cached_number, payloads = self._cached_block
+        if cached_number != number:  # Consecutive indices share a block
+            payloads = self._block(number)
+            self._cached_block = (number, payloads)
+        return copy.deepcopy(payloads[offset])
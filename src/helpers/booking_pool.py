@@ -0,0 +1,207 @@
+# src/helpers/booking_pool.py
+"""
+A warm pool of pre-created bookings.
+
+Tests that need an existing booking normally pay a create round trip
+before their first assertion, and a delete round trip after it. The pool
+creates bookings ahead of time on background threads, hands one out
+instantly on acquire(), and immediately starts creating a replacement.
+Bookings handed out are never handed out again (tests update and delete
+them), and close() deletes every booking the pool created in one batch.
+With size=0 nothing runs in the background: acquire() creates its booking
+inline, so requests happen in a fixed order (as cassette replay needs).
+
+Usage:
+    with BookingPool(helper, templates, size=8) as pool:
+        booking = pool.acquire()      # Usually already created
+        helper.get_booking(booking.booking_id)
+    # Every pooled booking is deleted here
+"""
+
+import copy
+import itertools
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 8
+DEFAULT_REFILL_WORKERS = 4
+
+
+class BookingPoolError(RuntimeError):
+    """The pool is closed, or could not create a booking."""
+
+
+@dataclass(frozen=True)
+class PooledBooking:
+    booking_id: int
+    data: dict  # The payload it was created from (the test's own copy)
+
+
+@dataclass
+class BookingPoolStats:
+    created: int = 0
+    acquired: int = 0
+    waited: int = 0  # Acquires that found the pool empty
+    wait_time: float = 0.0  # Seconds spent in those waits
+    failed: int = 0  # Background creates that raised
+
+    def summary(self):
+        return (
+            f"{self.acquired} acquired ({self.waited} waited "
+            f"{self.wait_time:.3f}s in total), {self.created} created, "
+            f"{self.failed} failed creates"
+        )
+
+
+class BookingPool:
+    """Keeps `size` ready bookings, refilled in the background."""
+
+    def __init__(
+        self,
+        booking_helper,
+        templates,
+        size: int = DEFAULT_POOL_SIZE,
+        max_workers: int = DEFAULT_REFILL_WORKERS,
+        token: str = None,
+    ):
+        """
+        Args:
+            booking_helper: BookingHelper the bookings are created and deleted
+                with (its token manager, if any, authorizes the deletes).
+            templates: A booking payload or a list of them; bookings are
+                created from them in turn.
+            size: Bookings kept ready; 0 creates each booking inline in
+                acquire(), in call order.
+            max_workers: Creates in flight at once while filling.
+            token: Auth token for the final batch delete, when the helper
+                has no token manager.
+        """
+        if isinstance(templates, dict):
+            templates = [templates]
+        if not templates:
+            raise ValueError("BookingPool needs at least one booking template")
+        if size < 0:
+            raise ValueError("size must not be negative")
+        self.booking_helper = booking_helper
+        self.size = size
+        self.token = token
+        self.stats = BookingPoolStats()
+        self._templates = itertools.cycle(templates)
+        self._ready = queue.Queue()
+        self._lock = threading.Lock()
+        self._created_ids = []  # Everything to delete on close()
+        self._closed = False
+        self._executor = None
+        if size:
+            self._executor = ThreadPoolExecutor(
+                max_workers=min(max_workers, size), thread_name_prefix="booking-pool"
+            )
+        for _ in range(size):
+            self._refill()
+
+    def _refill(self):
+        with self._lock:
+            if self._closed or self._executor is None:
+                return
+            template = next(self._templates)
+            self._executor.submit(lambda: self._ready.put(self._create(template)))
+
+    def _create(self, template):
+        """A PooledBooking, or the exception its create raised."""
+        data = copy.deepcopy(template)  # Tests may mutate the copy they get
+        try:
+            response = self.booking_helper.create_booking(data)
+            booking_id = response.json()["bookingid"]
+        except Exception as e:  # Reported to the acquirer, not lost in a thread
+            logger.warning("Booking pool failed to create a booking: %s", e)
+            with self._lock:
+                self.stats.failed += 1
+            return e
+        with self._lock:
+            self._created_ids.append(booking_id)
+            self.stats.created += 1
+        return PooledBooking(booking_id, data)
+
+    @property
+    def ready(self) -> int:
+        """Bookings (or failed creates) waiting to be acquired."""
+        return self._ready.qsize()
+
+    def acquire(self, timeout: float = 30.0) -> PooledBooking:
+        """
+        Takes a ready booking (waiting for one if the pool has run dry) and
+        starts creating its replacement.
+
+        Raises:
+            BookingPoolError: The pool is closed, no booking was created in
+                `timeout` seconds, or the create failed.
+        """
+        if self._closed:
+            raise BookingPoolError("Booking pool is closed")
+        if self._executor is None:
+            with self._lock:
+                template = next(self._templates)
+            item = self._create(template)
+        else:
+            item = self._take(timeout)
+            self._refill()
+        if isinstance(item, Exception):
+            raise BookingPoolError(
+                f"Could not create a pooled booking: {item}"
+            ) from item
+        with self._lock:
+            self.stats.acquired += 1
+        return item
+
+    def _take(self, timeout):
+        try:
+            return self._ready.get_nowait()
+        except queue.Empty:
+            started = time.perf_counter()
+            try:
+                return self._ready.get(timeout=timeout)
+            except queue.Empty:
+                raise BookingPoolError(
+                    f"No pooled booking was ready within {timeout}s"
+                ) from None
+            finally:
+                with self._lock:
+                    self.stats.waited += 1
+                    self.stats.wait_time += time.perf_counter() - started
+
+    def close(self):
+        """
+        Stops refilling and deletes every booking the pool created, in one
+        batch. Bookings that tests deleted themselves count as failed items
+        in the returned BatchResult (None if nothing was created).
+        """
+        with self._lock:
+            if self._closed:
+                return None
+            self._closed = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)  # Let in-flight creates land
+        with self._lock:
+            booking_ids, self._created_ids = self._created_ids, []
+        if not booking_ids:
+            return None
+        result = self.booking_helper.delete_bookings(booking_ids, self.token)
+        logger.info(
+            "Booking pool deleted %s of %s bookings (%s)",
+            len(result.succeeded),
+            len(booking_ids),
+            self.stats.summary(),
+        )
+        return result
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,103 @@
+# src/helpers/json_stream.py
+"""
+Incremental parsing of a top-level JSON array from a byte stream.
+
+The /booking listing is one JSON array that can hold hundreds of thousands
+of entries. iter_json_array() decodes it element by element as chunks
+arrive, so only the unparsed tail of the current chunk is ever held in
+memory, whatever the size of the listing.
+"""
+
+import codecs
+import json
+
+_WHITESPACE = " \t\n\r"
+
+
+class JSONArrayParser:
+    """
+    Push parser: feed() text chunks, get back the array elements completed
+    so far. Call close() at end of input to check the array was terminated.
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._started = False  # Seen '['
+        self._empty = True  # No element yet
+        self._expect_value = True  # Next token is a value (else ',' or ']')
+        self.done = False  # Seen the closing ']'
+
+    def feed(self, text):
+        buffer = self._buffer + text
+        items = []
+        pos = 0
+        end = len(buffer)
+        while True:
+            while pos < end and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos == end:
+                break
+            char = buffer[pos]
+            if self.done:
+                raise ValueError("Data after the end of the JSON array")
+            if not self._started:
+                if char != "[":
+                    raise ValueError("Expected a JSON array")
+                self._started = True
+                pos += 1
+            elif char == "]":
+                if self._expect_value and not self._empty:
+                    raise ValueError("Trailing ',' in JSON array")
+                self.done = True
+                pos += 1
+            elif not self._expect_value:
+                if char != ",":
+                    raise ValueError(f"Expected ',' or ']', got {char!r}")
+                self._expect_value = True
+                pos += 1
+            else:
+                try:
+                    value, value_end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    break  # Element continues in the next chunk
+                # A number may have been cut at a chunk boundary (12 of 123,
+                # 1 of 1.5), so only accept a value once its ',' or ']' is in
+                follow = value_end
+                while follow < end and buffer[follow] in _WHITESPACE:
+                    follow += 1
+                if follow == end or buffer[follow] not in ",]":
+                    break
+                items.append(value)
+                self._empty = False
+                self._expect_value = False
+                pos = value_end
+        self._buffer = buffer[pos:]
+        return items
+
+    def close(self):
+        """Raises ValueError unless the input was one complete JSON array."""
+        if not self.done:
+            raise ValueError("Truncated or malformed JSON array")
+
+
+def iter_json_array(chunks, encoding="utf-8"):
+    """Yields the elements of the JSON array whose bytes `chunks` produces."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    parser = JSONArrayParser()
+    for chunk in chunks:
+        yield from parser.feed(decoder.decode(chunk))
+    yield from parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+
+
+async def aiter_json_array(chunks, encoding="utf-8"):
+    """Async iter_json_array() for an async iterable of byte chunks."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    parser = JSONArrayParser()
+    async for chunk in chunks:
+        for item in parser.feed(decoder.decode(chunk)):
+            yield item
+    for item in parser.feed(decoder.decode(b"", final=True)):
+        yield item
+    parser.close()
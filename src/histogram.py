@@ -0,0 +1,157 @@
+# src/histogram.py
+import base64
+import math
+import zlib
+
+# Each power-of-two range of values is split into 2**SUB_BUCKET_BITS linear
+# sub-buckets, so any recorded value is reported within 1/2**SUB_BUCKET_BITS
+# (~0.8% for 7 bits) of its true value - the same log-linear layout as
+# HdrHistogram, just without its fixed value range.
+DEFAULT_SUB_BUCKET_BITS = 7
+
+
+class LatencyHistogram:
+    """
+    Compact, mergeable latency histogram (HDR-style).
+
+    Values are recorded as integer microseconds into sparse log-linear
+    buckets. Histograms from different threads, processes or machines merge
+    by adding bucket counts, so workers ship a few hundred bytes instead of
+    raw samples and the merged percentiles are exact to bucket precision.
+    """
+
+    __slots__ = ("sub_bucket_bits", "counts", "total", "min", "max", "sum")
+
+    def __init__(self, sub_bucket_bits=DEFAULT_SUB_BUCKET_BITS):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.counts = {}  # bucket index -> count
+        self.total = 0
+        self.min = None  # Microseconds
+        self.max = None
+        self.sum = 0
+
+    # --- Bucket math ---
+
+    def _index(self, value):
+        shift = value.bit_length() - (self.sub_bucket_bits + 1)
+        if shift <= 0:
+            return value  # Small values get an exact bucket each
+        return (shift << self.sub_bucket_bits) + (value >> shift)
+
+    def _bounds(self, index):
+        """Lowest and highest microsecond value that map to `index`."""
+        linear_limit = 1 << (self.sub_bucket_bits + 1)
+        if index < linear_limit:
+            return index, index
+        shift = (index >> self.sub_bucket_bits) - 1
+        mantissa = index - (shift << self.sub_bucket_bits)
+        return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+    # --- Recording ---
+
+    def record(self, seconds, count=1):
+        """Records a latency given in seconds."""
+        value = max(int(seconds * 1_000_000), 0)
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.total += count
+        self.sum += value * count
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        """Adds another histogram's counts into this one."""
+        if other.sub_bucket_bits != self.sub_bucket_bits:
+            raise ValueError("Cannot merge histograms with different precision")
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.total += other.total
+        self.sum += other.sum
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    # --- Queries (all in seconds) ---
+
+    def percentile(self, pct):
+        """Nearest-rank percentile, reported as its bucket's highest value."""
+        if not self.total:
+            return 0.0
+        rank = max(math.ceil(pct / 100.0 * self.total), 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                # Never report beyond what was actually observed
+                return min(self._bounds(index)[1], self.max) / 1_000_000
+        return self.max / 1_000_000
+
+    def mean(self):
+        return self.sum / self.total / 1_000_000 if self.total else 0.0
+
+    def max_value(self):
+        return (self.max or 0) / 1_000_000
+
+    def min_value(self):
+        return (self.min or 0) / 1_000_000
+
+    # --- Serialization ---
+
+    def encode(self):
+        """Compact text form: zlib-compressed varint deltas, base64 encoded."""
+        out = bytearray()
+        previous = 0
+        for index in sorted(self.counts):
+            _write_varint(out, index - previous)
+            _write_varint(out, self.counts[index])
+            previous = index
+        return base64.b64encode(zlib.compress(bytes(out))).decode("ascii")
+
+    def to_dict(self):
+        return {
+            "sub_bucket_bits": self.sub_bucket_bits,
+            "total": self.total,
+            "min_us": self.min,
+            "max_us": self.max,
+            "sum_us": self.sum,
+            "buckets": self.encode(),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls(data["sub_bucket_bits"])
+        raw = zlib.decompress(base64.b64decode(data["buckets"]))
+        position = 0
+        index = 0
+        while position < len(raw):
+            delta, position = _read_varint(raw, position)
+            count, position = _read_varint(raw, position)
+            index += delta
+            histogram.counts[index] = count
+        histogram.total = data["total"]
+        histogram.min = data["min_us"]
+        histogram.max = data["max_us"]
+        histogram.sum = data["sum_us"]
+        return histogram
+
+
+def _write_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, position):
+    result = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, position
+        shift += 7
@@ -0,0 +1,381 @@
+# src/instrumentation.py
+"""
+Per-request timing instrumentation for APIClient.
+
+APIClient calls every registered hook's pre_request(timing) before sending
+and post_request(timing) once the response (or error) is in. The timing
+object carries the endpoint template, connection-phase durations, time to
+first byte, total time and body sizes. EndpointMetrics is the stock hook: it
+aggregates those timings per endpoint into counters and histograms, and
+SampledRequestLogger logs one in N requests as a JSON line.
+
+Connection phases (DNS, TCP connect, TLS) are measured by the connection
+classes that TimingHTTPAdapter plugs into urllib3, so they are only non-zero
+for requests that had to open a new connection; pooled keep-alive requests
+report them as 0 and count as `reused`.
+"""
+
+import itertools
+import json
+from html import escape
+import logging
+import re
+import socket
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError
+
+from src.histogram import LatencyHistogram
+
+_NUMERIC_SEGMENT = re.compile(r"(?<=/)\d+(?=/|$)")
+_local = threading.local()  # Timing of the request in flight on this thread
+
+
+def endpoint_template(endpoint):
+    """Collapses numeric path segments: 'booking/123' -> 'booking/{id}'."""
+    return _NUMERIC_SEGMENT.sub("{id}", "/" + endpoint.lstrip("/"))[1:]
+
+
+class RequestTiming:
+    """Timings and sizes for one request; all durations are in seconds."""
+
+    __slots__ = (
+        "method",
+        "endpoint",
+        "url",
+        "status_code",
+        "error",
+        "dns",
+        "connect",
+        "tls",
+        "ttfb",
+        "total",
+        "request_bytes",
+        "response_bytes",
+        "started",
+    )
+
+    def __init__(self, method, endpoint, url):
+        self.method = method
+        self.endpoint = endpoint  # Template, e.g. booking/{id}
+        self.url = url
+        self.status_code = None
+        self.error = None  # Exception raised, if any (4xx/5xx included)
+        self.dns = 0.0
+        self.connect = 0.0  # TCP handshake
+        self.tls = 0.0  # TLS handshake
+        self.ttfb = 0.0  # Send start to response headers (includes the phases above)
+        self.total = 0.0  # Send start to fully read body
+        self.request_bytes = 0  # Request body size
+        self.response_bytes = 0  # Response body size
+        self.started = 0.0
+
+    @property
+    def reused_connection(self):
+        return self.dns == 0.0 and self.connect == 0.0
+
+    def as_dict(self):
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data["error"] = repr(self.error) if self.error is not None else None
+        return data
+
+
+def current_timing():
+    """The RequestTiming being collected on this thread, or None."""
+    return getattr(_local, "timing", None)
+
+
+def set_current_timing(timing):
+    _local.timing = timing
+
+
+class RequestHook:
+    """Base class for instrumentation hooks; override either callback."""
+
+    def pre_request(self, timing: RequestTiming):
+        pass
+
+    def post_request(self, timing: RequestTiming):
+        pass
+
+
+# --- Connection-phase timing ---
+
+
+class _TimedConnectionMixin:
+    def _new_conn(self):
+        timing = current_timing()
+        if timing is None:
+            return super()._new_conn()
+        started = time.perf_counter()
+        try:
+            addresses = socket.getaddrinfo(
+                self._dns_host, self.port, 0, socket.SOCK_STREAM
+            )
+        except OSError:
+            # Let urllib3 resolve again and raise its usual NameResolutionError
+            return super()._new_conn()
+        resolved = time.perf_counter()
+        timing.dns += resolved - started
+
+        # Connect to the addresses we just resolved (in order, like urllib3)
+        dns_host = self._dns_host
+        try:
+            for index, address in enumerate(addresses):
+                self._dns_host = address[4][0]
+                try:
+                    sock = super()._new_conn()
+                    break
+                except ConnectTimeoutError:
+                    if index == len(addresses) - 1:
+                        raise
+        finally:
+            self._dns_host = dns_host
+            timing.connect += time.perf_counter() - resolved
+        return sock
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    def connect(self):
+        timing = current_timing()
+        if timing is None:
+            return super().connect()
+        started = time.perf_counter()
+        before = timing.dns + timing.connect
+        try:
+            super().connect()
+        finally:
+            # Whatever connect() spent beyond DNS + TCP was the TLS handshake
+            elapsed = time.perf_counter() - started
+            timing.tls += elapsed - (timing.dns + timing.connect - before)
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimingHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections report DNS/connect/TLS phase timings."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+# --- Aggregation ---
+
+
+class _EndpointAggregate:
+    __slots__ = (
+        "count",
+        "errors",
+        "reused",
+        "request_bytes",
+        "response_bytes",
+        "dns",
+        "connect",
+        "tls",
+        "total",
+        "ttfb",
+    )
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.reused = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.dns = 0.0  # Sums; phases are rare (new connections only)
+        self.connect = 0.0
+        self.tls = 0.0
+        self.total = LatencyHistogram()
+        self.ttfb = LatencyHistogram()
+
+    def add(self, timing):
+        self.count += 1
+        if timing.error is not None:
+            self.errors += 1
+        if timing.reused_connection:
+            self.reused += 1
+        self.request_bytes += timing.request_bytes
+        self.response_bytes += timing.response_bytes
+        self.dns += timing.dns
+        self.connect += timing.connect
+        self.tls += timing.tls
+        self.total.record(timing.total)
+        self.ttfb.record(timing.ttfb)
+
+    def summary(self):
+        def ms(seconds):
+            return round(seconds * 1000, 3)
+
+        new_connections = self.count - self.reused
+        per_new = new_connections or 1
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "new_connections": new_connections,
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "total_ms": {
+                "mean": ms(self.total.mean()),
+                "p50": ms(self.total.percentile(50)),
+                "p90": ms(self.total.percentile(90)),
+                "p99": ms(self.total.percentile(99)),
+                "max": ms(self.total.max_value()),
+            },
+            "ttfb_ms": {
+                "mean": ms(self.ttfb.mean()),
+                "p50": ms(self.ttfb.percentile(50)),
+                "p99": ms(self.ttfb.percentile(99)),
+            },
+            # Averaged over the requests that actually opened a connection
+            "new_connection_ms": {
+                "dns": ms(self.dns / per_new),
+                "connect": ms(self.connect / per_new),
+                "tls": ms(self.tls / per_new),
+            },
+        }
+
+
+class EndpointMetrics(RequestHook):
+    """
+    Hook that aggregates request timings per "METHOD endpoint-template".
+
+    Recording is a dict lookup plus a few additions under a lock; raw
+    timings are not kept.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def post_request(self, timing: RequestTiming):
+        key = f"{timing.method} {timing.endpoint}"
+        with self._lock:
+            aggregate = self._endpoints.get(key)
+            if aggregate is None:
+                aggregate = self._endpoints[key] = _EndpointAggregate()
+            aggregate.add(timing)
+
+    def __len__(self):
+        return len(self._endpoints)
+
+    def summary(self):
+        with self._lock:
+            return {
+                key: aggregate.summary()
+                for key, aggregate in sorted(self._endpoints.items())
+            }
+
+    def dump_json(self, path):
+        """Writes the per-endpoint summary to `path` for run-to-run comparison."""
+        with open(path, "w") as f:
+            json.dump(
+                {"schema": "request-metrics/1", "endpoints": self.summary()},
+                f,
+                indent=2,
+            )
+
+    def html_table(self):
+        """The summary as the "Request latency by endpoint" HTML section."""
+        rows = []
+        for endpoint, stats in self.summary().items():
+            total, ttfb = stats["total_ms"], stats["ttfb_ms"]
+            cells = (
+                endpoint,
+                stats["count"],
+                stats["errors"],
+                total["p50"],
+                total["p90"],
+                total["p99"],
+                total["max"],
+                ttfb["mean"],
+                stats["new_connections"],
+                stats["response_bytes"],
+            )
+            rows.append(
+                "<tr>" + "".join(f"<td>{escape(str(c))}</td>" for c in cells) + "</tr>"
+            )
+        return (
+            "<h2>Request latency by endpoint</h2><table><thead><tr>"
+            + "".join(f"<th>{h}</th>" for h in _HTML_HEADINGS)
+            + "</tr></thead><tbody>"
+            + "".join(rows)
+            + "</tbody></table>"
+        )
+
+
+_HTML_HEADINGS = (
+    "Endpoint",
+    "Requests",
+    "Errors",
+    "p50 ms",
+    "p90 ms",
+    "p99 ms",
+    "Max ms",
+    "Mean TTFB ms",
+    "New connections",
+    "Response bytes",
+)
+
+
+class SampledRequestLogger(RequestHook):
+    """
+    Hook that logs one in `every` requests as a single-line JSON object.
+
+    Records go to the `src.requests` logger at INFO; attach a handler with a
+    plain "%(message)s" formatter to get a JSON-lines file. Unsampled requests
+    cost one counter increment, and nothing is serialized while the logger
+    is disabled for INFO.
+    """
+
+    def __init__(self, every=100, logger=None):
+        """
+        Args:
+            every: Log one request out of this many (1 logs all of them).
+            logger: Logger to write to (defaults to `src.requests`).
+        """
+        if every < 1:
+            raise ValueError("every must be at least 1")
+        self.every = every
+        self.logger = logger or logging.getLogger("src.requests")
+        self._counter = itertools.count()  # next() is atomic under the GIL
+
+    def post_request(self, timing: RequestTiming):
+        if next(self._counter) % self.every:
+            return
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        record = {
+            "ts": round(time.time(), 6),
+            "method": timing.method,
+            "endpoint": timing.endpoint,
+            "url": timing.url,
+            "status": timing.status_code,
+            "error": repr(timing.error) if timing.error is not None else None,
+            "total_ms": round(timing.total * 1000, 3),
+            "ttfb_ms": round(timing.ttfb * 1000, 3),
+            "dns_ms": round(timing.dns * 1000, 3),
+            "connect_ms": round(timing.connect * 1000, 3),
+            "tls_ms": round(timing.tls * 1000, 3),
+            "request_bytes": timing.request_bytes,
+            "response_bytes": timing.response_bytes,
+            "reused_connection": timing.reused_connection,
+        }
+        self.logger.info("%s", json.dumps(record, separators=(",", ":")))
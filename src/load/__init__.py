@@ -0,0 +1 @@
+# src/load: load generation for the booking workflow (python -m src.load).
@@ -0,0 +1,6 @@
+# src/load/__main__.py
+from src.load.cli import configure_logging, main
+
+if __name__ == "__main__":
+    configure_logging()
+    main()
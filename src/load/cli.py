@@ -0,0 +1,204 @@
+# src/load/cli.py
+"""
+Replays the booking workflow (create -> get -> put -> patch -> delete) under load.
+
+Examples:
+    python -m src.load --concurrency 20 --duration 30
+    python -m src.load --rate 50 --duration 60 --output load_summary.json
+    python -m src.load --local-server --concurrency 8 --duration 10
+    python -m src.load --rate 400 --processes 8 --duration 60
+
+Multi-node (every node runs its share across its own process pool; all of
+them need the same secret, e.g. export LOAD_AUTHKEY=$(openssl rand -hex 32)):
+    python -m src.load --serve 0.0.0.0:7100 --processes 8      # on each worker
+    python -m src.load --rate 2000 --nodes w1:7100,w2:7100     # coordinator
+"""
+
+import argparse
+import json
+import logging
+import os
+from datetime import datetime, timezone
+
+from src import config
+from src.load.distributed import (
+    LoadJob,
+    merge_outcomes,
+    parse_address,
+    run_job_processes,
+    run_on_nodes,
+    serve_node,
+)
+from src.load.runner import WORKFLOW_ENDPOINT
+
+DEFAULT_DATA_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "..", "tests", "data", "booking_data.json"
+)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m src.load",
+        description="Drive the booking workflow at a target rate or concurrency.",
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--rate",
+        type=float,
+        help="Open loop: workflow iterations started per second (5 requests each)",
+    )
+    mode.add_argument(
+        "--concurrency",
+        type=int,
+        help="Closed loop: number of workers running iterations back to back",
+    )
+    parser.add_argument(
+        "--duration", type=float, default=30.0, help="Seconds (default 30)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=50,
+        help="Open loop: max iterations in flight (default 50)",
+    )
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--base-url", help="Target API (default: API_BASE_URL)")
+    target.add_argument(
+        "--local-server",
+        action="store_true",
+        help="Start the in-process restful-booker stand-in and target it",
+    )
+    parser.add_argument(
+        "--data", default=DEFAULT_DATA_PATH, help="Booking payload JSON file"
+    )
+    parser.add_argument("--output", help="Write the JSON summary to this file")
+    scale = parser.add_argument_group("scaling out")
+    scale.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="Worker processes on this machine (or per node with --serve)",
+    )
+    scale.add_argument(
+        "--nodes", help="Coordinator: comma-separated HOST:PORT worker nodes"
+    )
+    scale.add_argument(
+        "--serve", metavar="HOST:PORT", help="Run as a worker node for a coordinator"
+    )
+    scale.add_argument(
+        "--authkey",
+        default=os.getenv("LOAD_AUTHKEY"),
+        help="Shared secret between coordinator and nodes, required with "
+        "--serve and --nodes (env LOAD_AUTHKEY)",
+    )
+    return parser
+
+
+def run(args):
+    """Runs one load test described by parsed CLI args; returns the summary dict."""
+    with open(args.data, "r") as f:
+        booking_data = json.load(f)
+
+    server = None
+    if args.local_server:
+        from src.local_server import LocalBookerServer
+
+        # Credentials only: the "local" profile needs no API_BASE_URL
+        local = config.load_settings("local")
+        server = LocalBookerServer(
+            username=local.username, password=local.password
+        ).start()
+        base_url = server.base_url
+    else:
+        base_url = args.base_url or config.BASE_URL
+
+    job = LoadJob(
+        base_url=base_url,
+        booking_data=booking_data,
+        duration=args.duration,
+        rate=args.rate,
+        concurrency=args.concurrency,
+        workers=args.workers,
+    )
+    started_at = datetime.now(timezone.utc)
+    try:
+        if args.nodes:
+            nodes = [node.strip() for node in args.nodes.split(",") if node.strip()]
+            outcomes = run_on_nodes(job, nodes, args.authkey.encode())
+        else:
+            outcomes = run_job_processes(job, args.processes)
+    finally:
+        if server is not None:
+            server.stop()
+    result, recorder = merge_outcomes(outcomes)
+
+    workflows = result.as_dict()
+    workflows["throughput_per_s"] = (
+        round(result.completed / result.duration, 3) if result.duration else 0.0
+    )
+    return {
+        "schema": "booking-load/1",
+        "started_at": started_at.isoformat(),
+        "target": base_url,
+        "mode": "open" if args.rate else "closed",
+        "rate": args.rate,
+        "concurrency": args.concurrency,
+        "workers": args.workers if args.rate else args.concurrency,
+        "processes": args.processes,
+        "nodes": args.nodes.split(",") if args.nodes else None,
+        "workflows": workflows,
+        "endpoints": recorder.summary(
+            result.duration, exclude_from_total=(WORKFLOW_ENDPOINT,)
+        ),
+        # Mergeable histograms, so separate runs can be combined later
+        "histograms": recorder.to_dict(),
+    }
+
+
+def format_summary(summary):
+    """Human-readable per-endpoint table."""
+    workflows = summary["workflows"]
+    lines = [
+        f"Target {summary['target']} ({summary['mode']} loop), "
+        f"{workflows['duration_s']}s: {workflows['completed']} workflows completed, "
+        f"{workflows['failed']} failed, {workflows['dropped']} dropped "
+        f"({workflows['throughput_per_s']}/s)",
+        "",
+        f"{'endpoint':<22}{'count':>8}{'rps':>10}{'err%':>8}"
+        f"{'p50':>10}{'p90':>10}{'p99':>10}{'p99.9':>10}  (ms)",
+    ]
+    for name, stats in summary["endpoints"].items():
+        latency = stats["latency_ms"]
+        lines.append(
+            f"{name:<22}{stats['count']:>8}{stats['throughput_rps']:>10.1f}"
+            f"{stats['error_rate'] * 100:>8.2f}{latency['p50']:>10.2f}"
+            f"{latency['p90']:>10.2f}{latency['p99']:>10.2f}{latency['p99.9']:>10.2f}"
+        )
+    return "\n".join(lines)
+
+
+def configure_logging():
+    """Logging for command-line runs (python -m src.load), not for callers of main()."""
+    # Helpers log every call at INFO; that volume would distort the results
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger("src").setLevel(logging.WARNING)
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if (args.serve or args.nodes) and not args.authkey:
+        parser.error(
+            "--serve and --nodes need a shared secret: --authkey or LOAD_AUTHKEY"
+        )
+    if args.serve:
+        serve_node(parse_address(args.serve), args.authkey.encode(), args.processes)
+        return
+    if not (args.rate or args.concurrency):
+        parser.error("one of the arguments --rate --concurrency is required")
+    summary = run(args)
+    print(format_summary(summary))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(summary, f, indent=2)
+        print(f"\nJSON summary written to {args.output}")
@@ -0,0 +1,293 @@
+# src/load/distributed.py
+"""
+Scales the booking workflow load out across processes and worker nodes.
+
+A LoadJob describes the whole run. It is split evenly (rate, concurrency
+and workers) across nodes and then across each node's process pool. Every
+process runs its share with its own APIClient and TokenManager and returns
+its counters plus a LatencyRecorder snapshot - histograms, not raw samples -
+which the coordinator merges into one summary.
+
+Worker nodes are started with `python -m src.load --serve HOST:PORT` and
+receive jobs from the coordinator (`--nodes HOST:PORT,...`) over a plain
+TCP socket. Jobs and outcomes travel as length-prefixed JSON frames - never
+pickles, so a peer can send data but not code - and every connection must
+first answer an HMAC challenge keyed with the shared secret (--authkey).
+"""
+
+import hashlib
+import hmac
+import json
+import logging
+import multiprocessing
+import os
+import socket
+import struct
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, replace
+
+from src import config
+from src.api_client import APIClient
+from src.helpers.auth import TokenManager
+from src.helpers.booking import BookingHelper
+from src.load.runner import RunResult, run_closed_loop, run_open_loop
+from src.load.stats import LatencyRecorder
+from src.load.workflow import BookingWorkflow
+
+logger = logging.getLogger(__name__)
+
+# Lead time given to nodes/processes (connect, spawn, import, authenticate)
+# so that every one of them starts generating load on the same tick
+COORDINATED_START_DELAY = 2.0
+
+# Wire format: 4-byte big-endian length, then that many bytes of UTF-8 JSON
+_FRAME_HEADER = struct.Struct(">I")
+# Outcomes are histograms, not samples; anything near this is not ours
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+_CHALLENGE_SIZE = 32
+
+
+@dataclass
+class LoadJob:
+    """Everything a worker needs to run its share of a load test."""
+
+    base_url: str
+    booking_data: dict
+    duration: float
+    rate: float = None  # Open loop: iterations per second
+    concurrency: int = None  # Closed loop: back-to-back workers
+    workers: int = 50  # Open loop: max iterations in flight
+    start_at: float = None  # Wall-clock (time.time()) start, for coordinated runs
+
+    def split(self, parts):
+        """Divides the offered load into `parts` near-equal jobs."""
+        if parts < 1:
+            raise ValueError("parts must be at least 1")
+        jobs = []
+        for i in range(parts):
+            jobs.append(
+                replace(
+                    self,
+                    rate=self.rate / parts if self.rate else None,
+                    concurrency=_share(self.concurrency, parts, i)
+                    if self.concurrency
+                    else None,
+                    workers=max(_share(self.workers, parts, i), 1),
+                )
+            )
+        # Closed loop: a part with no workers would only add idle overhead
+        return [job for job in jobs if job.rate or job.concurrency]
+
+
+def _share(total, parts, i):
+    """i-th of `parts` integer shares of `total` (earlier parts get the remainder)."""
+    return total // parts + (1 if i < total % parts else 0)
+
+
+def run_job(job: LoadJob):
+    """Runs one job in this process; returns a JSON-able outcome."""
+    in_flight = job.concurrency or job.workers
+    client = APIClient(
+        base_url=job.base_url,
+        default_headers=config.DEFAULT_HEADERS,
+        pool_maxsize=in_flight,
+    )
+    recorder = LatencyRecorder()
+    # The helpers derive endpoints from config; point it at the job's target
+    previous = config.configure(base_url=job.base_url)
+    try:
+        helper = BookingHelper(client, token_manager=TokenManager(client))
+        workflow = BookingWorkflow(helper, job.booking_data, recorder)
+        helper.token_manager.get_token()  # Authenticate once, outside the timings
+        if job.start_at is not None:
+            time.sleep(max(job.start_at - time.time(), 0))
+        if job.rate:
+            result = run_open_loop(workflow, job.rate, job.duration, job.workers)
+        else:
+            result = run_closed_loop(workflow, job.concurrency, job.duration)
+    finally:
+        client.close()
+        config.configure(previous)
+    return {"result": result.as_dict(), "stats": recorder.to_dict()}
+
+
+def merge_outcomes(outcomes):
+    """Merges run_job outcomes into one (RunResult, LatencyRecorder) pair."""
+    result = RunResult()
+    recorder = LatencyRecorder()
+    for outcome in outcomes:
+        result.merge(RunResult.from_dict(outcome["result"]))
+        recorder.merge(LatencyRecorder.from_dict(outcome["stats"]))
+    return result, recorder
+
+
+def _quiet_logging():
+    # Spawned workers start unconfigured; helpers log every call at INFO
+    logging.getLogger("src").setLevel(logging.WARNING)
+
+
+def run_job_processes(job: LoadJob, processes: int):
+    """Runs `job` split across a pool of `processes` worker processes."""
+    if processes <= 1:
+        return [run_job(job)]
+    if job.start_at is None:
+        job = replace(job, start_at=time.time() + COORDINATED_START_DELAY)
+    # Spawn (not fork): the parent may already be running threads
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=processes, mp_context=context, initializer=_quiet_logging
+    ) as pool:
+        return list(pool.map(run_job, job.split(processes)))
+
+
+def _merged_outcome(outcomes):
+    result, recorder = merge_outcomes(outcomes)
+    return {"result": result.as_dict(), "stats": recorder.to_dict()}
+
+
+# --- Multi-node ---
+
+
+class ProtocolError(ConnectionError):
+    """A peer failed authentication or sent a malformed frame."""
+
+
+def parse_address(address):
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def _recv_exactly(sock, size):
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise EOFError("Connection closed mid-frame")
+        data += chunk
+    return bytes(data)
+
+
+def send_message(sock, message):
+    """Sends one JSON-serializable message as a length-prefixed frame."""
+    payload = json.dumps(message).encode("utf-8")
+    sock.sendall(_FRAME_HEADER.pack(len(payload)) + payload)
+
+
+def recv_message(sock):
+    """Receives one frame and decodes it; raises ProtocolError on garbage."""
+    (size,) = _FRAME_HEADER.unpack(_recv_exactly(sock, _FRAME_HEADER.size))
+    if size > MAX_FRAME_SIZE:
+        raise ProtocolError(f"Frame of {size} bytes exceeds {MAX_FRAME_SIZE}")
+    try:
+        return json.loads(_recv_exactly(sock, size))
+    except ValueError as e:
+        raise ProtocolError(f"Malformed frame: {e}") from e
+
+
+def _digest(authkey, challenge):
+    return hmac.new(authkey, challenge, hashlib.sha256).digest()
+
+
+def _require_authkey(authkey):
+    if not authkey:
+        raise ValueError("An authkey (shared secret) is required")
+
+
+def serve_node(address, authkey: bytes, processes: int, max_jobs=None, ready=None):
+    """
+    Runs a worker node: accepts jobs from a coordinator, runs each across this
+    machine's process pool and replies with the merged outcome.
+
+    Args:
+        address: (host, port) to listen on; port 0 picks a free one.
+        authkey: Shared secret; connections that cannot prove it are dropped.
+        processes: Worker processes to use per job.
+        max_jobs: Stop after this many jobs (None serves forever).
+        ready: Called with the bound (host, port) once listening.
+    """
+    _require_authkey(authkey)
+    with socket.create_server(address) as listener:
+        bound = listener.getsockname()[:2]
+        logger.warning("Load worker node listening on %s:%s", bound[0], bound[1])
+        if ready is not None:
+            ready(bound)
+        served = 0
+        while max_jobs is None or served < max_jobs:
+            conn, peer = listener.accept()
+            with conn:
+                try:
+                    challenge = os.urandom(_CHALLENGE_SIZE)
+                    conn.sendall(challenge)
+                    answer = _recv_exactly(conn, hashlib.sha256().digest_size)
+                    if not hmac.compare_digest(answer, _digest(authkey, challenge)):
+                        raise ProtocolError("Authentication failed")
+                    send_message(conn, {"authenticated": True})
+                    job = LoadJob(**recv_message(conn))
+                except (OSError, EOFError, TypeError) as e:
+                    # Not a job from our coordinator: drop it, keep serving
+                    logger.warning("Rejected connection from %s: %r", peer, e)
+                    continue
+                logger.warning("Running job from %s", peer)
+                try:
+                    reply = {
+                        "ok": True,
+                        **_merged_outcome(run_job_processes(job, processes)),
+                    }
+                except Exception as e:  # Report failures back instead of dying
+                    logger.exception("Load job failed")
+                    reply = {"ok": False, "error": repr(e)}
+                try:
+                    send_message(conn, reply)
+                except OSError as e:
+                    logger.warning("Could not reply to %s: %r", peer, e)
+            served += 1
+
+
+def _request(node, authkey, message):
+    """Authenticates to a worker node, sends one job and returns its reply."""
+    with socket.create_connection(parse_address(node)) as sock:
+        challenge = _recv_exactly(sock, _CHALLENGE_SIZE)
+        sock.sendall(_digest(authkey, challenge))
+        try:
+            recv_message(sock)  # Acknowledgement; the node hangs up on a bad key
+        except EOFError:
+            raise ProtocolError("Authentication failed (check --authkey)") from None
+        send_message(sock, message)
+        # No timeout: the reply comes once the job's duration has elapsed
+        return recv_message(sock)
+
+
+def run_on_nodes(job: LoadJob, nodes, authkey: bytes):
+    """
+    Splits `job` across worker nodes, starts them on a common tick and
+    returns their outcomes (one merged outcome per node).
+    """
+    _require_authkey(authkey)
+    job = replace(job, start_at=time.time() + COORDINATED_START_DELAY)
+    parts = job.split(len(nodes))
+    outcomes = [None] * len(parts)
+    errors = []
+
+    def dispatch(i, node, part):
+        try:
+            reply = _request(node, authkey, asdict(part))
+            if reply.pop("ok"):
+                outcomes[i] = reply
+            else:
+                errors.append(f"{node}: {reply['error']}")
+        except (OSError, EOFError) as e:
+            errors.append(f"{node}: {e!r}")
+
+    threads = [
+        threading.Thread(target=dispatch, args=(i, node, part))
+        for i, (node, part) in enumerate(zip(nodes, parts))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise RuntimeError(f"Load workers failed: {'; '.join(errors)}")
+    return outcomes
@@ -0,0 +1,143 @@
+# src/load/runner.py
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+WORKFLOW_ENDPOINT = "workflow"  # Recorder key for whole-iteration latency
+
+
+class RunResult:
+    """Counters for one load run (latencies live in the recorder)."""
+
+    def __init__(self):
+        self.completed = 0
+        self.failed = 0
+        self.dropped = (
+            0  # Open loop only: starts skipped because workers were saturated
+        )
+        self.duration = 0.0
+        self._lock = threading.Lock()
+
+    def count(self, ok):
+        with self._lock:
+            if ok:
+                self.completed += 1
+            else:
+                self.failed += 1
+
+    def merge(self, other):
+        """Combines counters from a run that executed in parallel with this one."""
+        self.completed += other.completed
+        self.failed += other.failed
+        self.dropped += other.dropped
+        self.duration = max(self.duration, other.duration)
+        return self
+
+    def as_dict(self):
+        return {
+            "completed": self.completed,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "duration_s": round(self.duration, 3),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        result = cls()
+        result.completed = data["completed"]
+        result.failed = data["failed"]
+        result.dropped = data["dropped"]
+        result.duration = data["duration_s"]
+        return result
+
+
+def run_closed_loop(workflow, concurrency, duration):
+    """
+    Runs `concurrency` workers, each starting a new iteration as soon as the
+    previous one finishes, for `duration` seconds.
+    """
+    result = RunResult()
+    deadline = time.perf_counter() + duration
+
+    def worker():
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            ok = workflow.run_once()
+            workflow.recorder.record(
+                WORKFLOW_ENDPOINT, time.perf_counter() - started, ok
+            )
+            result.count(ok)
+
+    started = time.perf_counter()
+    threads = [
+        threading.Thread(target=worker, name=f"load-{i}", daemon=True)
+        for i in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    result.duration = time.perf_counter() - started
+    return result
+
+
+def run_open_loop(workflow, rate, duration, max_workers, max_backlog=None):
+    """
+    Starts `rate` iterations per second on a fixed schedule for `duration`
+    seconds, independent of how fast earlier iterations complete.
+
+    Whole-iteration latency is measured from each iteration's *scheduled*
+    start, so queueing delay under overload shows up in the results instead of
+    silently lowering the offered rate (coordinated omission).
+
+    Args:
+        workflow: BookingWorkflow to run.
+        rate: Iterations started per second.
+        duration: Seconds to keep issuing new iterations.
+        max_workers: Threads available to run iterations concurrently.
+        max_backlog: Scheduled-but-unstarted iterations allowed before new
+            starts are dropped (defaults to 10 * max_workers).
+    """
+    if rate <= 0:
+        raise ValueError("rate must be positive")
+    result = RunResult()
+    max_backlog = max_backlog or 10 * max_workers
+    backlog = threading.Semaphore(max_workers + max_backlog)
+    interval = 1.0 / rate
+
+    def run_scheduled(scheduled_at):
+        try:
+            ok = workflow.run_once()
+            workflow.recorder.record(
+                WORKFLOW_ENDPOINT, time.perf_counter() - scheduled_at, ok
+            )
+            result.count(ok)
+        finally:
+            backlog.release()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        n = 0
+        while True:
+            scheduled_at = started + n * interval
+            if scheduled_at - started >= duration:
+                break
+            delay = scheduled_at - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            if backlog.acquire(blocking=False):
+                executor.submit(run_scheduled, scheduled_at)
+            else:
+                result.dropped += 1
+            n += 1
+    result.duration = time.perf_counter() - started
+    if result.dropped:
+        logger.warning(
+            "Dropped %s scheduled iterations: the target or the worker pool could "
+            "not keep up with the requested rate.",
+            result.dropped,
+        )
+    return result
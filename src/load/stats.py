@@ -0,0 +1,126 @@
+# src/load/stats.py
+import threading
+
+from src.histogram import LatencyHistogram
+
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+class EndpointStats:
+    """Latency histogram and outcome counts for one endpoint."""
+
+    def __init__(self):
+        self.histogram = LatencyHistogram()  # Successful and failed calls alike
+        self.count = 0
+        self.errors = 0
+        self.status_codes = {}
+
+    def record(self, seconds, ok=True, status_code=None):
+        self.histogram.record(seconds)
+        self.count += 1
+        if not ok:
+            self.errors += 1
+        if status_code is not None:
+            self.status_codes[status_code] = self.status_codes.get(status_code, 0) + 1
+
+    def merge(self, other):
+        self.histogram.merge(other.histogram)
+        self.count += other.count
+        self.errors += other.errors
+        for code, n in other.status_codes.items():
+            self.status_codes[code] = self.status_codes.get(code, 0) + n
+        return self
+
+    def summary(self, duration):
+        histogram = self.histogram
+        latency_ms = {
+            f"p{pct:g}": round(histogram.percentile(pct) * 1000, 3)
+            for pct in PERCENTILES
+        }
+        latency_ms["mean"] = round(histogram.mean() * 1000, 3)
+        latency_ms["max"] = round(histogram.max_value() * 1000, 3)
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "error_rate": round(self.errors / self.count, 6) if self.count else 0.0,
+            "throughput_rps": round(self.count / duration, 3) if duration else 0.0,
+            "status_codes": {str(k): v for k, v in sorted(self.status_codes.items())},
+            "latency_ms": latency_ms,
+        }
+
+    def to_dict(self):
+        return {
+            "histogram": self.histogram.to_dict(),
+            "count": self.count,
+            "errors": self.errors,
+            "status_codes": self.status_codes,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        stats.histogram = LatencyHistogram.from_dict(data["histogram"])
+        stats.count = data["count"]
+        stats.errors = data["errors"]
+        stats.status_codes = {int(k): v for k, v in data["status_codes"].items()}
+        return stats
+
+
+class LatencyRecorder:
+    """
+    Thread-safe per-endpoint recorder shared by all load workers.
+
+    Recorders from other processes or nodes are combined with merge(); they
+    travel as to_dict() snapshots, which hold histograms rather than samples.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.endpoints = {}
+
+    def record(self, endpoint, seconds, ok=True, status_code=None):
+        with self._lock:
+            stats = self.endpoints.get(endpoint)
+            if stats is None:
+                stats = self.endpoints[endpoint] = EndpointStats()
+            stats.record(seconds, ok, status_code)
+
+    def merge(self, other):
+        with self._lock:
+            for name, stats in other.endpoints.items():
+                mine = self.endpoints.get(name)
+                if mine is None:
+                    mine = self.endpoints[name] = EndpointStats()
+                mine.merge(stats)
+        return self
+
+    def to_dict(self):
+        with self._lock:
+            return {name: stats.to_dict() for name, stats in self.endpoints.items()}
+
+    @classmethod
+    def from_dict(cls, data):
+        recorder = cls()
+        recorder.endpoints = {
+            name: EndpointStats.from_dict(stats) for name, stats in data.items()
+        }
+        return recorder
+
+    def summary(self, duration, exclude_from_total=()):
+        """
+        Per-endpoint summaries plus a 'total' row across all endpoints.
+
+        Args:
+            duration: Run length in seconds, used for throughput.
+            exclude_from_total: Keys reported on their own but left out of the
+                total (e.g. whole-workflow latency, which spans other rows).
+        """
+        with self._lock:
+            total = EndpointStats()
+            result = {}
+            for name, stats in sorted(self.endpoints.items()):
+                result[name] = stats.summary(duration)
+                if name not in exclude_from_total:
+                    total.merge(stats)
+            result["total"] = total.summary(duration)
+            return result
@@ -0,0 +1,80 @@
+# src/load/workflow.py
+import time
+
+import requests
+
+from src.helpers.booking import BookingHelper
+
+# The same sequence as tests/test_booking.py::TestBookingWorkflow
+STEPS = (
+    "POST /booking",
+    "GET /booking/{id}",
+    "PUT /booking/{id}",
+    "PATCH /booking/{id}",
+    "DELETE /booking/{id}",
+)
+
+UPDATED_DATA = {
+    "firstname": "Load-Updated",
+    "lastname": "User-Updated",
+    "totalprice": 200,
+    "depositpaid": False,
+    "bookingdates": {"checkin": "2025-02-01", "checkout": "2025-02-05"},
+    "additionalneeds": "Dinner",
+}
+PARTIAL_DATA = {"firstname": "Load-Patched", "additionalneeds": "Late Checkout"}
+
+
+class BookingWorkflow:
+    """
+    One iteration of create -> get -> put -> patch -> delete.
+
+    Each step's latency and outcome is reported to `recorder` under the
+    endpoint template name (see STEPS). A failed step ends the iteration,
+    since the remaining steps depend on the booking it would have produced.
+    """
+
+    def __init__(self, helper: BookingHelper, booking_data, recorder):
+        if helper.token_manager is None:
+            raise ValueError(
+                "BookingWorkflow needs a BookingHelper with a token_manager"
+            )
+        self.helper = helper
+        self.booking_data = booking_data
+        self.recorder = recorder
+
+    def _step(self, endpoint, call):
+        started = time.perf_counter()
+        try:
+            response = call()
+        except requests.exceptions.RequestException as e:
+            status = e.response.status_code if e.response is not None else None
+            self.recorder.record(endpoint, time.perf_counter() - started, False, status)
+            return None
+        self.recorder.record(
+            endpoint, time.perf_counter() - started, True, response.status_code
+        )
+        return response
+
+    def run_once(self):
+        """Runs one full iteration. Returns True if every step succeeded."""
+        helper = self.helper
+        response = self._step(
+            STEPS[0], lambda: helper.create_booking(self.booking_data)
+        )
+        if response is None:
+            return False
+        booking_id = response.json()["bookingid"]
+        steps = (
+            (STEPS[1], lambda: helper.get_booking(booking_id)),
+            (STEPS[2], lambda: helper.update_booking(booking_id, UPDATED_DATA)),
+            (
+                STEPS[3],
+                lambda: helper.partial_update_booking(booking_id, PARTIAL_DATA),
+            ),
+            (STEPS[4], lambda: helper.delete_booking(booking_id)),
+        )
+        for endpoint, call in steps:
+            if self._step(endpoint, call) is None:
+                return False
+        return True
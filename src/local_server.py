@@ -0,0 +1,471 @@
+# src/local_server.py
+"""
+In-process stand-in for restful-booker (/ping, /auth and /booking).
+
+Bookings live in memory, the server starts in a few milliseconds on a
+background thread, and it can inject latency and errors. It speaks just
+enough HTTP/1.1 (keep-alive, Content-Length bodies) for requests and httpx,
+and runs on asyncio so a single process serves thousands of requests per
+second - enough to act as a fixed target for client benchmarks and load tests.
+With max_in_flight it also throttles like a shared instance under load.
+
+Usage:
+    with LocalBookerServer(latency=0.01, error_rate=0.05) as server:
+        client = APIClient(base_url=server.base_url)
+
+    python -m src.local_server --port 3001 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import random
+import secrets
+import threading
+from datetime import date
+from urllib.parse import parse_qsl, urlsplit
+
+from src import config
+
+logger = logging.getLogger(__name__)
+
+_REASONS = {
+    200: "OK",
+    201: "Created",
+    304: "Not Modified",
+    400: "Bad Request",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    411: "Length Required",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+_BOOKING_FIELDS = ("firstname", "lastname", "totalprice", "depositpaid")
+_MAX_HEADER_BYTES = 64 * 1024
+
+
+class BookingStore:
+    """In-memory bookings and issued tokens, mirroring restful-booker's rules."""
+
+    def __init__(self, username=None, password=None):
+        self.username = username or config.AUTH_USERNAME
+        self.password = password or config.AUTH_PASSWORD
+        self.bookings = {}
+        self.tokens = set()
+        self._next_id = 1
+
+    def issue_token(self, credentials):
+        if (
+            isinstance(credentials, dict)
+            and credentials.get("username") == self.username
+            and credentials.get("password") == self.password
+        ):
+            token = secrets.token_hex(8)[:15]
+            self.tokens.add(token)
+            return {"token": token}
+        # restful-booker answers bad credentials with 200 and a reason
+        return {"reason": "Bad credentials"}
+
+    def is_authorized(self, headers):
+        cookie = headers.get("cookie", "")
+        for part in cookie.split(";"):
+            name, _, value = part.strip().partition("=")
+            if name == "token" and value in self.tokens:
+                return True
+        # restful-booker also accepts HTTP Basic auth with the admin credentials
+        authorization = headers.get("authorization", "")
+        if authorization.startswith("Basic "):
+            expected = f"{self.username}:{self.password}".encode()
+            try:
+                return base64.b64decode(authorization[6:]) == expected
+            except ValueError:
+                return False
+        return False
+
+    def create(self, booking):
+        booking_id = self._next_id
+        self._next_id += 1
+        self.bookings[booking_id] = booking
+        return booking_id
+
+    def filter_ids(self, params):
+        """IDs matching the optional firstname/lastname/checkin/checkout filters."""
+        matches = []
+        for booking_id, booking in self.bookings.items():
+            dates = booking["bookingdates"]
+            if "firstname" in params and booking["firstname"] != params["firstname"]:
+                continue
+            if "lastname" in params and booking["lastname"] != params["lastname"]:
+                continue
+            if "checkin" in params and dates["checkin"] < params["checkin"]:
+                continue
+            if "checkout" in params and dates["checkout"] < params["checkout"]:
+                continue
+            matches.append({"bookingid": booking_id})
+        return matches
+
+
+def validate_booking(data, partial=False):
+    """Returns a normalized booking dict, or None if the payload is invalid."""
+    if not isinstance(data, dict):
+        return None
+    required = () if partial else (*_BOOKING_FIELDS, "bookingdates")
+    if any(field not in data for field in required):
+        return None
+    booking = {}
+    for field in _BOOKING_FIELDS:
+        if field in data:
+            booking[field] = data[field]
+    if "bookingdates" in data:
+        dates = data["bookingdates"]
+        if not isinstance(dates, dict):
+            return None
+        booking["bookingdates"] = {}
+        for key in ("checkin", "checkout"):
+            if key in dates:
+                try:
+                    booking["bookingdates"][key] = date.fromisoformat(
+                        dates[key]
+                    ).isoformat()
+                except (TypeError, ValueError):
+                    return None
+            elif not partial:
+                return None
+    if "additionalneeds" in data:
+        booking["additionalneeds"] = data["additionalneeds"]
+    return booking
+
+
+class LocalBookerServer:
+    """Runs the stand-in API on its own event loop in a daemon thread."""
+
+    def __init__(
+        self,
+        host="127.0.0.1",
+        port=0,
+        latency=0.0,
+        latency_jitter=0.0,
+        slow_rate=0.0,
+        slow_latency=0.0,
+        error_rate=0.0,
+        error_status=503,
+        max_in_flight=None,
+        retry_after=None,
+        seed=None,
+        username=None,
+        password=None,
+    ):
+        """
+        Args:
+            host: Interface to bind.
+            port: Port to bind (0 picks a free port).
+            latency: Seconds added to every response.
+            latency_jitter: Extra uniformly random seconds (0..jitter) per response.
+            slow_rate: Fraction of requests (0..1) that stall for `slow_latency`
+                extra seconds, to model a heavy latency tail.
+            slow_latency: Extra seconds for the stalled requests.
+            error_rate: Fraction of requests (0..1) answered with `error_status`.
+            error_status: Status code used for injected errors.
+            max_in_flight: Requests processed at once; any beyond that are
+                answered 429 straight away (None: unlimited).
+            retry_after: Retry-After seconds sent with 429/503 responses
+                (None: no header).
+            seed: Seed for the latency/error random generator (reproducible runs).
+            username: Accepted /auth username (defaults to config).
+            password: Accepted /auth password (defaults to config).
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.slow_rate = slow_rate
+        self.slow_latency = slow_latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.max_in_flight = max_in_flight
+        self.retry_after = retry_after
+        self.store = BookingStore(username, password)
+        self.requests_served = 0
+        self.connections_accepted = 0
+        self.requests_throttled = 0
+        self._in_flight = 0
+        self._random = random.Random(seed)
+        self._loop = None
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}"
+
+    # --- Lifecycle ---
+
+    def start(self):
+        """Starts serving in a background thread and returns once bound."""
+        if self._thread is not None:
+            raise RuntimeError("Server already started")
+        ready = threading.Event()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run, args=(ready,), name="local-booker", daemon=True
+        )
+        self._thread.start()
+        ready.wait()
+        if self._server is None:
+            raise RuntimeError(f"Could not bind {self.host}:{self.port}")
+        logger.info("Local restful-booker listening on %s", self.base_url)
+        return self
+
+    def stop(self):
+        """Stops the server and joins its thread."""
+        if self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _run(self, ready):
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._server = self._loop.run_until_complete(
+                asyncio.start_server(self._handle_connection, self.host, self.port)
+            )
+            self.port = self._server.sockets[0].getsockname()[1]
+        except OSError:
+            logger.exception("Local restful-booker failed to start")
+            return
+        finally:
+            ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._server.close()
+            # Drop keep-alive connections that are still parked on a read
+            tasks = asyncio.all_tasks(self._loop)
+            for task in tasks:
+                task.cancel()
+            self._loop.run_until_complete(
+                asyncio.gather(*tasks, return_exceptions=True)
+            )
+            self._loop.run_until_complete(self._server.wait_closed())
+            self._loop.close()
+
+    # --- HTTP plumbing ---
+
+    async def _handle_connection(self, reader, writer):
+        self.connections_accepted += 1
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    break
+                if len(head) > _MAX_HEADER_BYTES:
+                    break
+                request_line, *header_lines = head[:-4].decode("latin-1").split("\r\n")
+                method, target, version = request_line.split(" ", 2)
+                headers = {}
+                for line in header_lines:
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                if "content-length" in headers:
+                    try:
+                        body = await reader.readexactly(int(headers["content-length"]))
+                    except asyncio.IncompleteReadError:
+                        break  # Client hung up mid-body
+                elif headers.get("transfer-encoding"):
+                    writer.write(self._render(411, "Length Required", close=True))
+                    break
+                else:
+                    body = b""
+
+                if self.max_in_flight is not None and (
+                    self._in_flight >= self.max_in_flight
+                ):
+                    self.requests_throttled += 1
+                    status, payload = 429, _REASONS[429]
+                else:
+                    self._in_flight += 1
+                    try:
+                        status, payload = await self._dispatch(
+                            method, target, headers, body
+                        )
+                    finally:
+                        self._in_flight -= 1
+                connection = headers.get("connection", "").lower()
+                close = connection == "close" or (
+                    version == "HTTP/1.0" and connection != "keep-alive"
+                )
+                writer.write(
+                    self._render(
+                        status,
+                        payload,
+                        close=close,
+                        etag=method == "GET",
+                        if_none_match=headers.get("if-none-match"),
+                        retry_after=self.retry_after,
+                        head_only=method == "HEAD",
+                    )
+                )
+                await writer.drain()
+                self.requests_served += 1
+                if close:
+                    break
+        except (ConnectionError, ValueError):
+            pass  # Client went away or sent garbage; drop the connection
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _render(
+        status,
+        payload,
+        close=False,
+        etag=False,
+        if_none_match=None,
+        retry_after=None,
+        head_only=False,
+    ):
+        """
+        Serializes a response. With `etag`, a 200 carries an ETag of its body
+        and becomes a body-less 304 when it matches `if_none_match`; 429/503
+        responses carry `retry_after` as a Retry-After header. With `head_only`
+        (a HEAD request) only the headers are sent, Content-Length included.
+        """
+        if isinstance(payload, str):
+            body = payload.encode()
+            content_type = "text/plain; charset=utf-8"
+        else:
+            body = json.dumps(payload, separators=(",", ":")).encode()
+            content_type = "application/json; charset=utf-8"
+        connection = f"Connection: {'close' if close else 'keep-alive'}\r\n\r\n"
+        validator = ""
+        if etag and status == 200:
+            tag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+            if if_none_match == tag:
+                return (
+                    f"HTTP/1.1 304 Not Modified\r\nETag: {tag}\r\n{connection}".encode()
+                )
+            validator = f"ETag: {tag}\r\n"
+        elif retry_after is not None and status in (429, 503):
+            validator = f"Retry-After: {retry_after:g}\r\n"
+        head = (
+            f"HTTP/1.1 {status} {_REASONS.get(status, 'Unknown')}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"{validator}{connection}"
+        )
+        return head.encode() if head_only else head.encode() + body
+
+    async def _dispatch(self, method, target, headers, body):
+        delay = self.latency
+        if self.latency_jitter:
+            delay += self._random.uniform(0, self.latency_jitter)
+        if self.slow_rate and self._random.random() < self.slow_rate:
+            delay += self.slow_latency
+        if delay:
+            await asyncio.sleep(delay)
+        if self.error_rate and self._random.random() < self.error_rate:
+            return self.error_status, _REASONS.get(self.error_status, "Error")
+
+        url = urlsplit(target)
+        parts = [part for part in url.path.split("/") if part]
+        params = dict(parse_qsl(url.query))
+        try:
+            data = json.loads(body) if body else None
+        except ValueError:
+            return 400, "Bad Request"
+
+        if parts == ["ping"] and method in ("GET", "HEAD"):
+            return 201, "Created"
+        if parts == ["auth"] and method == "POST":
+            return 200, self.store.issue_token(data)
+        if parts == ["booking"]:
+            if method == "GET":
+                return 200, self.store.filter_ids(params)
+            if method == "POST":
+                booking = validate_booking(data)
+                if booking is None:
+                    return 500, "Internal Server Error"
+                booking_id = self.store.create(booking)
+                return 200, {"bookingid": booking_id, "booking": booking}
+        if len(parts) == 2 and parts[0] == "booking" and parts[1].isdigit():
+            return self._booking_item(method, int(parts[1]), headers, data)
+        return 404, "Not Found"
+
+    def _booking_item(self, method, booking_id, headers, data):
+        store = self.store
+        if method == "GET":
+            booking = store.bookings.get(booking_id)
+            return (200, booking) if booking is not None else (404, "Not Found")
+        if method not in ("PUT", "PATCH", "DELETE"):
+            return 404, "Not Found"
+        if not store.is_authorized(headers):
+            return 403, "Forbidden"
+        if booking_id not in store.bookings:
+            return 405, "Method Not Allowed"
+        if method == "DELETE":
+            del store.bookings[booking_id]
+            return 201, "Created"
+        update = validate_booking(data, partial=method == "PATCH")
+        if update is None:
+            return 400, "Bad Request"
+        booking = store.bookings[booking_id]
+        if method == "PUT":
+            booking = update
+        else:
+            dates = {**booking["bookingdates"], **update.pop("bookingdates", {})}
+            booking = {**booking, **update, "bookingdates": dates}
+        store.bookings[booking_id] = booking
+        return 200, booking
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local restful-booker stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3001)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="Seconds")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="0..1")
+    parser.add_argument("--slow-latency", type=float, default=0.0, help="Seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="0..1")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--max-in-flight", type=int, help="Throttle with 429s")
+    parser.add_argument("--retry-after", type=float, help="Seconds, on 429/503")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    server = LocalBookerServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        slow_rate=args.slow_rate,
+        slow_latency=args.slow_latency,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        max_in_flight=args.max_in_flight,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    ).start()
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
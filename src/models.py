@@ -0,0 +1,254 @@
+# src/models.py
+"""
+Typed, compact Booking and BookingDates models.
+
+Bookings are validated once, when parsed: field types, ISO dates, and
+checkout not before checkin. After that the fields can be trusted. Both
+classes use __slots__, names are interned and dates are shared date
+objects, so a million bookings take a fraction of the memory of the
+equivalent dicts (python -m benchmarks.bench_models).
+
+    booking = Booking.from_json(response.content)   # bytes -> Booking
+    booking.to_json()                                # Booking -> bytes
+
+BookingHelper accepts a Booking wherever it takes booking data, and returns
+one from get/create/update calls made with model=True.
+"""
+
+import functools
+import json
+import math
+import sys
+from datetime import date
+
+from src.codec import get_codec
+
+# C-accelerated JSON string escaping, the one json.dumps uses
+_quote = json.encoder.encode_basestring
+
+
+class BookingValidationError(ValueError):
+    """A booking payload has a missing or mistyped field, or impossible dates."""
+
+    def __init__(self, field, message):
+        super().__init__(f"{field}: {message}")
+        self.field = field
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date(value):
+    # Bookings share a handful of dates, so they share the date objects too
+    return date.fromisoformat(value)
+
+
+def _require(data, field, types, path=""):
+    try:
+        value = data[field]
+    except KeyError:
+        raise BookingValidationError(path + field, "missing") from None
+    except TypeError:
+        raise BookingValidationError(path or "booking", "expected an object") from None
+    # bool is an int subclass; it is never a valid price
+    if not isinstance(value, types) or (isinstance(value, bool) and bool not in types):
+        expected = " or ".join(t.__name__ for t in types)
+        raise BookingValidationError(
+            path + field, f"expected {expected}, got {type(value).__name__}"
+        )
+    return value
+
+
+class BookingDates:
+    """Check-in and check-out dates; checkout is never before checkin."""
+
+    __slots__ = ("checkin", "checkout")
+
+    def __init__(self, checkin, checkout):
+        if checkout < checkin:
+            raise BookingValidationError(
+                "bookingdates", f"checkout {checkout} is before checkin {checkin}"
+            )
+        self.checkin = checkin
+        self.checkout = checkout
+
+    @classmethod
+    def from_dict(cls, data):
+        """Parses {"checkin": "YYYY-MM-DD", "checkout": "YYYY-MM-DD"}."""
+        dates = []
+        for field in ("checkin", "checkout"):
+            value = _require(data, field, (str,), "bookingdates.")
+            try:
+                dates.append(_parse_date(value))
+            except ValueError:
+                raise BookingValidationError(
+                    f"bookingdates.{field}", f"not an ISO date: {value!r}"
+                ) from None
+        return cls(*dates)
+
+    def to_dict(self):
+        return {
+            "checkin": self.checkin.isoformat(),
+            "checkout": self.checkout.isoformat(),
+        }
+
+    @property
+    def nights(self):
+        return (self.checkout - self.checkin).days
+
+    def __eq__(self, other):
+        if not isinstance(other, BookingDates):
+            return NotImplemented
+        return (self.checkin, self.checkout) == (other.checkin, other.checkout)
+
+    def __hash__(self):
+        return hash((self.checkin, self.checkout))
+
+    def __repr__(self):
+        return (
+            f"BookingDates({self.checkin.isoformat()} -> {self.checkout.isoformat()})"
+        )
+
+
+class Booking:
+    """
+    A restful-booker booking. booking_id is set when the booking came from
+    (or was created on) the server; it is not part of the payload.
+    """
+
+    __slots__ = (
+        "firstname",
+        "lastname",
+        "totalprice",
+        "depositpaid",
+        "bookingdates",
+        "additionalneeds",
+        "booking_id",
+    )
+
+    def __init__(
+        self,
+        firstname,
+        lastname,
+        totalprice,
+        depositpaid,
+        bookingdates,
+        additionalneeds=None,
+        booking_id=None,
+    ):
+        """Builds a booking from already-typed values (see from_dict to parse)."""
+        self.firstname = sys.intern(firstname)
+        self.lastname = sys.intern(lastname)
+        self.totalprice = totalprice
+        self.depositpaid = depositpaid
+        self.bookingdates = bookingdates
+        self.additionalneeds = (
+            sys.intern(additionalneeds) if additionalneeds is not None else None
+        )
+        self.booking_id = booking_id
+
+    # --- Parsing ---
+
+    @classmethod
+    def from_dict(cls, data, booking_id=None):
+        """
+        Validates and parses a booking payload.
+
+        Raises:
+            BookingValidationError: A field is missing or has the wrong type,
+                a date is not ISO formatted, or checkout is before checkin.
+        """
+        additionalneeds = (
+            data.get("additionalneeds") if isinstance(data, dict) else None
+        )
+        if additionalneeds is not None and not isinstance(additionalneeds, str):
+            raise BookingValidationError(
+                "additionalneeds", f"expected str, got {type(additionalneeds).__name__}"
+            )
+        totalprice = _require(data, "totalprice", (int, float))
+        if isinstance(totalprice, float) and not math.isfinite(totalprice):
+            raise BookingValidationError("totalprice", f"not finite: {totalprice}")
+        return cls(
+            _require(data, "firstname", (str,)),
+            _require(data, "lastname", (str,)),
+            totalprice,
+            _require(data, "depositpaid", (bool,)),
+            BookingDates.from_dict(_require(data, "bookingdates", (dict,))),
+            additionalneeds,
+            booking_id,
+        )
+
+    @classmethod
+    def from_json(cls, data, codec=None, booking_id=None):
+        """Parses a booking from JSON bytes (decoded with `codec`, default auto)."""
+        return cls.from_dict((codec or _default_codec()).decode(data), booking_id)
+
+    @classmethod
+    def from_response(cls, response, booking_id=None):
+        """
+        Parses a GET/PUT/PATCH booking response, or a create response
+        ({"bookingid": ..., "booking": {...}}), taking its booking_id.
+        """
+        data = response.json()
+        if isinstance(data, dict) and "bookingid" in data and "booking" in data:
+            return cls.from_dict(data["booking"], data["bookingid"])
+        return cls.from_dict(data, booking_id)
+
+    # --- Serializing ---
+
+    def to_json(self):
+        """The booking payload as compact JSON bytes, without building a dict."""
+        dates = self.bookingdates
+        extra = (
+            f',"additionalneeds":{_quote(self.additionalneeds)}'
+            if self.additionalneeds is not None
+            else ""
+        )
+        return (
+            f'{{"firstname":{_quote(self.firstname)},'
+            f'"lastname":{_quote(self.lastname)},'
+            f'"totalprice":{self.totalprice!r},'
+            f'"depositpaid":{"true" if self.depositpaid else "false"},'
+            f'"bookingdates":{{"checkin":"{dates.checkin.isoformat()}",'
+            f'"checkout":"{dates.checkout.isoformat()}"}}{extra}}}'
+        ).encode()
+
+    def to_dict(self):
+        """The booking payload as a dict (for json= or comparisons)."""
+        data = {
+            "firstname": self.firstname,
+            "lastname": self.lastname,
+            "totalprice": self.totalprice,
+            "depositpaid": self.depositpaid,
+            "bookingdates": self.bookingdates.to_dict(),
+        }
+        if self.additionalneeds is not None:
+            data["additionalneeds"] = self.additionalneeds
+        return data
+
+    def replace(self, **changes):
+        """A copy with `changes` applied (bookings are otherwise left as built)."""
+        fields = {name: getattr(self, name) for name in self.__slots__}
+        fields.update(changes)
+        return Booking(**fields)
+
+    def __eq__(self, other):
+        """Payload equality; booking_id is ignored."""
+        if not isinstance(other, Booking):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name)
+            for name in self.__slots__
+            if name != "booking_id"
+        )
+
+    __hash__ = None  # Mutable
+
+    def __repr__(self):
+        return (
+            f"Booking(id={self.booking_id}, {self.firstname} {self.lastname}, "
+            f"{self.totalprice}, {self.bookingdates!r})"
+        )
+
+
+@functools.cache
+def _default_codec():
+    return get_codec()
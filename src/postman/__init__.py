@@ -0,0 +1 @@
+# src/postman: native parallel runner for the Postman collection (python -m src.postman).
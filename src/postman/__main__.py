@@ -0,0 +1,8 @@
+# src/postman/__main__.py
+import sys
+
+from src.postman.cli import configure_logging, main
+
+if __name__ == "__main__":
+    configure_logging()
+    sys.exit(main())
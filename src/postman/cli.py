@@ -0,0 +1,149 @@
+# src/postman/cli.py
+"""
+Runs the Postman collection without Newman, with folders and iterations in
+parallel.
+
+Run from the project root. The shipped collection (the default) has
+placeholder booking data, so its Booking folder fails by design;
+tests/data/booking_flow.postman_collection.json is the runnable variant.
+
+Examples:
+    python -m src.postman --local-server --iterations 20 --workers 16 \
+        --collection tests/data/booking_flow.postman_collection.json
+    python -m src.postman --data bookings.csv --html postman_report.html \
+        --collection tests/data/booking_flow.postman_collection.json
+    python -m src.postman            # Shipped collection, placeholders and all
+"""
+
+import argparse
+import json
+import logging
+import os
+
+from src.api_client import APIClient
+from src.instrumentation import EndpointMetrics
+from src.postman.collection import load_collection, load_data, load_environment
+from src.postman.report import format_results, write_html
+from src.postman.runner import CollectionRunner
+
+_POSTMAN_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "Postman")
+DEFAULT_COLLECTION = os.path.join(
+    _POSTMAN_DIR, "collection", "restful-booker Api test.postman_collection.json"
+)
+DEFAULT_ENVIRONMENT = os.path.join(
+    _POSTMAN_DIR, "environment", "restful-booking.postman_environment.json"
+)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m src.postman",
+        description="Run the Postman collection through APIClient, in parallel.",
+        epilog="Run from the project root (python -m src.postman). "
+        "A request passes when it gets a response with a status below "
+        "400. JavaScript test scripts are not run: their assertions are reported "
+        "as 'not evaluated', and only pm.environment.set(name, "
+        "pm.response.json().field) captures are applied.",
+    )
+    parser.add_argument(
+        "--collection",
+        default=DEFAULT_COLLECTION,
+        help="Collection to run (default: the shipped one, whose Booking requests "
+        "have placeholder data and fail by design; "
+        "tests/data/booking_flow.postman_collection.json runs clean)",
+    )
+    parser.add_argument("--environment", default=DEFAULT_ENVIRONMENT)
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        help="Iterations (default 1, or one per --data row)",
+    )
+    parser.add_argument(
+        "--data", help="Iteration data: JSON array of objects or CSV with a header"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=8, help="Folders run at once (default 8)"
+    )
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--base-url", help="Overrides the environment's {{url}}")
+    target.add_argument(
+        "--local-server",
+        action="store_true",
+        help="Start the in-process restful-booker stand-in and target it",
+    )
+    parser.add_argument(
+        "--url-variable", default="url", help="Variable holding the base URL"
+    )
+    parser.add_argument("--html", help="Write an HTML report to this file")
+    parser.add_argument(
+        "--latency-report", help="Write per-endpoint timings (JSON) to this file"
+    )
+    parser.add_argument("--output", help="Write per-request results (JSON) here")
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="List passed requests too"
+    )
+    return parser
+
+
+def run(args):
+    """Runs the collection described by parsed CLI args; returns (report, metrics)."""
+    collection = load_collection(args.collection)
+    environment = load_environment(args.environment) if args.environment else {}
+    data = load_data(args.data) if args.data else None
+
+    server = None
+    if args.local_server:
+        from src.local_server import LocalBookerServer
+
+        server = LocalBookerServer().start()
+        environment[args.url_variable] = server.base_url
+    elif args.base_url:
+        environment[args.url_variable] = args.base_url
+    base_url = environment.get(args.url_variable) or collection.variables.get(
+        args.url_variable
+    )
+    if not base_url:
+        raise SystemExit(f"No base URL: set {{{{{args.url_variable}}}}} or --base-url")
+
+    metrics = EndpointMetrics()
+    try:
+        with APIClient(
+            base_url=base_url, pool_maxsize=args.workers, hooks=[metrics]
+        ) as client:
+            runner = CollectionRunner(
+                collection,
+                client,
+                environment=environment,
+                iterations=args.iterations,
+                data=data,
+                max_workers=args.workers,
+            )
+            report = runner.run()
+    finally:
+        if server is not None:
+            server.stop()
+    return report, metrics
+
+
+def configure_logging():
+    """Logging for command-line runs (python -m src.postman), not for callers of main()."""
+    # Failed requests are reported in the results; don't log each one as an error too
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger("src").setLevel(logging.CRITICAL)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    report, metrics = run(args)
+    print(format_results(report, verbose=args.verbose))
+    if args.html:
+        write_html(report, args.html, metrics)
+        print(f"HTML report written to {args.html}")
+    if args.latency_report:
+        metrics.dump_json(args.latency_report)
+        print(f"Latency report written to {args.latency_report}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report.as_dict(), f, indent=2)
+        print(f"Results written to {args.output}")
+    return 1 if report.failed else 0
@@ -0,0 +1,216 @@
+# src/postman/collection.py
+"""
+Loading Postman collections (v2.1), environments and iteration data files,
+and resolving {{variables}}.
+
+Scripts are JavaScript and are not executed. Test scripts are scanned for
+the common capture pattern instead:
+
+    let responseBody = pm.response.json();
+    pm.environment.set("authToken", responseBody.token);
+
+Each such set() becomes a Capture that the runner applies to the response
+body. Anything else in a script, pm.test() assertions included, is not
+evaluated; requests that have a test script are flagged so reports can say so.
+"""
+
+import csv
+import json
+import random
+import re
+import time
+import uuid
+from dataclasses import dataclass, field
+
+_VARIABLE = re.compile(r"\{\{([^{}]+)\}\}")
+_ASSIGNMENT = re.compile(r"^\s*(?:let|var|const)\s+(\w+)\s*=\s*(.+?);?\s*$")
+_SET = re.compile(
+    r"pm\.(environment|collectionVariables|globals|variables)\.set\(\s*"
+    r"[\"'](\w+)[\"']\s*,\s*(.+?)\s*\)\s*;?\s*$"
+)
+_RESPONSE_JSON = "pm.response.json()"
+_DYNAMIC = {
+    "$guid": lambda: str(uuid.uuid4()),
+    "$timestamp": lambda: str(int(time.time())),
+    "$randomInt": lambda: str(random.randint(0, 1000)),
+}
+
+
+@dataclass(frozen=True)
+class Capture:
+    """Store the body value at `path` in variable `variable` after a response."""
+
+    variable: str
+    path: tuple  # Keys into the JSON body; () is the whole body
+
+
+@dataclass
+class PostmanRequest:
+    name: str
+    folder: str
+    method: str
+    url: str  # Raw URL, e.g. "{{url}}/booking/:id"
+    path_variables: dict = field(default_factory=dict)
+    query: dict = field(default_factory=dict)
+    headers: dict = field(default_factory=dict)
+    body: str | None = None
+    captures: list = field(default_factory=list)
+    has_test_script: bool = False  # Its assertions are not evaluated
+
+    @property
+    def id(self):
+        return f"{self.folder}/{self.name}"
+
+    def variables_used(self):
+        texts = [self.url, self.body or "", *self.headers.values()]
+        texts += [*self.path_variables.values(), *self.query.values()]
+        return {name for text in texts for name in _VARIABLE.findall(text)}
+
+
+@dataclass
+class Folder:
+    name: str
+    requests: list
+
+
+@dataclass
+class Collection:
+    name: str
+    folders: list
+    variables: dict  # Collection-level defaults
+
+
+def _enabled(entries):
+    return {
+        entry["key"]: str(entry.get("value", ""))
+        for entry in entries or ()
+        if not entry.get("disabled") and entry.get("enabled", True)
+    }
+
+
+def parse_captures(lines):
+    """Captures from a test script's lines (see the module docstring)."""
+    aliases = {}  # Script variable -> body path
+    captures = []
+
+    def body_path(expression):
+        root, *keys = expression.split(".")
+        if expression.startswith(_RESPONSE_JSON):
+            rest = expression[len(_RESPONSE_JSON) :].lstrip(".")
+            return tuple(rest.split(".")) if rest else ()
+        if root in aliases and all(key.isidentifier() for key in keys):
+            return aliases[root] + tuple(keys)
+        return None
+
+    for line in lines:
+        line = line.strip()
+        matched = _SET.search(line)
+        if matched:
+            path = body_path(matched.group(3))
+            if path is not None:
+                captures.append(Capture(matched.group(2), path))
+            continue
+        matched = _ASSIGNMENT.match(line)
+        if matched:
+            path = body_path(matched.group(2))
+            if path is not None:
+                aliases[matched.group(1)] = path
+    return captures
+
+
+def _parse_request(item, folder):
+    request = item["request"]
+    url = request.get("url", "")
+    if isinstance(url, str):
+        url = {"raw": url}
+    raw_url = url.get("raw", "").split("?", 1)[0]
+    body = request.get("body") or {}
+    captures = []
+    has_test_script = False
+    for event in item.get("event", ()):
+        if event.get("listen") == "test":
+            lines = event.get("script", {}).get("exec", ())
+            captures += parse_captures(lines)
+            has_test_script = has_test_script or any(line.strip() for line in lines)
+    return PostmanRequest(
+        name=item["name"],
+        folder=folder,
+        method=request.get("method", "GET").upper(),
+        url=raw_url,
+        path_variables=_enabled(url.get("variable")),
+        query=_enabled(url.get("query")),
+        headers=_enabled(request.get("header")),
+        body=body.get("raw") if body.get("mode") == "raw" else None,
+        captures=captures,
+        has_test_script=has_test_script,
+    )
+
+
+def load_collection(path):
+    """
+    Loads a v2.1 collection. Top-level folders keep their requests in
+    order; requests at the top level form a folder named after the collection.
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    name = data.get("info", {}).get("name", "collection")
+    folders, loose = [], []
+
+    def flatten(items, folder):
+        requests = []
+        for item in items:
+            if "item" in item:  # A nested folder runs as part of its parent
+                requests += flatten(item["item"], folder)
+            else:
+                requests.append(_parse_request(item, folder))
+        return requests
+
+    for item in data.get("item", ()):
+        if "item" in item:
+            folders.append(Folder(item["name"], flatten(item["item"], item["name"])))
+        else:
+            loose.append(_parse_request(item, name))
+    if loose:
+        folders.insert(0, Folder(name, loose))
+    return Collection(name, folders, _enabled(data.get("variable")))
+
+
+def load_environment(path):
+    """Variables of a Postman environment export."""
+    with open(path, encoding="utf-8") as f:
+        return _enabled(json.load(f).get("values"))
+
+
+def load_data(path):
+    """Iteration rows from a JSON array of objects or a CSV file with a header."""
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.lower().endswith(".csv"):
+            return [dict(row) for row in csv.DictReader(f)]
+        rows = json.load(f)
+    if not isinstance(rows, list) or not all(isinstance(r, dict) for r in rows):
+        raise ValueError(f"{path}: expected a JSON array of objects")
+    return [{key: _to_text(value) for key, value in row.items()} for row in rows]
+
+
+def _to_text(value):
+    # Substituted into raw bodies as text, like Postman does
+    if isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+
+def resolve(text, variables):
+    """
+    Replaces {{name}} with its value from `variables` (a mapping), and the
+    dynamic {{$guid}}, {{$timestamp}} and {{$randomInt}}. Unknown names are
+    left as they are, like Postman does.
+    """
+
+    def substitute(match):
+        name = match.group(1).strip()
+        if name in _DYNAMIC:
+            return _DYNAMIC[name]()
+        value = variables.get(name)
+        return match.group(0) if value is None else value
+
+    return _VARIABLE.sub(substitute, text)
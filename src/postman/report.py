@@ -0,0 +1,67 @@
+# src/postman/report.py
+"""
+Reports for a collection run, matching the pytest suite's outputs:
+
+- A terminal summary ("N passed, M failed in Xs", failures listed first).
+- A self-contained HTML report in the layout of the pytest-html report:
+  a results table (Result, Test, Duration) and the same "Request latency
+  by endpoint" table that the suite's conftest adds.
+- The request-metrics/1 latency JSON written by EndpointMetrics.dump_json,
+  so Postman and pytest runs can be compared with the same tools.
+"""
+
+from html import escape
+
+_STYLE = (
+    "body{font-family:Helvetica,Arial,sans-serif;font-size:12px}"
+    "table{border-collapse:collapse}td,th{border:1px solid #e6e6e6;padding:5px}"
+    ".passed{color:green}.failed{color:red}"
+)
+
+
+def format_results(report, verbose=False):
+    """pytest-style terminal output; only failures unless `verbose`."""
+    lines = []
+    for result in report.results:
+        if verbose or not result.passed:
+            outcome = "PASSED" if result.passed else "FAILED"
+            detail = result.error or f"{result.method} -> {result.status_code}"
+            if result.tests_not_evaluated:
+                detail += "; test script not evaluated"
+            lines.append(
+                f"{result.id} {outcome} ({result.elapsed * 1000:.1f}ms) {detail}"
+            )
+    lines.append(f"{report.collection}: {report.summary()}")
+    return "\n".join(lines)
+
+
+def write_html(report, path, metrics=None):
+    """Writes the HTML report; `metrics` adds the per-endpoint latency table."""
+    rows = []
+    for result in report.results:
+        outcome = "Passed" if result.passed else "Failed"
+        detail = result.error or f"{result.method} {result.url} -> {result.status_code}"
+        if result.tests_not_evaluated:
+            detail += "; test script not evaluated"
+        rows.append(
+            f'<tr class="{outcome.lower()}"><td>{outcome}</td>'
+            f"<td>{escape(result.id)}</td><td>{result.elapsed:.3f}</td>"
+            f"<td>{escape(detail)}</td></tr>"
+        )
+    html = (
+        f"<!DOCTYPE html><html><head><meta charset='utf-8'>"
+        f"<title>{escape(report.collection)}</title><style>{_STYLE}</style></head>"
+        f"<body><h1>{escape(report.collection)}</h1>"
+        f"<p>Report generated on {escape(report.started_at)}</p>"
+        f"<h2>Summary</h2><p>{len(report.results)} tests took "
+        f"{report.elapsed:.2f}s ({report.iterations} iterations).</p>"
+        f"<p><span class='passed'>{len(report.passed)} Passed</span>, "
+        f"<span class='failed'>{len(report.failed)} Failed</span></p>"
+        + (metrics.html_table() if metrics is not None else "")
+        + "<h2>Results</h2><table><thead><tr><th>Result</th><th>Test</th>"
+        "<th>Duration</th><th>Details</th></tr></thead><tbody>"
+        + "".join(rows)
+        + "</tbody></table></body></html>"
+    )
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(html)
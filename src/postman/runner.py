@@ -0,0 +1,311 @@
+# src/postman/runner.py
+"""
+Runs a Postman collection through APIClient, in parallel where it is safe.
+
+The requests inside a folder run in order, since they build on each
+other (create, then get, update and delete the same booking). Folders are
+independent unless one uses a variable that an earlier folder's test
+script captures; Booking needs the authToken from Auth, for example.
+Independent folders run at the same time, and so do iterations. Each
+iteration gets its own copy of the environment and, in data-file mode,
+its own data row.
+"""
+
+import json
+import threading
+import time
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+import requests
+
+from src.postman.collection import resolve
+
+
+@dataclass
+class RequestResult:
+    """One request of one iteration."""
+
+    iteration: int  # 1-based, like Newman
+    folder: str
+    name: str
+    method: str
+    url: str
+    status_code: int | None = None
+    elapsed: float = 0.0  # Seconds
+    error: str | None = None  # Transport or setup error (no response)
+    tests_not_evaluated: bool = False  # The request has a test script
+
+    @property
+    def passed(self):
+        # Status only: the request's test script (if any) was not run
+        return self.error is None and self.status_code < 400
+
+    @property
+    def id(self):
+        return f"{self.folder}/{self.name}[{self.iteration}]"
+
+    def as_dict(self):
+        return {
+            "id": self.id,
+            "method": self.method,
+            "url": self.url,
+            "status_code": self.status_code,
+            "duration_ms": round(self.elapsed * 1000, 3),
+            "passed": self.passed,
+            "error": self.error,
+            "tests": "not evaluated" if self.tests_not_evaluated else None,
+        }
+
+
+@dataclass
+class RunReport:
+    collection: str
+    iterations: int
+    started_at: str
+    results: list = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def passed(self):
+        return [r for r in self.results if r.passed]
+
+    @property
+    def failed(self):
+        return [r for r in self.results if not r.passed]
+
+    @property
+    def not_evaluated(self):
+        return [r for r in self.results if r.tests_not_evaluated]
+
+    def summary(self):
+        summary = (
+            f"{len(self.passed)} passed, {len(self.failed)} failed "
+            f"in {self.elapsed:.2f}s"
+        )
+        if self.not_evaluated:
+            summary += f" ({len(self.not_evaluated)} test scripts not evaluated)"
+        return summary
+
+    def as_dict(self):
+        return {
+            "schema": "postman-run/1",
+            "collection": self.collection,
+            "iterations": self.iterations,
+            "started_at": self.started_at,
+            "duration_s": round(self.elapsed, 3),
+            "passed": len(self.passed),
+            "failed": len(self.failed),
+            "tests_not_evaluated": len(self.not_evaluated),
+            "results": [r.as_dict() for r in self.results],
+        }
+
+
+def folder_dependencies(collection):
+    """
+    {folder name: names of earlier folders it waits for}: the folders whose
+    captures set a variable it uses. Only earlier folders count, so the
+    collection order breaks any cycle.
+    """
+    captured_by = {}
+    dependencies = {}
+    for folder in collection.folders:
+        used = set()
+        for request in folder.requests:
+            used |= request.variables_used()
+        dependencies[folder.name] = {
+            captured_by[name]
+            for name in used
+            if name in captured_by and captured_by[name] != folder.name
+        }
+        for request in folder.requests:
+            for capture in request.captures:
+                captured_by.setdefault(capture.variable, folder.name)
+    return dependencies
+
+
+class CollectionRunner:
+    """Executes a collection's folders and iterations on a thread pool."""
+
+    def __init__(
+        self,
+        collection,
+        api_client,
+        environment=None,
+        iterations=1,
+        data=None,
+        max_workers=8,
+    ):
+        """
+        Args:
+            collection: A loaded src.postman.collection.Collection.
+            api_client: APIClient whose base_url the resolved URLs start with
+                (add an EndpointMetrics hook to it for timings).
+            environment: Environment variables (dict).
+            iterations: Number of iterations; with `data`, defaults to one
+                per data row.
+            data: Iteration rows (list of dicts) for data-file mode. Row i is
+                used by iteration i (cycling if there are more iterations).
+            max_workers: Folders running at once, across all iterations.
+        """
+        self.collection = collection
+        self.api_client = api_client
+        self.environment = dict(environment or {})
+        self.data = data or []
+        self.iterations = iterations if iterations else max(len(self.data), 1)
+        self.max_workers = max_workers
+        self.dependencies = folder_dependencies(collection)
+
+    def run(self):
+        """Runs every iteration; results are in iteration, then collection order."""
+        report = RunReport(
+            self.collection.name,
+            self.iterations,
+            datetime.now(timezone.utc).isoformat(),
+        )
+        started = time.perf_counter()
+        lock = threading.Lock()
+        finished = threading.Event()
+        folders = {folder.name: folder for folder in self.collection.folders}
+        dependents = {name: [] for name in folders}
+        for name, needs in self.dependencies.items():
+            for need in needs:
+                dependents[need].append(name)
+        waiting = {}  # (iteration, folder) -> folders it still waits for
+        scopes = {}
+        for iteration in range(1, self.iterations + 1):
+            row = self.data[(iteration - 1) % len(self.data)] if self.data else {}
+            # Captures write to the iteration's own environment copy
+            scopes[iteration] = ChainMap(
+                row, dict(self.environment), self.collection.variables
+            )
+            for name in folders:
+                waiting[iteration, name] = set(self.dependencies[name])
+        remaining = [len(waiting)]
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="postman"
+        ) as executor:
+
+            def start(iteration, name):
+                future = executor.submit(
+                    self._run_folder, folders[name], iteration, scopes[iteration]
+                )
+                future.add_done_callback(lambda f: done(iteration, name, f))
+
+            def done(iteration, name, future):
+                ready = []
+                with lock:
+                    report.results.extend(future.result())
+                    for dependent in dependents[name]:
+                        needs = waiting[iteration, dependent]
+                        needs.discard(name)
+                        if not needs:
+                            ready.append(dependent)
+                    remaining[0] -= 1
+                    if not remaining[0]:
+                        finished.set()
+                for dependent in ready:
+                    start(iteration, dependent)
+
+            initial = [key for key, needs in waiting.items() if not needs]
+            if not initial:
+                finished.set()
+            for iteration, name in initial:
+                start(iteration, name)
+            finished.wait()
+        report.elapsed = time.perf_counter() - started
+        order = {
+            (request.folder, request.name): i
+            for i, request in enumerate(
+                r for folder in self.collection.folders for r in folder.requests
+            )
+        }
+        report.results.sort(key=lambda r: (r.iteration, order[r.folder, r.name]))
+        return report
+
+    def _run_folder(self, folder, iteration, scope):
+        results = []
+        for request in folder.requests:
+            try:
+                results.append(self._send(request, iteration, scope))
+            except Exception as e:  # A bad request must not stop the folder
+                results.append(
+                    RequestResult(
+                        iteration,
+                        folder.name,
+                        request.name,
+                        request.method,
+                        request.url,
+                        error=f"{type(e).__name__}: {e}",
+                        tests_not_evaluated=request.has_test_script,
+                    )
+                )
+        return results
+
+    def _send(self, request, iteration, scope):
+        url = resolve(request.url, scope)
+        for name, value in request.path_variables.items():
+            url = url.replace(f":{name}", resolve(value, scope))
+        result = RequestResult(
+            iteration,
+            request.folder,
+            request.name,
+            request.method,
+            url,
+            tests_not_evaluated=request.has_test_script,
+        )
+        base_url = self.api_client.base_url.rstrip("/")
+        if not url.startswith(base_url):
+            result.error = f"URL is outside the client's base URL {base_url}"
+            return result
+        headers = {name: resolve(v, scope) for name, v in request.headers.items()}
+        body = None
+        if request.body is not None:
+            body = resolve(request.body, scope).encode()
+            if not any(name.lower() == "content-type" for name in headers):
+                headers["Content-Type"] = "application/json"  # Postman's raw JSON
+        params = {name: resolve(v, scope) for name, v in request.query.items()}
+
+        started = time.perf_counter()
+        response = None
+        try:
+            response = self.api_client.send_request(
+                request.method,
+                url[len(base_url) :],
+                headers=headers,
+                data=body,
+                params=params or None,
+            )
+        except requests.exceptions.RequestException as e:
+            response = e.response
+            if response is None:
+                result.error = f"{type(e).__name__}: {e}"
+        result.elapsed = time.perf_counter() - started
+        if response is not None:
+            result.status_code = response.status_code
+            if response.status_code < 400:
+                self._capture(request, response, scope)
+        return result
+
+    @staticmethod
+    def _capture(request, response, scope):
+        if not request.captures:
+            return
+        try:
+            body = response.json()
+        except ValueError:
+            return
+        environment = scope.maps[1]
+        for capture in request.captures:
+            value = body
+            for key in capture.path:
+                if not isinstance(value, dict) or key not in value:
+                    break
+                value = value[key]
+            else:
+                environment[capture.variable] = (
+                    value if isinstance(value, str) else json.dumps(value)
+                )
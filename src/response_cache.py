@@ -0,0 +1,171 @@
+# src/response_cache.py
+"""
+Opt-in client-side cache for APIClient GET responses.
+
+Entries are bounded by count (least recently used go first) and by age. A
+fresh entry is served without touching the network. Once its TTL has passed,
+an entry that carries validators (ETag / Last-Modified) is revalidated with
+a conditional GET, and a 304 renews it without downloading the body again;
+entries without validators are simply refetched.
+
+Writes go through invalidate(): APIClient drops the target URL of every
+non-GET request, and BookingHelper additionally drops the booking listing.
+
+Usage:
+    cache = ResponseCache(max_entries=512, ttl=30)
+    client = APIClient(base_url, cache=cache)
+    ...
+    print(cache.stats.summary())
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_TTL = 30.0  # Seconds an entry is served without asking the server
+
+
+@dataclass
+class CacheStats:
+    """Counters for a ResponseCache; every GET through the cache is one lookup."""
+
+    hits: int = 0  # Served from cache without a request
+    misses: int = 0  # Needed a request (absent, or stale)
+    revalidated: int = 0  # Misses the server answered with 304 Not Modified
+    stores: int = 0
+    evictions: int = 0  # Dropped to respect max_entries
+    invalidations: int = 0  # Dropped by invalidate()
+
+    @property
+    def lookups(self):
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self):
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def as_dict(self):
+        return {**asdict(self), "hit_rate": round(self.hit_rate, 4)}
+
+    def summary(self):
+        return (
+            f"{self.lookups} lookups: {self.hits} hits ({self.hit_rate:.1%}), "
+            f"{self.misses} misses ({self.revalidated} revalidated with 304), "
+            f"{self.evictions} evictions, {self.invalidations} invalidations"
+        )
+
+
+class CacheEntry:
+    __slots__ = ("url", "response", "expires_at", "etag", "last_modified")
+
+    def __init__(self, url, response, expires_at):
+        self.url = url
+        self.response = response
+        self.expires_at = expires_at
+        self.etag = response.headers.get("ETag")
+        self.last_modified = response.headers.get("Last-Modified")
+
+    def validators(self):
+        """Conditional request headers for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Thread-safe LRU + TTL store of GET responses, keyed by URL and params."""
+
+    def __init__(
+        self, max_entries=DEFAULT_MAX_ENTRIES, ttl=DEFAULT_TTL, clock=time.monotonic
+    ):
+        """
+        Args:
+            max_entries: Entries kept before the least recently used is evicted.
+            ttl: Seconds an entry is served without contacting the server
+                (0 revalidates on every read when the server sends validators).
+            clock: Monotonic time source (injectable for tests).
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> CacheEntry, oldest first
+        self._keys_by_url = {}  # url -> keys, so invalidate() skips the scan
+
+    @staticmethod
+    def make_key(url, params=None):
+        """Cache key for a GET of `url` with query `params` (order-insensitive)."""
+        if not params:
+            return url, ()
+        return url, tuple(sorted((str(k), str(v)) for k, v in dict(params).items()))
+
+    def lookup(self, key):
+        """
+        Returns (entry, fresh) for `key`; entry is None when nothing usable is
+        cached. Counts a hit for fresh entries and a miss otherwise.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if self._clock() < entry.expires_at:
+                    self.stats.hits += 1
+                    return entry, True
+                if not (entry.etag or entry.last_modified):
+                    self._remove(key)  # Stale and nothing to revalidate with
+                    entry = None
+            self.stats.misses += 1
+            return entry, False
+
+    def store(self, key, response):
+        """Caches a successful response unless the server forbids it."""
+        if "no-store" in response.headers.get("Cache-Control", ""):
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            url = key[0]
+            self._entries[key] = CacheEntry(url, response, self._clock() + self.ttl)
+            self._keys_by_url.setdefault(url, set()).add(key)
+            self.stats.stores += 1
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.stats.evictions += 1
+
+    def revalidated(self, key, entry):
+        """Renews `entry` after a 304 and returns its cached response."""
+        with self._lock:
+            entry.expires_at = self._clock() + self.ttl
+            self.stats.revalidated += 1
+        return entry.response
+
+    def invalidate(self, url):
+        """Drops every entry for `url`, whatever its query params."""
+        with self._lock:
+            for key in self._keys_by_url.pop(url, ()):
+                if self._entries.pop(key, None) is not None:
+                    self.stats.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_url.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _remove(self, key):
+        self._entries.pop(key)
+        keys = self._keys_by_url.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_url[key[0]]
@@ -2,27 +2,261 @@
 import pytest
 import os
 import json
+import uuid
+import zlib
 from src.api_client import APIClient
 from src import config  # Import your config module
-from src.helpers.auth import authenticate  # Import auth helper
+from src.helpers.auth import TokenManager  # Shared, cached auth tokens
+from src.helpers.booking import BookingHelper
+from src.helpers.booking_generator import BookingGenerator  # Varied payloads
+from src.helpers.booking_pool import BookingPool  # Pre-created bookings
+from src.local_server import LocalBookerServer
+from src.cassette import Cassette  # Record/replay of api_client traffic
+from src.instrumentation import EndpointMetrics  # Per-endpoint request timings
+
+# One metrics hook per session, reported in pytest-html and as JSON
+REQUEST_METRICS = pytest.StashKey[EndpointMetrics]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--local-server",
+        action="store_true",
+        default=os.getenv("API_LOCAL_SERVER", "").lower() in ("1", "true", "yes"),
+        help="Run against an in-process restful-booker stand-in instead of "
+        "API_BASE_URL (also enabled by API_LOCAL_SERVER=1).",
+    )
+    parser.addoption(
+        "--latency-report",
+        default="latency_report.json",
+        help="Where to write per-endpoint request timings as JSON "
+        "(empty string disables it).",
+    )
+    parser.addoption(
+        "--cassette",
+        default=os.getenv("API_CASSETTE", ""),
+        help="Record api_client traffic to, or replay it from, this cassette "
+        "file (also set by API_CASSETTE).",
+    )
+    parser.addoption(
+        "--cassette-mode",
+        choices=("record", "replay", "strict"),
+        default="replay",
+        help="record: append to the cassette; replay: serve recorded responses, "
+        "sending anything unrecorded over the network; strict: fail on "
+        "unrecorded requests instead (default: replay).",
+    )
+    parser.addoption(
+        "--booking-pool-size",
+        type=int,
+        default=8,
+        help="Bookings the session's warm pool keeps created ahead of the tests "
+        "that use the `booking` fixture (default: 8; 0 with --cassette).",
+    )
+    parser.addoption(
+        "--generated-bookings",
+        type=int,
+        default=10,
+        help="Cases each test using the `generated_booking` fixture runs with, "
+        "drawn from the seeded payload generator (default: 10).",
+    )
+    parser.addoption(
+        "--booking-seed",
+        type=int,
+        default=int(os.getenv("API_BOOKING_SEED", "0")),
+        help="Seed of the generated booking payloads; a failing case is "
+        "reproduced by rerunning with the same seed (also set by "
+        "API_BOOKING_SEED; default: 0).",
+    )
+    parser.addoption(
+        "--shard",
+        default=os.getenv("API_SHARD", ""),
+        help="Run only shard I of N of the suite, e.g. 2/4, for splitting it "
+        "across machines or CI jobs (also set by API_SHARD). Within one "
+        "machine, use pytest-xdist: pytest -n 4.",
+    )
+
+
+def _parse_shard(value):
+    """(index, count) from "I/N" (1-based), or None when not sharding."""
+    if not value:
+        return None
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise pytest.UsageError(f"--shard expects I/N, got {value!r}") from None
+    if not 1 <= index <= count:
+        raise pytest.UsageError(f"--shard {value}: I must be between 1 and N")
+    return index, count
+
+
+def worker_name(config):
+    """
+    This process's name in a distributed run: the pytest-xdist worker id
+    (gw0, gw1, ...), "shardI" with --shard, or "main".
+    """
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if worker:
+        return worker
+    shard = _parse_shard(config.getoption("--shard"))
+    return f"shard{shard[0]}" if shard else "main"
+
+
+def pytest_configure(config):
+    config.stash[REQUEST_METRICS] = EndpointMetrics()
+    config.addinivalue_line(
+        "markers",
+        "live: needs the real server, so it is skipped when replaying a cassette "
+        "(random request data, or clients other than api_client).",
+    )
+
+
+def pytest_report_header(config):
+    return (
+        f"generated bookings: {config.getoption('--generated-bookings')} cases, "
+        f"seed {config.getoption('--booking-seed')}"
+    )
+
+
+def pytest_generate_tests(metafunc):
+    # Cases are only indices into the generator's stream: no payload is
+    # built at collection time, each test builds its own when it runs
+    if "generated_booking" in metafunc.fixturenames:
+        seed = metafunc.config.getoption("--booking-seed")
+        metafunc.parametrize(
+            "generated_booking",
+            range(metafunc.config.getoption("--generated-bookings")),
+            indirect=True,
+            ids=lambda index: f"seed{seed}-{index}",
+        )
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Keeps this --shard's tests, and skips `live` tests when api_client
+    traffic comes from a cassette.
+    """
+    shard = _parse_shard(config.getoption("--shard"))
+    if shard:
+        index, count = shard
+        # Hashing the node id keeps a test on the same shard from run to run
+        selected, deselected = [], []
+        for item in items:
+            in_shard = zlib.crc32(item.nodeid.encode()) % count == index - 1
+            (selected if in_shard else deselected).append(item)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+    if not config.getoption("--cassette") or (
+        config.getoption("--cassette-mode") == "record"
+    ):
+        return
+    skip = pytest.mark.skip(reason="needs the live server; replaying a cassette")
+    for item in items:
+        if "live" in item.keywords:
+            item.add_marker(skip)
+
+
+def pytest_sessionfinish(session):
+    metrics = session.config.stash.get(REQUEST_METRICS, None)
+    path = session.config.getoption("--latency-report")
+    if metrics and path:
+        worker = worker_name(session.config)
+        if worker != "main":
+            # One report per worker process (latency_report.gw0.json, ...)
+            root, extension = os.path.splitext(path)
+            path = f"{root}.{worker}{extension}"
+        metrics.dump_json(path)
+
+
+def pytest_html_results_summary(prefix, summary, postfix, session):
+    """Adds a per-endpoint latency table to the pytest-html report."""
+    metrics = session.config.stash.get(REQUEST_METRICS, None)
+    if not metrics:
+        return
+    postfix.append(metrics.html_table())
+
 
 # --- Session-Scoped Fixtures (Run Once) ---
 
 
+@pytest.fixture(scope="session", autouse=True)
+def local_server(request):
+    """
+    With --local-server, starts the local restful-booker stand-in and points
+    config (BASE_URL and the derived endpoint URLs) at it for the session.
+    Yields the server, or None when running against API_BASE_URL.
+    """
+    if not request.config.getoption("--local-server"):
+        yield None
+        return
+    with LocalBookerServer() as server:
+        previous = config.configure(base_url=server.base_url)
+        try:
+            yield server
+        finally:
+            config.configure(previous)
+
+
+@pytest.fixture(scope="session")
+def worker_namespace(pytestconfig):
+    """
+    A prefix unique to this worker process and run, for test data that is
+    found by name rather than by booking ID (e.g. firstname filters), so
+    concurrent workers and runs never see each other's bookings.
+    """
+    return f"{worker_name(pytestconfig)}-{uuid.uuid4().hex[:8]}"
+
+
 @pytest.fixture(scope="session")
-def base_url():
+def base_url(local_server):
     """Fixture to provide the base URL from config."""
-    # This ensures the config is loaded and the variable is set
-    if not config.BASE_URL:
-        pytest.fail("API_BASE_URL environment variable not set or config not loaded.")
-    return config.BASE_URL
+    # Settings resolve on first use; a missing API_BASE_URL fails here
+    try:
+        return config.BASE_URL
+    except config.ConfigurationError as e:
+        pytest.fail(f"API_BASE_URL environment variable not set: {e}")
 
 
 @pytest.fixture(scope="session")
-def api_client(base_url):
-    """Fixture to provide a basic, unauthenticated APIClient instance."""
+def request_metrics(pytestconfig):
+    """Per-endpoint timings of every request made through api_client."""
+    return pytestconfig.stash[REQUEST_METRICS]
+
+
+@pytest.fixture(scope="session")
+def cassette(pytestconfig):
+    """The session's Cassette with --cassette, or None."""
+    path = pytestconfig.getoption("--cassette")
+    if not path:
+        yield None
+        return
+    mode = pytestconfig.getoption("--cassette-mode")
+    if mode == "record" and os.getenv("PYTEST_XDIST_WORKER"):
+        # Workers would interleave their appends; replaying with -n is fine
+        raise pytest.UsageError("Record a cassette without pytest-xdist (-n)")
+    with Cassette(
+        path,
+        mode="record" if mode == "record" else "replay",
+        strict=mode == "strict",
+    ) as session_cassette:
+        yield session_cassette
+
+
+@pytest.fixture(scope="session")
+def api_client(base_url, request_metrics, cassette):
+    """
+    Fixture to provide a basic, unauthenticated APIClient instance.
+    Session fixtures are per process, so each xdist worker gets its own
+    client, connection pool, token and (with --local-server) server.
+    """
     # Uses the base_url fixture and default headers from config
-    return APIClient(base_url=base_url, default_headers=config.DEFAULT_HEADERS)
+    return APIClient(
+        base_url=base_url,
+        default_headers=config.DEFAULT_HEADERS,
+        hooks=[request_metrics],
+        cassette=cassette,
+    )
 
 
 @pytest.fixture(scope="session")
@@ -40,39 +274,78 @@ def sample_booking_data():
         pytest.fail(f"Error decoding JSON from file: {data_path}")
 
 
+@pytest.fixture(scope="session")
+def token_manager(api_client: APIClient):
+    """
+    Fixture to provide one TokenManager for the whole session.
+    A single /auth round trip serves every authenticated test; the token is
+    refreshed automatically when it expires or the API rejects it.
+    """
+    return TokenManager(api_client, config.AUTH_USERNAME, config.AUTH_PASSWORD)
+
+
+@pytest.fixture(scope="session")
+def booking_generator(pytestconfig, sample_booking_data):
+    """Seeded stream of booking payloads varied from sample_booking_data."""
+    return BookingGenerator(
+        sample_booking_data, seed=pytestconfig.getoption("--booking-seed")
+    )
+
+
+@pytest.fixture(scope="session")
+def booking_pool(pytestconfig, api_client, token_manager, sample_booking_data):
+    """
+    Bookings created in the background from tests/data/booking_data.json,
+    ready before the tests that need them ask. Started on first use; every
+    pooled booking is deleted in one batch at the end of the session.
+    With --cassette the pool creates inline instead (size 0): background
+    creates would interleave with the tests' own and get different IDs on
+    every run, so the recording could not be replayed.
+    """
+    helper = BookingHelper(api_client, token_manager=token_manager)
+    size = pytestconfig.getoption("--booking-pool-size")
+    if pytestconfig.getoption("--cassette"):
+        size = 0
+    with BookingPool(helper, sample_booking_data, size=size) as pool:
+        yield pool
+
+
 # --- Function-Scoped Fixtures (Run for Each Test Needing Them) ---
 
 
 @pytest.fixture(scope="function")
-def auth_token(api_client: APIClient):
+def auth_token(token_manager: TokenManager):
     """
-    Fixture to perform authentication and return the token.
-    Runs for each test that requires a fresh token.
+    Fixture to return a valid authentication token.
+    The token is cached by the session's TokenManager, so this is cheap.
     """
     try:
-        # Use default credentials from config loaded from .env
-        token = authenticate(api_client, config.AUTH_USERNAME, config.AUTH_PASSWORD)
-        if not token:
-            pytest.fail("Authentication failed - could not retrieve token.")
-        return token
+        return token_manager.get_token()
     except Exception as e:
         pytest.fail(f"Authentication process failed with an exception: {e}")
 
 
-# Note: The 'authenticated_api_client' fixture from the previous example
-# could also be defined here if needed. It would typically use the 'api_client'
-# and 'auth_token' fixtures to return a client instance pre-configured with
-# the auth header/cookie. Example:
-#
-# @pytest.fixture(scope="function")
-# def authenticated_api_client(api_client: APIClient, auth_token: str):
-#     """ Provides an APIClient instance ready for authenticated requests. """
-#     auth_headers = api_client.default_headers.copy()
-#     auth_headers["Cookie"] = f"token={auth_token}"
-#     # Return a new client instance with these headers, or modify existing one carefully
-#     # Depending on whether APIClient instances should be mutable or immutable in tests.
-#     # Returning a configured client object:
-#     # return APIClient(base_url=api_client.base_url, default_headers=auth_headers)
-#     # --- OR ---
-#     # Returning the original client and the token (as used in test_booking.py example):
-#     return api_client, auth_token
+@pytest.fixture(scope="function")
+def authenticated_api_client(api_client: APIClient, auth_token: str):
+    """Provides the shared APIClient together with a valid auth token."""
+    return api_client, auth_token
+
+
+@pytest.fixture(scope="function")
+def booking(booking_pool: BookingPool):
+    """
+    The ID of a booking owned by one test, created from sample_booking_data.
+    It comes from the warm pool, so no create round trip is spent in the
+    test, and it is deleted with the rest of the pool after the session.
+    No other test sees it, so tests can run in any order and on any worker.
+    """
+    return booking_pool.acquire().booking_id
+
+
+@pytest.fixture(scope="function")
+def generated_booking(request, booking_generator: BookingGenerator):
+    """
+    One generated booking payload per case; tests taking this fixture run
+    --generated-bookings times (see pytest_generate_tests).
+    """
+    return booking_generator.payload(request.param)
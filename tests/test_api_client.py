@@ -0,0 +1,106 @@
+# tests/test_api_client.py
+import json
+import logging
+import time
+
+import pytest
+import requests
+
+from src.api_client import APIClient
+from src.deadline import DeadlineExceeded, deadline
+from src.instrumentation import EndpointMetrics, RequestHook, SampledRequestLogger
+from src.local_server import LocalBookerServer
+
+
+def test_client_uses_sized_connection_pool(base_url):
+    """The client's session mounts an adapter with the requested pool limits."""
+    with APIClient(base_url=base_url, pool_connections=4, pool_maxsize=32) as client:
+        adapter = client.session.get_adapter(base_url)
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 32
+        # http and https share the same (thread-safe) adapter and pool
+        assert client.session.get_adapter("http://x") is client.session.get_adapter(
+            "https://x"
+        )
+
+
+def test_client_reuses_connection_across_calls(api_client: APIClient):
+    """Back-to-back calls are served by one keep-alive connection."""
+    api_client.get("ping")
+    pool = api_client.session.get_adapter(api_client.base_url).poolmanager
+    opened_before = sum(p.num_connections for p in pool.pools._container.values())
+    for _ in range(3):
+        api_client.get("ping")
+    opened_after = sum(p.num_connections for p in pool.pools._container.values())
+    assert opened_after == opened_before, "Expected pooled keep-alive connection reuse"
+
+
+def test_client_close_releases_pool(base_url):
+    """close() (and leaving the context manager) drops all pooled connections."""
+    with APIClient(base_url=base_url) as client:
+        adapter = client.session.get_adapter(base_url)
+    assert len(adapter.poolmanager.pools) == 0
+
+
+@pytest.mark.live  # Its own client bypasses the cassette
+def test_hooks_receive_request_timings(base_url):
+    """Hooks see every request, templated by endpoint, with phase timings."""
+    seen = []
+
+    class Recorder(RequestHook):
+        def post_request(self, timing):
+            seen.append(timing)
+
+    metrics = EndpointMetrics()
+    with APIClient(base_url=base_url, hooks=[metrics, Recorder()]) as client:
+        client.get("ping")
+        client.get("ping")
+        try:
+            client.get("booking/999999999")
+        except Exception:
+            pass
+
+    first, second, missing = seen
+    assert first.endpoint == "ping" and first.status_code == 201
+    assert first.connect > 0 and not first.reused_connection  # New connection
+    assert second.reused_connection and second.connect == 0.0
+    assert 0 < first.ttfb <= first.total
+    assert missing.endpoint == "booking/{id}" and missing.error is not None
+
+    summary = metrics.summary()
+    assert summary["GET ping"]["count"] == 2
+    assert summary["GET ping"]["new_connections"] == 1
+    assert summary["GET booking/{id}"]["errors"] == 1
+
+
+@pytest.mark.live  # Its own client bypasses the cassette
+def test_sampled_request_logger_emits_one_json_line_per_n(base_url, caplog):
+    """SampledRequestLogger logs every Nth request as a JSON object."""
+    hook = SampledRequestLogger(every=3)
+    with caplog.at_level(logging.INFO, logger="src.requests"):
+        with APIClient(base_url=base_url, hooks=[hook]) as client:
+            for _ in range(7):
+                client.get("ping")
+    lines = [r.getMessage() for r in caplog.records if r.name == "src.requests"]
+    assert len(lines) == 3  # Requests 1, 4 and 7
+    record = json.loads(lines[0])
+    assert record["method"] == "GET" and record["endpoint"] == "ping"
+    assert record["status"] == 201 and record["total_ms"] > 0
+
+
+def test_per_call_timeout_and_deadline():
+    """Timeouts bound one call; a deadline bounds everything inside its block."""
+    with LocalBookerServer(latency=0.3) as server:
+        with APIClient(base_url=server.base_url, timeout=(1.0, 5.0)) as client:
+            with pytest.raises(requests.exceptions.Timeout):
+                client.get("ping", timeout=0.05)
+
+            started = time.perf_counter()
+            with deadline(0.1):
+                with pytest.raises(DeadlineExceeded):
+                    client.get("ping")  # Read timeout clamped to the budget
+                # The budget is spent: later calls fail without being sent
+                with pytest.raises(DeadlineExceeded):
+                    client.get("ping")
+            assert time.perf_counter() - started < 0.3
+            assert client.get("ping").status_code == 201  # No deadline outside
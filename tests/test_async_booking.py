@@ -0,0 +1,105 @@
+# tests/test_async_booking.py
+import asyncio
+
+import httpx
+import pytest
+
+from src import config
+from src.async_api_client import AsyncAPIClient
+from src.helpers.async_booking import AsyncBookingHelper
+
+
+@pytest.mark.live  # Deletes with api_client's token from its own client
+def test_concurrent_create_and_get(base_url, sample_booking_data, auth_token):
+    """Creates and reads back a batch of bookings concurrently from one event loop."""
+
+    async def workflow():
+        async with AsyncAPIClient(
+            base_url=base_url,
+            default_headers=config.DEFAULT_HEADERS,
+            max_concurrency=10,
+        ) as client:
+            helper = AsyncBookingHelper(client)
+            created = await asyncio.gather(
+                *(helper.create_booking(sample_booking_data) for _ in range(20))
+            )
+            booking_ids = [response.json()["bookingid"] for response in created]
+            fetched = await asyncio.gather(
+                *(helper.get_booking(booking_id) for booking_id in booking_ids)
+            )
+            await asyncio.gather(
+                *(helper.delete_booking(bid, auth_token) for bid in booking_ids)
+            )
+            return booking_ids, fetched
+
+    booking_ids, fetched = asyncio.run(workflow())
+    assert len(set(booking_ids)) == 20, "Expected 20 distinct booking IDs"
+    for response in fetched:
+        assert response.status_code == 200
+        assert response.json()["firstname"] == sample_booking_data["firstname"]
+
+
+@pytest.mark.live
+def test_iter_bookings_streams_listing(
+    base_url, sample_booking_data, auth_token, worker_namespace
+):
+    """The async iter_bookings yields each matching booking once."""
+    firstname = f"AsyncStream-{worker_namespace}"
+
+    async def workflow():
+        async with AsyncAPIClient(
+            base_url=base_url,
+            default_headers=config.DEFAULT_HEADERS,
+            max_concurrency=5,
+        ) as client:
+            helper = AsyncBookingHelper(client)
+            created = await asyncio.gather(
+                *(
+                    helper.create_booking(
+                        {**sample_booking_data, "firstname": firstname}
+                    )
+                    for _ in range(10)
+                )
+            )
+            booking_ids = {response.json()["bookingid"] for response in created}
+            seen = {
+                booking_id: booking
+                async for booking_id, booking in helper.iter_bookings(
+                    {"firstname": firstname}
+                )
+            }
+            # Stopping early must not leave fetch tasks running
+            async for _ in helper.iter_bookings({"firstname": firstname}, window=2):
+                break
+            await asyncio.gather(
+                *(helper.delete_booking(bid, auth_token) for bid in booking_ids)
+            )
+            return booking_ids, seen
+
+    booking_ids, seen = asyncio.run(workflow())
+    assert set(seen) == booking_ids
+    assert all(booking["firstname"] == firstname for booking in seen.values())
+
+
+def test_semaphore_bounds_in_flight_requests():
+    """No more than max_concurrency requests are ever in flight at once."""
+    in_flight = 0
+    peak = 0
+
+    async def fake_request(method, url, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={}, request=httpx.Request(method, url))
+
+    async def run():
+        async with AsyncAPIClient(
+            base_url="http://stub.invalid", max_concurrency=5
+        ) as client:
+            client.client.request = fake_request
+            await asyncio.gather(*(client.get("ping") for _ in range(50)))
+
+    asyncio.run(run())
+    assert peak == 5, f"Expected peak concurrency of 5, got {peak}"
@@ -1,7 +1,12 @@
 # tests/test_auth.py
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from src.api_client import APIClient
-from src.helpers.auth import authenticate
+from src.helpers import auth as auth_helpers
+from src.helpers.auth import TokenManager, authenticate
 from src import config  # To potentially test with default credentials
 
 
@@ -46,3 +51,58 @@ def test_failed_authentication_bad_password(api_client: APIClient):
 
 
 # Add more tests for edge cases if needed (e.g., empty credentials if allowed/disallowed)
+
+
+# --- TokenManager (hermetic: /auth is replaced by a counting fake) ---
+
+
+@pytest.fixture
+def fake_authenticate(monkeypatch):
+    """Replaces authenticate() with a slow fake that counts /auth round trips."""
+    calls = []
+
+    def fake(api_client, username=None, password=None):
+        calls.append(username)
+        time.sleep(0.05)  # Give concurrent callers time to pile up
+        return f"token-{len(calls)}"
+
+    monkeypatch.setattr(auth_helpers, "authenticate", fake)
+    return calls
+
+
+def test_token_manager_caches_until_ttl_expires(fake_authenticate):
+    now = [0.0]
+    manager = TokenManager(None, ttl=60, clock=lambda: now[0])
+    assert manager.get_token() == "token-1"
+    assert manager.get_token() == "token-1"
+    now[0] = 61.0
+    assert manager.get_token() == "token-2"
+    assert len(fake_authenticate) == 2
+
+
+def test_token_manager_single_flight_across_threads(fake_authenticate):
+    manager = TokenManager(None)
+    with ThreadPoolExecutor(max_workers=20) as executor:
+        tokens = list(executor.map(lambda _: manager.get_token(), range(20)))
+    assert set(tokens) == {"token-1"}
+    assert len(fake_authenticate) == 1
+
+
+def test_token_manager_single_flight_across_coroutines(fake_authenticate):
+    manager = TokenManager(None)
+
+    async def fetch_many():
+        return await asyncio.gather(*(manager.aget_token() for _ in range(50)))
+
+    assert set(asyncio.run(fetch_many())) == {"token-1"}
+    assert len(fake_authenticate) == 1
+
+
+def test_token_manager_invalidate_keeps_newer_token(fake_authenticate):
+    manager = TokenManager(None)
+    stale = manager.get_token()
+    manager.invalidate(stale)
+    fresh = manager.get_token()
+    # A late failure report for the old token must not discard the new one
+    manager.invalidate(stale)
+    assert manager.get_token() == fresh == "token-2"
@@ -0,0 +1,74 @@
+# tests/test_bench_client.py
+# The regression gate of benchmarks/bench_client.py, on made-up numbers.
+from benchmarks.bench_client import (
+    THRESHOLDS,
+    compare,
+    merge_best,
+    parse_thresholds,
+)
+
+BASELINE = {
+    "create_booking": {
+        "cpu_us": 100.0,
+        "ops_per_s": 1000.0,
+        "py_calls": 200.0,
+        "alloc_kib": 10.0,
+    }
+}
+
+
+def _flagged(rows, regressions):
+    return {f"{rows[i][0]}.{rows[i][1]}" for i in regressions}
+
+
+def test_compare_gates_only_deterministic_metrics_by_default():
+    noisy = {
+        "create_booking": {
+            "cpu_us": 190.0,  # +90%: reported, not gated
+            "ops_per_s": 600.0,  # 40% fewer calls per second
+            "py_calls": 204.0,  # +2%: at the threshold
+            "alloc_kib": 10.6,  # +6%: beyond 5%
+        }
+    }
+    rows, regressions = compare(BASELINE, noisy)
+    assert _flagged(rows, regressions) == {"create_booking.alloc_kib"}
+    # Worst first; fewer ops per second counts as worse
+    assert [row[1] for row in rows] == ["cpu_us", "ops_per_s", "alloc_kib", "py_calls"]
+    assert rows[1][4] == 0.4
+
+
+def test_compare_gates_timings_when_asked():
+    results = {"create_booking": {**BASELINE["create_booking"], "cpu_us": 130.0}}
+    rows, regressions = compare(BASELINE, results, 0.25, THRESHOLDS)
+    assert _flagged(rows, regressions) == {"create_booking.cpu_us"}
+    rows, regressions = compare(BASELINE, results, 0.5, THRESHOLDS)
+    assert not regressions
+
+
+def test_compare_skips_metrics_missing_from_the_baseline():
+    results = {
+        "create_booking": {"cpu_us": 100.0, "cpu_us_mt": 500.0},
+        "new_operation": {"cpu_us": 1.0},
+    }
+    rows, regressions = compare(BASELINE, results, 0.0, THRESHOLDS)
+    assert [(row[0], row[1]) for row in rows] == [("create_booking", "cpu_us")]
+    assert not regressions
+
+
+def test_parse_thresholds():
+    assert parse_thresholds([]) == (None, THRESHOLDS)
+    default, per_metric = parse_thresholds(["0.5", "py_calls=0", "cpu_us=0.3"])
+    assert default == 0.5
+    assert per_metric == {**THRESHOLDS, "py_calls": 0.0, "cpu_us": 0.3}
+    assert THRESHOLDS == {"alloc_kib": 0.05, "py_calls": 0.02}  # Not mutated
+
+
+def test_merge_best_keeps_the_better_measurement():
+    results = {
+        "create_booking": {"cpu_us": 120.0, "ops_per_s": 800.0},
+        "get_booking": {"cpu_us": 50.0},
+    }
+    rerun = {"create_booking": {"cpu_us": 110.0, "ops_per_s": 700.0}}
+    merged = merge_best(results, rerun)
+    assert merged["create_booking"] == {"cpu_us": 110.0, "ops_per_s": 800.0}
+    assert merged["get_booking"] == {"cpu_us": 50.0}  # Not re-measured
@@ -1,40 +1,40 @@
 # tests/test_booking.py
+import threading
+
 import pytest
+import requests
 from src.api_client import APIClient
+from src.contracts import assert_contract
+from src.helpers import auth as auth_helpers
+from src.helpers.auth import TokenManager
 from src.helpers.booking import BookingHelper
 
 
 # Fixture to provide BookingHelper instance
 @pytest.fixture(scope="module")  # Use module scope if client doesn't change per test
-def booking_helper(api_client: APIClient):
-    return BookingHelper(api_client)
+def booking_helper(api_client: APIClient, token_manager: TokenManager):
+    return BookingHelper(api_client, token_manager=token_manager)
 
 
 # Test class to group booking tests
 class TestBookingWorkflow:
-    created_booking_id = None  # Store ID for cleanup
-
     def test_create_booking(self, booking_helper: BookingHelper, sample_booking_data):
         """Tests creating a new booking."""
         response = booking_helper.create_booking(sample_booking_data)
         assert response.status_code == 200, (
             f"Expected 200, got {response.status_code}. Body: {response.text}"
         )
+        assert_contract(response, "booking_created")
         response_data = response.json()
         assert "bookingid" in response_data
         assert response_data["booking"]["firstname"] == sample_booking_data["firstname"]
-        # Store the ID for later tests/cleanup
-        TestBookingWorkflow.created_booking_id = response_data["bookingid"]
-        print(
-            f"Created booking ID: {self.created_booking_id}"
-        )  # For visibility during test run
-
-    def test_get_booking(self, booking_helper: BookingHelper, sample_booking_data):
-        """Tests retrieving the created booking."""
-        assert TestBookingWorkflow.created_booking_id is not None, (
-            "Booking ID not created"
-        )
-        response = booking_helper.get_booking(TestBookingWorkflow.created_booking_id)
+        booking_helper.delete_booking(response_data["bookingid"])  # Clean up
+
+    def test_get_booking(
+        self, booking_helper: BookingHelper, booking, sample_booking_data
+    ):
+        """Tests retrieving a booking."""
+        response = booking_helper.get_booking(booking)
         assert response.status_code == 200, (
             f"Expected 200, got {response.status_code}. Body: {response.text}"
         )
@@ -43,18 +43,11 @@ class TestBookingWorkflow:
         assert response_data["lastname"] == sample_booking_data["lastname"]
 
     def test_update_booking(
-        self, booking_helper: BookingHelper, authenticated_api_client
+        self, booking_helper: BookingHelper, booking, authenticated_api_client
     ):
-        """Tests updating the created booking (requires auth)."""
+        """Tests updating a booking (requires auth)."""
         # Use the authenticated client and token provided by the fixture
         client, token = authenticated_api_client
-        # Re-initialize helper IF the fixture returns a client with modified headers
-        # Otherwise, just use the token with the existing helper instance
-        # booking_helper_auth = BookingHelper(client) # If client headers were modified by fixture
-
-        assert TestBookingWorkflow.created_booking_id is not None, (
-            "Booking ID not created"
-        )
         updated_data = {
             "firstname": "Pytest-Updated",
             "lastname": "User-Updated",
@@ -64,9 +57,7 @@ class TestBookingWorkflow:
             "additionalneeds": "Dinner",
         }
         # Use the token with the helper method
-        response = booking_helper.update_booking(
-            TestBookingWorkflow.created_booking_id, updated_data, token
-        )
+        response = booking_helper.update_booking(booking, updated_data, token)
         assert response.status_code == 200, (
             f"Expected 200, got {response.status_code}. Body: {response.text}"
         )
@@ -75,76 +66,155 @@ class TestBookingWorkflow:
         assert response_data["totalprice"] == 200
 
     def test_partial_update_booking(
-        self, booking_helper: BookingHelper, authenticated_api_client
+        self,
+        booking_helper: BookingHelper,
+        booking,
+        authenticated_api_client,
+        sample_booking_data,
     ):
-        """Tests partially updating the booking (requires auth)."""
+        """Tests partially updating a booking (requires auth)."""
         client, token = authenticated_api_client
-        assert TestBookingWorkflow.created_booking_id is not None, (
-            "Booking ID not created"
-        )
         partial_data = {
             "firstname": "Pytest-Patched",
             "additionalneeds": "Late Checkout",
         }
 
-        response = booking_helper.partial_update_booking(
-            TestBookingWorkflow.created_booking_id, partial_data, token
-        )
+        response = booking_helper.partial_update_booking(booking, partial_data, token)
         assert response.status_code == 200, (
             f"Expected 200, got {response.status_code}. Body: {response.text}"
         )
         response_data = response.json()
         assert response_data["firstname"] == "Pytest-Patched"
         assert response_data["additionalneeds"] == "Late Checkout"
-        # Verify other fields remain unchanged from the previous update step
-        assert response_data["lastname"] == "User-Updated"
+        # Verify the fields that were not sent remain unchanged
+        assert response_data["lastname"] == sample_booking_data["lastname"]
+        assert response_data["totalprice"] == sample_booking_data["totalprice"]
 
     def test_delete_booking(
-        self, booking_helper: BookingHelper, authenticated_api_client
+        self, booking_helper: BookingHelper, booking, authenticated_api_client
     ):
-        """Tests deleting the created booking (requires auth)."""
+        """Tests deleting a booking (requires auth)."""
         client, token = authenticated_api_client
-        assert TestBookingWorkflow.created_booking_id is not None, (
-            "Booking ID not created"
-        )
-
-        response = booking_helper.delete_booking(
-            TestBookingWorkflow.created_booking_id, token
-        )
+        response = booking_helper.delete_booking(booking, token)
         # restful-booker returns 201 Created on successful delete
         assert response.status_code == 201, (
             f"Expected 201, got {response.status_code}. Body: {response.text}"
         )
 
-        # Verify deletion by trying to GET the booking again
-        verify_response = booking_helper.get_booking(
-            TestBookingWorkflow.created_booking_id
-        )
-        assert verify_response.status_code == 404, (
-            f"Expected 404 after deletion, got {verify_response.status_code}"
+        # Verify deletion by trying to GET the booking again; the client
+        # raises for 4xx responses
+        with pytest.raises(requests.exceptions.HTTPError) as exc_info:
+            booking_helper.get_booking(booking)
+        assert exc_info.value.response.status_code == 404, (
+            f"Expected 404 after deletion, got {exc_info.value.response.status_code}"
         )
-        # Mark as cleaned up
-        TestBookingWorkflow.created_booking_id = None
-
-    # Optional: Add a cleanup fixture if tests might fail before deletion
-    # def test_cleanup(self, booking_helper: BookingHelper, authenticated_api_client):
-    #     """ Ensures cleanup even if a test fails mid-way (requires careful implementation) """
-    #     client, token = authenticated_api_client
-    #     if TestBookingWorkflow.created_booking_id:
-    #         try:
-    #             print(f"Running cleanup: Deleting booking ID {TestBookingWorkflow.created_booking_id}")
-    #             booking_helper.delete_booking(TestBookingWorkflow.created_booking_id, token)
-    #         except Exception as e:
-    #             print(f"Error during cleanup: {e}")
-    #         TestBookingWorkflow.created_booking_id = None
 
 
 def test_get_nonexistent_booking(booking_helper: BookingHelper):
     """Tests getting a booking ID that does not exist."""
-    response = booking_helper.get_booking(9999999)  # Use an unlikely ID
+    with pytest.raises(requests.exceptions.HTTPError) as exc_info:
+        booking_helper.get_booking(9999999)  # Use an unlikely ID
+    response = exc_info.value.response
     assert response.status_code == 404, (
         f"Expected 404, got {response.status_code}. Body: {response.text}"
     )
 
 
+def test_batch_create_get_delete(
+    booking_helper: BookingHelper, sample_booking_data, auth_token
+):
+    """Tests the batch methods: input order, per-item failures and timing."""
+    created = booking_helper.create_bookings([sample_booking_data] * 5)
+    assert not created.failed, f"Batch create failed: {created.failed}"
+    booking_ids = [response.json()["bookingid"] for response in created.responses]
+
+    # An unknown ID fails on its own without aborting the rest of the batch
+    fetched = booking_helper.get_bookings(booking_ids + [9999999])
+    assert [result.item for result in fetched] == booking_ids + [9999999]
+    assert [result.item for result in fetched.failed] == [9999999]
+    for result in fetched.succeeded:
+        assert result.response.json()["firstname"] == sample_booking_data["firstname"]
+    assert fetched.elapsed > 0 and fetched.throughput > 0
+
+    deleted = booking_helper.delete_bookings(booking_ids, auth_token)
+    assert not deleted.failed, f"Batch delete failed: {deleted.failed}"
+
+
+def test_rejected_token_is_refreshed_and_retried(
+    monkeypatch,
+    api_client: APIClient,
+    booking_helper: BookingHelper,
+    booking,
+    sample_booking_data,
+):
+    """A rejected token gets a 403; the helper retries once with a valid token."""
+    booking_id = booking
+
+    response = booking_helper.partial_update_booking(
+        booking_id, {"firstname": "Refreshed"}, token="stale-token"
+    )
+    assert response.status_code == 200
+    assert response.json()["firstname"] == "Refreshed"
+
+    # A rejected managed token is dropped and a new one is issued. This test
+    # has its own manager (the session's is shared), first issued a token the
+    # server no longer accepts
+    real_authenticate = auth_helpers.authenticate
+    issued = iter(["expired-on-server"])
+
+    def authenticate(*args, **kwargs):
+        return next(issued, None) or real_authenticate(*args, **kwargs)
+
+    monkeypatch.setattr(auth_helpers, "authenticate", authenticate)
+    token_manager = TokenManager(api_client)
+    helper = BookingHelper(api_client, token_manager=token_manager)
+    assert token_manager.get_token() == "expired-on-server"
+    response = helper.update_booking(booking_id, sample_booking_data)
+    assert response.status_code == 200
+    assert token_manager.refresh_count == 2
+    assert token_manager.get_token() != "expired-on-server"
+
+    # With a token manager the token argument is optional
+    response = helper.delete_booking(booking_id)
+    assert response.status_code == 201
+
+
+@pytest.mark.live  # The namespaced firstname differs from run to run
+def test_iter_bookings_streams_filtered_listing(
+    booking_helper: BookingHelper, sample_booking_data, worker_namespace
+):
+    """iter_bookings yields every matching booking, and stops cleanly early."""
+    firstname = f"Stream-{worker_namespace}"  # Only this test's bookings match
+    created = booking_helper.create_bookings(
+        [{**sample_booking_data, "firstname": firstname}] * 12
+    )
+    booking_ids = {response.json()["bookingid"] for response in created.responses}
+
+    params = {"firstname": firstname}
+    seen = dict(booking_helper.iter_bookings(params, max_workers=4))
+    assert set(seen) == booking_ids
+    assert all(booking["firstname"] == firstname for booking in seen.values())
+
+    threads_before = threading.active_count()
+    for count, _ in enumerate(booking_helper.iter_bookings(params, max_workers=4)):
+        if count == 2:
+            break  # Leaving the loop closes the generator
+    assert threading.active_count() == threads_before, "Fetch workers leaked"
+
+    booking_helper.delete_bookings(booking_ids)
+
+
+def test_generated_booking_round_trips(
+    booking_helper: BookingHelper, generated_booking
+):
+    """Varied payloads (names, prices, stays, needs) are stored as sent."""
+    response = booking_helper.create_booking(generated_booking)
+    assert_contract(response, "booking_created", status=200)
+    booking_id = response.json()["bookingid"]
+    try:
+        assert booking_helper.get_booking(booking_id).json() == generated_booking
+    finally:
+        booking_helper.delete_booking(booking_id)
+
+
 # Add more tests for filtering get_booking_ids, edge cases, invalid data, etc.
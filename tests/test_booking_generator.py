@@ -0,0 +1,61 @@
+# tests/test_booking_generator.py
+import itertools
+
+from src.helpers.booking import BookingHelper
+from src.helpers.booking_generator import BookingGenerator, Choice
+from src.models import Booking
+
+
+def test_stream_is_seeded_and_indexable(sample_booking_data):
+    """Same seed, same stream; payload(i) matches the stream across blocks."""
+    first = BookingGenerator(sample_booking_data, seed=3, block_size=100)
+    again = BookingGenerator(sample_booking_data, seed=3, block_size=100)
+    other = BookingGenerator(sample_booking_data, seed=4, block_size=100)
+    stream = list(first.generate(250))
+    assert stream == list(again.generate(250))
+    assert stream != list(other.generate(250))
+    assert list(first.generate(5, start=98)) == stream[98:103]
+    assert [first.payload(i) for i in (0, 99, 100, 249)] == [
+        stream[0],
+        stream[99],
+        stream[100],
+        stream[249],
+    ]
+    # Every payload is the caller's own copy
+    first.payload(7)["bookingdates"]["checkin"] = "1999-01-01"
+    assert first.payload(7) == stream[7]
+
+
+def test_payloads_are_valid_and_varied(sample_booking_data):
+    """Generated payloads keep the template's shape and pass validation."""
+    generator = BookingGenerator(
+        sample_booking_data, rules={"depositpaid": None, "lastname": Choice(["Q"])}
+    )
+    payloads = list(itertools.islice(generator, 5000))
+    for payload in payloads:
+        assert list(payload) == list(sample_booking_data)
+        Booking.from_dict(payload)  # Types, dates, checkout not before checkin
+    assert {p["depositpaid"] for p in payloads} == {True}  # Template value kept
+    assert {p["lastname"] for p in payloads} == {"Q"}
+    assert len({p["firstname"] for p in payloads}) > 20
+    assert len({p["totalprice"] for p in payloads}) > 1000
+    assert len({p["additionalneeds"] for p in payloads}) > 10
+    stays = {tuple(p["bookingdates"].values()) for p in payloads}
+    assert len(stays) > 4000
+    assert any(checkin == checkout for checkin, checkout in stays)
+
+
+def test_stream_feeds_bulk_create(
+    api_client, token_manager, booking_generator: BookingGenerator
+):
+    """create_bookings consumes the stream lazily; every payload is stored."""
+    helper = BookingHelper(api_client, token_manager=token_manager)
+    created = helper.create_bookings(booking_generator.generate(40, start=1000))
+    created.raise_for_failures()
+    for payload, response in zip(
+        booking_generator.generate(40, start=1000), created.responses
+    ):
+        assert response.json()["booking"] == payload
+    helper.delete_bookings(
+        [response.json()["bookingid"] for response in created.responses]
+    ).raise_for_failures()
@@ -0,0 +1,65 @@
+# tests/test_booking_pool.py
+import time
+
+import pytest
+
+from src.api_client import APIClient
+from src.helpers.auth import TokenManager
+from src.helpers.booking import BookingHelper
+from src.helpers.booking_pool import BookingPool, BookingPoolError
+from src.local_server import LocalBookerServer
+
+
+@pytest.fixture
+def pool_server():
+    """A local server with some latency, so a create is a real round trip."""
+    with LocalBookerServer(latency=0.02) as server:
+        with APIClient(base_url=server.base_url) as client:
+            helper = BookingHelper(client, token_manager=TokenManager(client))
+            yield server, helper
+
+
+def test_pool_hands_out_warm_bookings_and_refills(pool_server, sample_booking_data):
+    server, helper = pool_server
+    templates = [sample_booking_data, {**sample_booking_data, "firstname": "Jim"}]
+    with BookingPool(helper, templates, size=4) as pool:
+        deadline = time.monotonic() + 5
+        while pool.ready < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)  # Let the initial fill land
+        first = [pool.acquire() for _ in range(4)]
+        assert pool.stats.waited == 0, "Warm acquires should not wait"
+        # Templates are used in turn, and each test gets its own copy
+        assert {b.data["firstname"] for b in first} == {"Sally", "Jim"}
+        first[0].data["firstname"] = "Mutated"
+        assert sample_booking_data["firstname"] == "Sally"
+
+        # Replacements are already on their way; draining further may wait
+        more = [pool.acquire() for _ in range(6)]
+        ids = [b.booking_id for b in first + more]
+        assert len(set(ids)) == 10, "A booking was handed out twice"
+        helper.delete_booking(ids[0])  # A test may delete its booking itself
+    assert server.store.bookings == {}, "close() should delete every pooled booking"
+    assert pool.stats.acquired == 10
+    with pytest.raises(BookingPoolError):
+        pool.acquire()
+
+
+def test_failed_creates_reach_the_acquirer(pool_server, sample_booking_data):
+    _, helper = pool_server
+    bad = {**sample_booking_data, "bookingdates": "not dates"}
+    with BookingPool(helper, bad, size=1) as pool:
+        with pytest.raises(BookingPoolError, match="Could not create"):
+            pool.acquire(timeout=5)
+        assert pool.stats.failed >= 1
+
+
+def test_size_zero_creates_inline_in_acquire_order(pool_server, sample_booking_data):
+    server, helper = pool_server
+    templates = [sample_booking_data, {**sample_booking_data, "firstname": "Jim"}]
+    with BookingPool(helper, templates, size=0) as pool:
+        assert pool.ready == 0 and server.store.bookings == {}  # Nothing ahead
+        first, second = pool.acquire(), pool.acquire()
+        assert (first.data["firstname"], second.data["firstname"]) == ("Sally", "Jim")
+        assert second.booking_id == first.booking_id + 1
+        assert pool.stats.created == 2 and pool.stats.waited == 0
+    assert server.store.bookings == {}
@@ -0,0 +1,176 @@
+# tests/test_cassette.py
+import os
+import subprocess
+import sys
+import xml.etree.ElementTree as ElementTree
+
+import pytest
+import requests
+
+from src.api_client import APIClient
+from src.cassette import Cassette, UnrecordedRequest, request_key
+from src.helpers.booking import BookingHelper
+from src.local_server import LocalBookerServer
+
+UNREACHABLE = "http://127.0.0.1:9"  # Nothing listens there: replay only
+
+
+def _record_workflow(path, sample_booking_data):
+    """Records create, get, patch, get again and delete of one booking."""
+    with LocalBookerServer() as server, Cassette(path, mode="record") as cassette:
+        with APIClient(base_url=server.base_url, cassette=cassette) as client:
+            token = client.post(
+                "auth", json={"username": "admin", "password": "password123"}
+            ).json()["token"]
+            return _workflow(client, sample_booking_data, token), len(cassette)
+
+
+def _workflow(client, booking_data, token):
+    helper = BookingHelper(client)
+    booking_id = helper.create_booking(booking_data).json()["bookingid"]
+    before = helper.get_booking(booking_id).json()
+    helper.partial_update_booking(booking_id, {"firstname": "Changed"}, token)
+    after = helper.get_booking(booking_id).json()
+    helper.delete_booking(booking_id, token)
+    return booking_id, before["firstname"], after["firstname"]
+
+
+def test_strict_replay_serves_recorded_responses_in_order(
+    tmp_path, sample_booking_data
+):
+    path = tmp_path / "workflow.cassette"
+    recorded, count = _record_workflow(path, sample_booking_data)
+    assert count == 6
+
+    with Cassette(path, strict=True) as cassette:
+        with APIClient(base_url=UNREACHABLE, cassette=cassette) as client:
+            # The recorded token is in the recorded auth response
+            token = client.post(
+                "auth", json={"username": "admin", "password": "password123"}
+            ).json()["token"]
+            # Repeated GETs get the before and after responses, in order
+            assert _workflow(client, sample_booking_data, token) == recorded
+            assert recorded[1:] == (sample_booking_data["firstname"], "Changed")
+            # Never recorded, and strict replay does not fall back to the network
+            with pytest.raises(UnrecordedRequest):
+                client.get("booking/424242")
+        assert cassette.stats.played == 6
+        assert cassette.stats.missed == 1
+
+
+def test_replay_keeps_serving_the_last_response_when_not_strict(
+    tmp_path, sample_booking_data
+):
+    path = tmp_path / "workflow.cassette"
+    (booking_id, _, changed), _ = _record_workflow(path, sample_booking_data)
+    with Cassette(path) as cassette:
+        with APIClient(base_url=UNREACHABLE, cassette=cassette) as client:
+            for _ in range(3):
+                client.get(f"booking/{booking_id}")
+            assert client.get(f"booking/{booking_id}").json()["firstname"] == changed
+        assert cassette.stats.repeated == 2
+
+
+def test_keys_ignore_host_and_parameter_order():
+    body = b'{"a": 1, "b": [2, 3]}'
+    assert request_key("GET", "http://localhost:8000/booking?b=2&a=1") == (
+        request_key("get", "https://example.com/booking?a=1&b=2")
+    )
+    assert request_key("POST", "http://x/booking", body) == request_key(
+        "POST", "http://y/booking", '{"b":[2,3],"a":1}'
+    )
+    assert request_key("POST", "http://x/booking", body) != request_key(
+        "POST", "http://x/booking", b'{"a": 2, "b": [2, 3]}'
+    )
+
+
+def test_unclosed_recording_is_reindexed_and_appended(tmp_path):
+    path = tmp_path / "large.cassette"
+    cassette = Cassette(path, mode="record")
+    for booking_id in range(5000):
+        request = requests.Request("GET", f"http://x/booking/{booking_id}").prepare()
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"bookingid": %d}' % booking_id
+        cassette.record(request, response)
+    cassette._file.flush()  # As if the process died before close()
+    assert not os.path.exists(f"{path}.idx")
+
+    with Cassette(path, strict=True) as replay:
+        assert len(replay) == 5000
+        request = requests.Request("GET", "http://y/booking/4321").prepare()
+        assert replay.play(request).json() == {"bookingid": 4321}
+    assert os.path.exists(f"{path}.idx")  # Rebuilt by the scan
+
+    # Recording again appends; a repeat of a recorded request is its 2nd occurrence
+    with Cassette(path, mode="record") as more:
+        request = requests.Request("GET", "http://x/booking/7").prepare()
+        response = requests.Response()
+        response.status_code = 404
+        response._content = b"Not Found"
+        more.record(request, response)
+    with Cassette(path, strict=True) as replay:
+        assert len(replay) == 5001
+        request = requests.Request("GET", "http://x/booking/7").prepare()
+        assert replay.play(request).status_code == 200
+        assert replay.play(request).status_code == 404
+        with pytest.raises(UnrecordedRequest):
+            replay.play(request)
+    cassette.close()
+
+
+_SELF = "test_whole_suite_replays_offline_in_strict_mode"
+
+
+def _run_suite(tmp_path, name, *options, env=None):
+    """Runs the whole suite but this test; returns {test id: outcome}."""
+    report = tmp_path / f"{name}.xml"
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            "-q",
+            "-p",
+            "no:cacheprovider",
+            f"--deselect=tests/{os.path.basename(__file__)}::{_SELF}",
+            f"--html={tmp_path / name}.html",
+            f"--junit-xml={report}",
+            *options,
+        ],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        env={**os.environ, **(env or {})},
+        capture_output=True,
+        check=False,
+    )
+    outcomes = {}
+    for case in ElementTree.parse(report).iter("testcase"):
+        test_id = f"{case.get('classname')}::{case.get('name')}"
+        kinds = [child.tag for child in case if child.tag != "system-out"]
+        outcomes[test_id] = next(
+            (k for k in kinds if k in ("error", "failure", "skipped")), "passed"
+        )
+    return outcomes
+
+
+def test_whole_suite_replays_offline_in_strict_mode(tmp_path):
+    """Every test that passes while recording passes (or is skipped as live)
+    when the suite is replayed strictly, with no server to fall back on."""
+    cassette = f"--cassette={tmp_path / 'suite.cassette'}"
+    recorded = _run_suite(
+        tmp_path, "record", "--local-server", cassette, "--cassette-mode=record"
+    )
+    replayed = _run_suite(
+        tmp_path,
+        "replay",
+        cassette,
+        "--cassette-mode=strict",
+        env={"API_BASE_URL": UNREACHABLE},
+    )
+    assert replayed.keys() == recorded.keys()
+    broken = {
+        test_id: outcome
+        for test_id, outcome in replayed.items()
+        if recorded[test_id] == "passed" and outcome not in ("passed", "skipped")
+    }
+    assert not broken, f"Fail under strict replay: {broken}"
@@ -0,0 +1,57 @@
+# tests/test_codec.py
+import pytest
+import requests
+
+from src.api_client import APIClient
+from src.codec import APIResponse, available_codecs, get_codec
+
+
+class CountingCodec:
+    """Stdlib codec that counts how often it runs."""
+
+    name = "counting"
+
+    def __init__(self):
+        self.inner = get_codec("stdlib")
+        self.encoded = self.decoded = 0
+
+    def encode(self, obj):
+        self.encoded += 1
+        return self.inner.encode(obj)
+
+    def decode(self, data):
+        self.decoded += 1
+        return self.inner.decode(data)
+
+
+@pytest.mark.parametrize("name", available_codecs())
+def test_codecs_round_trip_bytes(name):
+    codec = get_codec(name)
+    booking = {"firstname": "Zoë", "totalprice": 111, "depositpaid": True}
+    encoded = codec.encode(booking)
+    assert isinstance(encoded, bytes)
+    assert codec.decode(encoded) == booking
+
+
+def test_unknown_codec_is_rejected():
+    with pytest.raises(ValueError, match="Unknown codec"):
+        get_codec("yaml")
+
+
+@pytest.mark.live  # Its own client bypasses the cassette
+def test_client_encodes_and_decodes_once_with_its_codec(base_url, sample_booking_data):
+    codec = CountingCodec()
+    with APIClient(base_url, codec=codec) as client:
+        response = client.post("booking", json=sample_booking_data)
+        assert isinstance(response, APIResponse)
+        assert response.request.headers["Content-Type"] == "application/json"
+        assert codec.encoded == 1 and codec.decoded == 0  # Nothing decoded yet
+        booking = response.json()
+        assert response.json() is booking
+        assert codec.decoded == 1
+        assert booking["booking"]["firstname"] == sample_booking_data["firstname"]
+
+        ping = client.get("ping")
+        assert ping and ping.text == "Created"
+        with pytest.raises(requests.exceptions.JSONDecodeError):
+            ping.json()
@@ -0,0 +1,51 @@
+# tests/test_config.py
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src import config
+
+
+def test_import_reads_no_settings(tmp_path):
+    """Importing needs no API_BASE_URL and loads neither dotenv nor asyncio."""
+    script = (
+        "import sys, src.helpers.booking; "
+        "print(sorted(m for m in ('dotenv', 'asyncio') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=tmp_path,  # No .env here
+        env={"PYTHONPATH": os.path.dirname(os.path.dirname(config.__file__))},
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+
+def test_profiles_and_overrides(tmp_path):
+    """Profiles load once; overrides and configure() never touch the cache."""
+    postman = config.load_settings("postman")
+    assert postman.base_url == "https://restful-booker.herokuapp.com"
+    assert postman.booking_url == f"{postman.base_url}/booking"
+    assert config.load_settings("postman") is postman
+
+    worker = config.load_settings("postman", base_url="http://127.0.0.1:3002/")
+    assert worker.auth_url == "http://127.0.0.1:3002/auth"
+    assert config.load_settings("postman") is postman
+
+    export = tmp_path / "staging.postman_environment.json"
+    export.write_text('{"values": [{"key": "url", "value": "http://staging:8080"}]}')
+    previous = config.configure(profile=str(export))
+    try:
+        assert config.BASE_URL == "http://staging:8080"
+        assert config.HEALTHCHECK_URL == "http://staging:8080/ping"
+    finally:
+        config.configure(previous)
+
+    with pytest.raises(config.ConfigurationError, match="Unknown profile"):
+        config.load_settings("nope")
+    with pytest.raises(AttributeError):
+        config.NOT_A_SETTING
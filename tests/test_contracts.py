@@ -0,0 +1,111 @@
+# tests/test_contracts.py
+import copy
+import timeit
+
+import pytest
+
+from src.contracts import (
+    ContractViolation,
+    assert_contract,
+    compile_schema,
+    get_validator,
+)
+from src.helpers.booking import BookingHelper
+
+CREATED = {
+    "bookingid": 7,
+    "booking": {
+        "firstname": "Jim",
+        "lastname": "Brown",
+        "totalprice": 111,
+        "depositpaid": True,
+        "bookingdates": {"checkin": "2018-01-01", "checkout": "2019-01-01"},
+        "additionalneeds": "Breakfast",
+    },
+}
+
+
+def _violation(contract, body):
+    with pytest.raises(ContractViolation) as excinfo:
+        get_validator(contract)(body)
+    return excinfo.value.path, excinfo.value.message
+
+
+def test_valid_bodies_pass():
+    get_validator("booking_created")(CREATED)
+    get_validator("booking")(CREATED["booking"])
+    get_validator("booking_ids")([{"bookingid": 1}, {"bookingid": 2}])
+    get_validator("auth")({"token": "abc123"})
+    get_validator("ping")("Created")
+    assert get_validator("booking") is get_validator("booking")  # Compiled once
+
+
+@pytest.mark.parametrize(
+    "path, value, expected",
+    [
+        (("bookingid",), "7", ("$.bookingid", "expected integer")),
+        (("booking", "depositpaid"), 1, ("$.booking.depositpaid", "expected boolean")),
+        (("booking", "totalprice"), True, ("$.booking.totalprice", "expected number")),
+        (
+            ("booking", "bookingdates", "checkin"),
+            "2018-02-30",
+            ("$.booking.bookingdates.checkin", "not an ISO date (YYYY-MM-DD)"),
+        ),
+        (
+            ("booking", "bookingdates", "checkout"),
+            "2017-12-31",
+            ("$.booking.bookingdates.checkout", "is before checkin"),
+        ),
+    ],
+)
+def test_violations_report_the_path(path, value, expected):
+    body = copy.deepcopy(CREATED)
+    target = body
+    for key in path[:-1]:
+        target = target[key]
+    target[path[-1]] = value
+    assert _violation("booking_created", body) == expected
+
+
+def test_missing_fields_and_array_items():
+    body = copy.deepcopy(CREATED)
+    del body["booking"]["lastname"]
+    assert _violation("booking_created", body) == ("$.booking.lastname", "missing")
+    ids = [{"bookingid": 1}, {"bookingid": None}]
+    assert _violation("booking_ids", ids) == ("$[1].bookingid", "expected integer")
+    assert _violation("auth", {"reason": "Bad credentials"}) == ("$.token", "missing")
+
+
+def test_additional_properties():
+    validate = compile_schema(
+        {
+            "type": "object",
+            "properties": {"a": {"type": "integer"}},
+            "additionalProperties": False,
+        }
+    )
+    validate({"a": 1})
+    with pytest.raises(ContractViolation, match=r"\$\.b: not allowed"):
+        validate({"a": 1, "b": 2})
+
+
+def test_validation_costs_microseconds():
+    validate = get_validator("booking_created")
+    seconds = min(timeit.repeat(lambda: validate(CREATED), number=1000, repeat=5))
+    assert seconds / 1000 < 50e-6  # Typically 2-3us; generous for slow CI
+
+
+def test_helper_validate_mode_and_assertion_helper(
+    api_client, token_manager, sample_booking_data
+):
+    helper = BookingHelper(api_client, token_manager=token_manager, validate=True)
+    response = helper.create_booking(sample_booking_data)
+    assert_contract(response, "booking_created", status=200)
+    booking_id = response.json()["bookingid"]
+    try:
+        assert_contract(helper.get_booking(booking_id), "booking", status=200)
+        helper.get_booking_ids()
+        with pytest.raises(AssertionError, match=r"\$\.token: missing"):
+            assert_contract(helper.get_booking(booking_id), "auth")
+    finally:
+        helper.delete_booking(booking_id)
@@ -0,0 +1,83 @@
+# tests/test_flow_control.py
+# These tests start their own LocalBookerServer, so they never touch the network.
+import threading
+import time
+
+import pytest
+
+from src.api_client import APIClient
+from src.deadline import DeadlineExceeded, deadline
+from src.flow_control import FlowControl, TokenBucket, parse_retry_after
+from src.helpers.booking import BookingHelper
+from src.local_server import LocalBookerServer
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after(
+        "Wed, 21 Oct 2015 07:28:30 GMT", now=1445412480.0
+    ) == pytest.approx(30.0)
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0  # In the past
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_token_bucket_spaces_requests_after_the_burst():
+    now = [0.0]
+    bucket = TokenBucket(rate=10, burst=2, clock=lambda: now[0])
+    assert [bucket.reserve() for _ in range(4)] == pytest.approx([0, 0, 0.1, 0.2])
+    now[0] = 1.0  # Refilled to the burst size, not beyond
+    assert [bucket.reserve() for _ in range(3)] == pytest.approx([0, 0, 0.1])
+
+
+def test_bulk_create_adapts_to_a_throttling_server(sample_booking_data):
+    """
+    The server handles 4 requests at once and answers 429 beyond that; the
+    batch starts 16 workers and still creates every booking.
+    """
+    payloads = [sample_booking_data] * 60
+    flow_control = FlowControl(max_concurrency=16, backoff=0.01, max_retries=10)
+    server = LocalBookerServer(latency=0.01, max_in_flight=4)
+    with (
+        server,
+        APIClient(
+            server.base_url, pool_maxsize=16, flow_control=flow_control
+        ) as client,
+    ):
+        result = BookingHelper(client).create_bookings(payloads)
+
+    assert result.max_workers == 16
+    assert not result.failed, result.failed[0].error
+    assert len(server.store.bookings) == 60
+    assert server.requests_throttled > 0
+    assert flow_control.stats.throttled == server.requests_throttled
+    assert flow_control.limiter.decreases > 0, flow_control.summary()
+    assert flow_control.limiter.in_flight == 0
+
+
+def test_retry_after_pauses_the_client():
+    """A 429 with Retry-After holds the request until the server frees up."""
+    flow_control = FlowControl(initial_concurrency=2, max_concurrency=2)
+    server = LocalBookerServer(latency=0.3, max_in_flight=1, retry_after=0.4)
+    with server, APIClient(server.base_url, flow_control=flow_control) as client:
+        first = threading.Thread(target=client.get, args=("ping",))
+        first.start()
+        time.sleep(0.05)  # Let the first request occupy the server
+        started = time.perf_counter()
+        assert client.get("ping").status_code == 201
+        elapsed = time.perf_counter() - started
+        first.join()
+
+    assert flow_control.stats.throttled == 1 and flow_control.stats.retries == 1
+    assert elapsed >= 0.4 + 0.3  # Retry-After, then the retried request itself
+
+    flow_control = FlowControl()
+    server = LocalBookerServer(latency=0.3, max_in_flight=1, retry_after=5)
+    with server, APIClient(server.base_url, flow_control=flow_control) as client:
+        first = threading.Thread(target=client.get, args=("ping",))
+        first.start()
+        time.sleep(0.05)
+        # Waiting 5s would blow the budget, so fail fast instead
+        with pytest.raises(DeadlineExceeded), deadline(1.0):
+            client.get("ping")
+        first.join()
@@ -1,7 +1,12 @@
 # tests/test_health.py
+import asyncio
+import json
+
 import pytest
 from src.api_client import APIClient
 from src import config  # To get the relative health check URL path
+from src.health import SLO, HealthMonitor, RollingWindow, check_api_health
+from src.local_server import LocalBookerServer
 
 
 # The test function automatically receives the 'api_client' instance
@@ -36,3 +41,63 @@ def test_health_check(api_client: APIClient):
         # If any exception occurs during the API call (e.g., network error, timeout),
         # fail the test with an informative message.
         pytest.fail(f"Health check request failed unexpectedly: {e}")
+
+
+def test_check_api_health(api_client: APIClient, capsys):
+    """check_api_health pings the configured endpoint and reports success."""
+    assert check_api_health(api_client) is True
+    assert "Health check successful" in capsys.readouterr().out
+
+
+def test_rolling_window_forgets_old_probes():
+    """Probes older than the window stop counting; memory stays fixed."""
+    now = [0.0]
+    window = RollingWindow(window=10.0, buckets=5, clock=lambda: now[0])
+    window.record(0.5, ok=True)
+    window.record(0.1, ok=False)
+    now[0] = 6.0
+    window.record(0.01, ok=True)
+
+    histogram, ok, failed = window.snapshot()
+    assert (ok, failed) == (2, 1)
+    assert histogram.max_value() == pytest.approx(0.5, rel=0.01)
+
+    now[0] = 11.0  # The first slice has left the window
+    histogram, ok, failed = window.snapshot()
+    assert (ok, failed) == (1, 0)
+    assert histogram.max_value() == pytest.approx(0.01, rel=0.01)
+
+
+def test_health_monitor_flags_slo_breaches(caplog):
+    """Targets are probed concurrently; slow and dead ones breach the SLO."""
+    slo = SLO(latency_percentile=90, latency_threshold=0.03, min_probes=3)
+    with LocalBookerServer() as fast, LocalBookerServer(latency=0.05) as slow:
+        monitor = HealthMonitor(
+            {
+                "fast": fast.base_url,
+                "slow": slow.base_url,
+                "dead": "http://127.0.0.1:9",  # Discard port: nothing listens
+            },
+            interval=0.1,
+            timeout=1.0,
+            slo=slo,
+        )
+        rounds = []
+        with caplog.at_level("WARNING", logger="src.health"):
+            asyncio.run(monitor.run(duration=0.6, on_round=rounds.append))
+
+    state = json.loads(json.dumps(monitor.state()))  # Must be plain JSON
+    assert state["schema"] == "health-monitor/1"
+    assert state["rounds"] == len(rounds) >= 3
+    targets = state["targets"]
+    assert targets["fast"]["availability"] == 1.0
+    assert targets["fast"]["slo_breaches"] == []
+    assert targets["fast"]["healthy"] is True
+    assert targets["slow"]["slo_breaches"] == ["latency"]
+    assert targets["slow"]["latency_ms"]["p90"] >= 50
+    assert targets["dead"]["availability"] == 0.0
+    assert targets["dead"]["healthy"] is False
+    assert "availability" in targets["dead"]["slo_breaches"]
+    assert targets["dead"]["last"]["error"]
+    # Each breach is logged once, when it starts
+    assert sum("SLO breach on slow" in r.message for r in caplog.records) == 1
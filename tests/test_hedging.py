@@ -0,0 +1,39 @@
+# tests/test_hedging.py
+# These tests start their own LocalBookerServer, so they never touch the network.
+import time
+
+from src.api_client import APIClient
+from src.hedging import HedgePolicy
+from src.local_server import LocalBookerServer
+
+
+def test_hedged_gets_cut_the_slow_tail():
+    """Stalled GETs are duplicated after the p50 latency and the hedge wins."""
+    policy = HedgePolicy(percentile=50, min_samples=10, max_hedge_ratio=0.5)
+    server = LocalBookerServer(latency=0.002, slow_rate=0.2, slow_latency=0.3, seed=1)
+    with server, APIClient(server.base_url, pool_maxsize=8, hedging=policy) as client:
+        for _ in range(10):  # Learn the endpoint's latency (unhedged)
+            client.get("ping")
+        slow = 0
+        for _ in range(60):
+            started = time.perf_counter()
+            client.get("ping")
+            slow += time.perf_counter() - started >= 0.3
+        policy.close()
+
+    stats = policy.stats
+    assert stats.fired > 0 and stats.won > 0, stats.summary()
+    assert stats.fired <= 0.5 * stats.requests  # Hedge budget respected
+    # Unhedged, about 12 of the 60 calls would have stalled
+    assert slow <= 4, f"{slow} slow calls; {stats.summary()}"
+
+
+def test_writes_are_never_hedged():
+    policy = HedgePolicy(min_samples=1, min_delay=0.0)
+    with LocalBookerServer(latency=0.01) as server:
+        with APIClient(server.base_url, hedging=policy) as client:
+            for _ in range(5):
+                client.post("auth", json={})
+            client.get("ping", hedge=False)
+    policy.close()
+    assert policy.stats.requests == 0
@@ -0,0 +1,21 @@
+# tests/test_json_stream.py
+import json
+
+import pytest
+
+from src.helpers.json_stream import iter_json_array
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 4096])
+def test_array_split_at_any_boundary(chunk_size):
+    """Elements are rebuilt whatever byte boundaries the chunks fall on."""
+    values = [{"bookingid": 1}, 123, -1.5e3, "é,]", [1, [2]], None, True, {}]
+    raw = json.dumps(values, ensure_ascii=False).encode()
+    chunks = (raw[i : i + chunk_size] for i in range(0, len(raw), chunk_size))
+    assert list(iter_json_array(chunks)) == values
+
+
+@pytest.mark.parametrize("raw", [b"{}", b"[1,]", b"[1", b"[1]x"])
+def test_malformed_array_raises(raw):
+    with pytest.raises(ValueError):
+        list(iter_json_array([raw]))
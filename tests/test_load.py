@@ -0,0 +1,146 @@
+# tests/test_load.py
+import json
+import logging
+import queue
+import random
+import threading
+
+import pytest
+
+from src import config
+from src.histogram import LatencyHistogram
+from src.load import distributed
+from src.load.cli import main
+from src.load.distributed import LoadJob, merge_outcomes, run_on_nodes, serve_node
+from src.load.workflow import STEPS
+from src.local_server import LocalBookerServer
+
+
+def test_closed_loop_run_writes_json_summary(monkeypatch, tmp_path, capsys):
+    def no_base_url():
+        raise config.ConfigurationError("API_BASE_URL is not set")
+
+    # --local-server must not need API_BASE_URL, nor leave logging changed
+    monkeypatch.delenv(config.PROFILE_VARIABLE, raising=False)
+    monkeypatch.setitem(config.PROFILES, "env", no_base_url)
+    monkeypatch.setattr(config, "_active", None)
+    config._load_profile.cache_clear()
+    src_level = logging.getLogger("src").level
+    output = tmp_path / "summary.json"
+    try:
+        main(
+            [
+                "--local-server",
+                "--concurrency",
+                "2",
+                "--duration",
+                "0.5",
+                "--output",
+                str(output),
+            ]
+        )
+    finally:
+        config._load_profile.cache_clear()
+    summary = json.loads(output.read_text())
+    assert summary["mode"] == "closed"
+    assert summary["workflows"]["completed"] > 0
+    assert summary["workflows"]["failed"] == 0
+    for step in STEPS:
+        stats = summary["endpoints"][step]
+        assert stats["count"] == summary["workflows"]["completed"]
+        assert set(stats["latency_ms"]) >= {"p50", "p90", "p99", "p99.9"}
+    # The total counts requests only, not the whole-workflow rows
+    assert (
+        summary["endpoints"]["total"]["count"] == 5 * summary["workflows"]["completed"]
+    )
+    assert "POST /booking" in capsys.readouterr().out
+    assert logging.getLogger("src").level == src_level
+
+
+def test_open_loop_run_holds_target_rate(tmp_path):
+    output = tmp_path / "summary.json"
+    main(["--local-server", "--rate", "20", "--duration", "1", "--output", str(output)])
+    summary = json.loads(output.read_text())
+    assert summary["mode"] == "open"
+    started = summary["workflows"]["completed"] + summary["workflows"]["failed"]
+    assert 18 <= started + summary["workflows"]["dropped"] <= 21
+
+
+def test_histograms_merge_exactly_and_stay_compact():
+    rng = random.Random(7)
+    samples = [rng.lognormvariate(-5, 1) for _ in range(50_000)]
+    whole, left, right = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for i, seconds in enumerate(samples):
+        whole.record(seconds)
+        (left if i % 2 else right).record(seconds)
+
+    shipped = LatencyHistogram.from_dict(json.loads(json.dumps(left.to_dict())))
+    merged = shipped.merge(right)
+    samples.sort()
+    for pct in (50, 90, 99, 99.9):
+        assert merged.percentile(pct) == whole.percentile(pct)
+        exact = samples[int(pct / 100 * len(samples)) - 1]
+        assert abs(merged.percentile(pct) - exact) / exact < 0.01
+    assert len(left.to_dict()["buckets"]) < 5_000, "Snapshot should not grow per sample"
+
+
+def test_split_job_preserves_offered_load():
+    job = LoadJob("http://x", {}, duration=1, concurrency=10, workers=7)
+    parts = job.split(4)
+    assert [part.concurrency for part in parts] == [3, 3, 2, 2]
+    open_loop = LoadJob("http://x", {}, duration=1, rate=100).split(4)
+    assert sum(part.rate for part in open_loop) == 100
+
+
+def test_coordinator_merges_worker_node_results(monkeypatch, sample_booking_data):
+    monkeypatch.setattr(distributed, "COORDINATED_START_DELAY", 0.2)
+    bound = queue.Queue()
+    node = threading.Thread(
+        target=serve_node,
+        args=(("127.0.0.1", 0), b"test-key", 1),
+        kwargs={"max_jobs": 1, "ready": bound.put},
+        daemon=True,
+    )
+    node.start()
+    host, port = bound.get(timeout=5)  # Listening from here on
+    with LocalBookerServer() as server:
+        job = LoadJob(server.base_url, sample_booking_data, duration=0.5, concurrency=2)
+        outcomes = run_on_nodes(job, [f"{host}:{port}"], b"test-key")
+    node.join(timeout=5)
+    result, recorder = merge_outcomes(outcomes)
+    assert result.completed > 0 and result.failed == 0
+    assert recorder.endpoints["POST /booking"].count == result.completed
+
+
+def test_process_pool_run_merges_every_process(monkeypatch, tmp_path):
+    monkeypatch.setattr(distributed, "COORDINATED_START_DELAY", 0.5)
+    output = tmp_path / "summary.json"
+    main(
+        [
+            "--local-server",
+            "--concurrency",
+            "2",
+            "--processes",
+            "2",
+            "--duration",
+            "0.5",
+            "--output",
+            str(output),
+        ]
+    )
+    summary = json.loads(output.read_text())
+    assert summary["processes"] == 2
+    assert summary["workflows"]["completed"] > 0
+    assert summary["workflows"]["failed"] == 0
+    # Both processes' histograms landed in the merged summary
+    assert (
+        summary["endpoints"]["POST /booking"]["count"]
+        == summary["workflows"]["completed"]
+    )
+
+
+def test_worker_node_and_coordinator_require_a_secret(monkeypatch):
+    monkeypatch.delenv("LOAD_AUTHKEY", raising=False)
+    for argv in (["--serve", "127.0.0.1:0"], ["--rate", "1", "--nodes", "w1:7100"]):
+        with pytest.raises(SystemExit):
+            main(argv)
@@ -0,0 +1,86 @@
+# tests/test_local_server.py
+# These tests start their own LocalBookerServer, so they never touch the network.
+import socket
+import time
+
+import pytest
+import requests
+
+from src import config
+from src.api_client import APIClient
+from src.local_server import LocalBookerServer
+
+
+@pytest.fixture
+def booking_payload(sample_booking_data):
+    return dict(sample_booking_data)
+
+
+def test_server_starts_in_milliseconds():
+    started = time.perf_counter()
+    with LocalBookerServer() as server:
+        elapsed = time.perf_counter() - started
+        response = requests.get(f"{server.base_url}/ping")
+    assert elapsed < 0.5, f"Server took {elapsed:.3f}s to start"
+    assert response.status_code == 201
+    assert response.text == "Created"
+
+
+def test_booking_filters_and_auth_rules(booking_payload):
+    with LocalBookerServer() as server:
+        client = APIClient(server.base_url, default_headers=config.DEFAULT_HEADERS)
+        first = client.post("booking", json=booking_payload).json()["bookingid"]
+        client.post("booking", json={**booking_payload, "firstname": "Other"})
+
+        ids = client.get("booking", params={"firstname": "Other"}).json()
+        assert len(ids) == 1 and ids[0]["bookingid"] != first
+
+        # Writes without a valid token are rejected like restful-booker does
+        with pytest.raises(requests.exceptions.HTTPError) as exc_info:
+            client.delete(f"booking/{first}", headers={"Cookie": "token=nope"})
+        assert exc_info.value.response.status_code == 403
+
+        token = client.post(
+            "auth",
+            json={"username": config.AUTH_USERNAME, "password": config.AUTH_PASSWORD},
+        ).json()["token"]
+        response = client.delete(
+            f"booking/{first}", headers={"Cookie": f"token={token}"}
+        )
+        assert response.status_code == 201
+        client.close()
+
+
+def test_latency_and_error_injection():
+    with LocalBookerServer(latency=0.05) as server:
+        started = time.perf_counter()
+        requests.get(f"{server.base_url}/ping")
+        assert time.perf_counter() - started >= 0.05
+
+    with LocalBookerServer(error_rate=1.0, error_status=503) as server:
+        response = requests.get(f"{server.base_url}/ping")
+        assert response.status_code == 503
+
+
+def test_head_sends_headers_only_and_keeps_the_connection():
+    with LocalBookerServer() as server:
+        with socket.create_connection((server.host, server.port)) as sock:
+            sock.sendall(
+                b"HEAD /ping HTTP/1.1\r\n\r\n"
+                b"GET /ping HTTP/1.1\r\nConnection: close\r\n\r\n"
+            )
+            received = b""
+            while chunk := sock.recv(4096):
+                received += chunk
+        head, get = received.split(b"\r\n\r\n", 1)
+        assert b"Content-Length: 7" in head  # What a GET would send
+        # Any body after the HEAD headers would be read as the next response
+        assert get.startswith(b"HTTP/1.1 201") and get.endswith(b"\r\n\r\nCreated")
+        assert server.connections_accepted == 1
+
+        # A client hanging up mid-body just closes that connection
+        with socket.create_connection((server.host, server.port)) as sock:
+            sock.sendall(
+                b'POST /booking HTTP/1.1\r\nContent-Length: 100\r\n\r\n{"first'
+            )
+        assert requests.get(f"{server.base_url}/ping").status_code == 201
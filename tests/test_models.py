@@ -0,0 +1,61 @@
+# tests/test_models.py
+import json
+from datetime import date
+
+import pytest
+
+from src.helpers.booking import BookingHelper
+from src.models import Booking, BookingDates, BookingValidationError
+
+
+def test_parse_validate_and_serialize_round_trip(sample_booking_data):
+    booking = Booking.from_json(json.dumps(sample_booking_data).encode())
+    assert booking.bookingdates.checkin == date.fromisoformat(
+        sample_booking_data["bookingdates"]["checkin"]
+    )
+    assert json.loads(booking.to_json()) == sample_booking_data
+    assert booking.to_dict() == sample_booking_data
+    assert Booking.from_json(booking.to_json()) == booking
+
+
+@pytest.mark.parametrize(
+    "change, field",
+    [
+        ({"firstname": None}, "firstname"),
+        ({"totalprice": "111"}, "totalprice"),
+        ({"totalprice": True}, "totalprice"),
+        ({"depositpaid": "yes"}, "depositpaid"),
+        (
+            {"bookingdates": {"checkin": "2025-13-01", "checkout": "2025-01-02"}},
+            "bookingdates.checkin",
+        ),
+        ({"bookingdates": {"checkin": "2025-01-01"}}, "bookingdates.checkout"),
+        (
+            {"bookingdates": {"checkin": "2025-02-01", "checkout": "2025-01-01"}},
+            "bookingdates",
+        ),
+    ],
+)
+def test_invalid_payloads_name_the_field(sample_booking_data, change, field):
+    with pytest.raises(BookingValidationError) as excinfo:
+        Booking.from_dict({**sample_booking_data, **change})
+    assert excinfo.value.field == field
+
+
+def test_helper_accepts_and_returns_models(
+    api_client, token_manager, sample_booking_data
+):
+    helper = BookingHelper(api_client, token_manager=token_manager)
+    created = helper.create_booking(Booking.from_dict(sample_booking_data), model=True)
+    try:
+        assert created.booking_id is not None
+        fetched = helper.get_booking(created.booking_id, model=True)
+        assert fetched == created and fetched.booking_id == created.booking_id
+
+        later = BookingDates(date(2030, 1, 1), date(2030, 1, 5))
+        updated = helper.update_booking(
+            created.booking_id, created.replace(bookingdates=later), model=True
+        )
+        assert updated.bookingdates.nights == 4
+    finally:
+        helper.delete_booking(created.booking_id)
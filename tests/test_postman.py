@@ -0,0 +1,125 @@
+# tests/test_postman.py
+import json
+import logging
+import os
+
+from src.api_client import APIClient
+from src.local_server import LocalBookerServer
+from src.postman.cli import DEFAULT_COLLECTION, DEFAULT_ENVIRONMENT, main
+from src.postman.collection import (
+    Capture,
+    load_collection,
+    load_environment,
+    parse_captures,
+    resolve,
+)
+from src.postman.runner import CollectionRunner, folder_dependencies
+
+# The shipped collection has placeholder bodies and booking ids; this copy
+# fills them with {{variables}} and captures bookingId, so it runs clean
+BOOKING_FLOW = os.path.join(
+    os.path.dirname(__file__), "data", "booking_flow.postman_collection.json"
+)
+
+
+def test_parse_captures_follows_response_aliases():
+    captures = parse_captures(
+        [
+            "let body = pm.response.json();",
+            'pm.environment.set("authToken", body.token);',
+            "pm.collectionVariables.set('bookingId', pm.response.json().bookingid)",
+            'pm.environment.set("ignored", someOtherValue);',
+        ]
+    )
+    assert captures == [
+        Capture("authToken", ("token",)),
+        Capture("bookingId", ("bookingid",)),
+    ]
+
+
+def test_resolve_leaves_unknown_variables():
+    assert resolve("{{url}}/booking/{{id}}", {"url": "http://x"}) == (
+        "http://x/booking/{{id}}"
+    )
+
+
+def test_booking_folder_waits_for_auth():
+    collection = load_collection(DEFAULT_COLLECTION)
+    assert [folder.name for folder in collection.folders] == [
+        "Auth",
+        "Ping",
+        "Booking",
+    ]
+    dependencies = folder_dependencies(collection)
+    assert dependencies == {"Auth": set(), "Ping": set(), "Booking": {"Auth"}}
+
+
+def test_shipped_collection_runs_as_is():
+    collection = load_collection(DEFAULT_COLLECTION)
+    environment = load_environment(DEFAULT_ENVIRONMENT)
+    with LocalBookerServer() as server:
+        environment["url"] = server.base_url
+        with APIClient(base_url=server.base_url) as client:
+            report = CollectionRunner(collection, client, environment=environment).run()
+    outcomes = {r.id: (r.status_code, r.passed) for r in report.results}
+    assert outcomes["Auth/Token[1]"] == (200, True)
+    assert outcomes["Booking/GetBookingIds[1]"] == (200, True)
+    # Its placeholder body ("totalprice": "price") is rejected, as upstream
+    assert outcomes["Booking/CreateBooking[1]"] == (500, False)
+    # Only Auth has a test script; it is flagged instead of counted as passed
+    assert [r.id for r in report.not_evaluated] == ["Auth/Token[1]"]
+    assert report.as_dict()["results"][0]["tests"] == "not evaluated"
+
+
+def test_collection_runs_clean_over_parallel_iterations():
+    collection = load_collection(BOOKING_FLOW)
+    environment = load_environment(DEFAULT_ENVIRONMENT)
+    with LocalBookerServer() as server:
+        environment["url"] = server.base_url
+        with APIClient(base_url=server.base_url, pool_maxsize=8) as client:
+            report = CollectionRunner(
+                collection, client, environment=environment, iterations=3
+            ).run()
+        assert server.store.filter_ids({}) == []  # Each iteration deleted its own
+    assert not report.failed, [r.as_dict() for r in report.failed]
+    requests_per_iteration = sum(len(f.requests) for f in collection.folders)
+    assert len(report.results) == 3 * requests_per_iteration
+    assert [r.iteration for r in report.results] == sorted(
+        r.iteration for r in report.results
+    )
+
+
+def test_data_file_rows_feed_their_iteration(tmp_path, capsys):
+    data = tmp_path / "bookings.json"
+    data.write_text(
+        json.dumps(
+            [
+                {"firstname": "Ada", "totalprice": 120},
+                {"firstname": "Grace", "totalprice": 340},
+            ]
+        )
+    )
+    output = tmp_path / "results.json"
+    html = tmp_path / "report.html"
+    src_level = logging.getLogger("src").level
+    exit_code = main(
+        [
+            "--collection",
+            BOOKING_FLOW,
+            "--local-server",
+            "--data",
+            str(data),
+            "--output",
+            str(output),
+            "--html",
+            str(html),
+        ]
+    )
+    assert exit_code == 0
+    results = json.loads(output.read_text())
+    assert results["schema"] == "postman-run/1"
+    assert results["iterations"] == 2
+    assert results["failed"] == 0
+    assert "Request latency by endpoint" in html.read_text()
+    assert "0 failed" in capsys.readouterr().out
+    assert logging.getLogger("src").level == src_level  # main() leaves logging alone
@@ -0,0 +1,105 @@
+# tests/test_response_cache.py
+import pytest
+
+from src.api_client import APIClient
+from src.helpers.auth import TokenManager
+from src.helpers.booking import BookingHelper
+from src.response_cache import ResponseCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeResponse:
+    def __init__(self, headers=None):
+        self.headers = headers or {}
+
+
+def test_cache_evicts_least_recently_used_and_expires():
+    """Entries are bounded by count (LRU) and by TTL."""
+    clock = FakeClock()
+    cache = ResponseCache(max_entries=2, ttl=10, clock=clock)
+    a, b, c = (ResponseCache.make_key(f"http://x/{n}") for n in "abc")
+    cache.store(a, FakeResponse())
+    cache.store(b, FakeResponse())
+    assert cache.lookup(a)[1]  # Touch a: b is now least recently used
+    cache.store(c, FakeResponse())
+    assert cache.lookup(b) == (None, False)
+    assert cache.stats.evictions == 1
+
+    clock.now = 11  # Past the TTL; no validators, so the entry is dropped
+    assert cache.lookup(a) == (None, False)
+    assert len(cache) == 1
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+
+def test_cache_key_ignores_param_order_and_invalidate_drops_all_params():
+    cache = ResponseCache()
+    url = "http://x/booking"
+    cache.store(cache.make_key(url, {"a": 1, "b": 2}), FakeResponse())
+    cache.store(cache.make_key(url), FakeResponse())
+    assert cache.lookup(cache.make_key(url, {"b": 2, "a": 1}))[1]
+    cache.invalidate(url)
+    assert len(cache) == 0 and cache.stats.invalidations == 2
+
+
+def test_no_store_responses_are_not_cached():
+    cache = ResponseCache()
+    cache.store(cache.make_key("http://x"), FakeResponse({"Cache-Control": "no-store"}))
+    assert len(cache) == 0
+
+
+@pytest.fixture
+def cached_helper(base_url, sample_booking_data):
+    """BookingHelper on its own caching client, plus the cache and a booking."""
+    cache = ResponseCache(ttl=60)
+    with APIClient(base_url=base_url, cache=cache) as client:
+        helper = BookingHelper(client, token_manager=TokenManager(client))
+        booking_id = helper.create_booking(sample_booking_data).json()["bookingid"]
+        yield helper, cache, booking_id
+        try:
+            helper.delete_booking(booking_id)
+        except Exception:
+            pass  # The test may already have deleted it
+
+
+@pytest.mark.live  # Its own client bypasses the cassette
+def test_repeated_get_booking_is_served_from_cache(cached_helper):
+    helper, cache, booking_id = cached_helper
+    first = helper.get_booking(booking_id)
+    again = helper.get_booking(booking_id)
+    assert again is first
+    assert cache.stats.hits == 1 and cache.stats.misses == 1
+
+
+@pytest.mark.live  # Its own client bypasses the cassette
+def test_writes_invalidate_booking_and_listing(cached_helper):
+    helper, cache, booking_id = cached_helper
+    helper.get_booking_ids()
+    helper.get_booking(booking_id)
+    helper.partial_update_booking(booking_id, {"firstname": "Changed"})
+
+    assert helper.get_booking(booking_id).json()["firstname"] == "Changed"
+    ids = helper.get_booking_ids().json()
+    assert cache.stats.hits == 0  # Both reads after the write went to the server
+    assert {"bookingid": booking_id} in ids
+
+
+@pytest.mark.live  # Its own client bypasses the cassette
+def test_stale_entry_is_revalidated_with_etag(cached_helper):
+    """After the TTL, an entry with an ETag is renewed by a 304, not refetched."""
+    helper, cache, booking_id = cached_helper
+    first = helper.get_booking(booking_id)
+    if "ETag" not in first.headers:
+        pytest.skip("Target API does not send ETags")
+    cache.ttl = 0  # Everything stored from now on is immediately stale
+    cache.clear()
+    first = helper.get_booking(booking_id)
+    again = helper.get_booking(booking_id)
+    assert again is first
+    assert cache.stats.revalidated == 1